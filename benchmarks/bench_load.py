@@ -0,0 +1,399 @@
+"""
+Load Test Benchmark Module.
+
+Boots the FastAPI ``app`` in-process, fully offline: every LLM agent answers
+through a fake model with configurable latency and output length, and the MCP
+toolsets talk to the stub MCP server (``stores/mcp/stub_server.py``). Each
+simulated session creates a session, runs a few chat turns (each followed by a
+chat-history read) and lists the user's sessions; sessions run at a configurable
+concurrency. Prints latency percentiles, throughput and error rates per endpoint
+as JSON, to compare runs.
+
+The root agent's fake model first delegates the question to one of its agent
+tools (``--delegate``, YouTubeTranscriptAgent by default, which fetches the
+transcript of the URL in the question through the stub MCP server), then answers
+once the tool returns. Response caches are disabled so every turn does the work.
+
+Run from the project root:
+    python benchmarks/bench_load.py --sessions 40 --concurrency 8 --turns 3 --llm-latency 0.2
+"""
+
+import os
+import sys
+import json
+import logging
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from collections import defaultdict
+from typing import Any, AsyncGenerator, Iterator, Optional
+
+import httpx
+import numpy as np
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+sys.path.insert(0, ROOT_DIR)
+
+# Placeholders for the credentials the settings require; nothing is called with them.
+_PLACEHOLDER_ENV = (
+    "GH_PAT",
+    "WSL_PASS",
+    "GOOGLE_API_KEY",
+    "OBSIDIAN_API_KEY",
+    "OBSIDIAN_HOST",
+)
+
+
+class FakeLlm(BaseLlm):
+    """
+    A deterministic stand-in for the real models.
+
+    Attributes:
+        latency (float): Seconds spent per call.
+        jitter (float): Maximum random deviation from ``latency``, in seconds.
+        output_tokens (int): Number of words in a text answer.
+        delegate (Optional[str]): Agent tool to call with the user's request
+            before answering (root agent only).
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    output_tokens: int = 64
+    delegate: Optional[str] = None
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        await asyncio.sleep(max(0.0, delay))
+
+        contents = llm_request.contents or []
+        prompt_tokens = sum(
+            len((part.text or "").split())
+            for content in contents
+            for part in content.parts or []
+        )
+        usage = types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=prompt_tokens, candidates_token_count=self.output_tokens
+        )
+        last = contents[-1] if contents else None
+        answered = last is not None and any(
+            part.function_response for part in last.parts or []
+        )
+        if self.delegate in llm_request.tools_dict and not answered:
+            request = " ".join(
+                part.text for part in (last.parts if last else []) if part.text
+            )
+            call = types.FunctionCall(name=self.delegate, args={"request": request})
+            yield LlmResponse(
+                content=types.Content(
+                    role="model", parts=[types.Part(function_call=call)]
+                ),
+                usage_metadata=usage,
+            )
+            return
+        text = " ".join(f"token{index}" for index in range(self.output_tokens))
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            usage_metadata=usage,
+        )
+
+
+def _agents(agent: BaseAgent) -> Iterator[BaseAgent]:
+    """Yield an agent and every agent below it, through sub-agents and agent tools."""
+
+    yield agent
+    for sub_agent in agent.sub_agents:
+        yield from _agents(sub_agent)
+    for tool in getattr(agent, "tools", []):
+        if isinstance(tool, AgentTool):
+            yield from _agents(tool.agent)
+
+
+def _offline_env(args: argparse.Namespace, work_dir: str) -> dict[str, str]:
+    """Settings overrides that keep the run offline, isolated and uncached."""
+
+    return {
+        "SQLITE_DB_PATH": os.path.join(work_dir, "sessions.db"),
+        "MEMORY_DB_PATH": os.path.join(work_dir, "memory.db"),
+        "PATH_DATA_ROOT": work_dir,
+        "MCP_USE_STUB_SERVER": "true",
+        "MCP_STUB_LATENCY": str(args.mcp_latency),
+        "OBSIDIAN_BACKEND": "mcp",
+        "LLM_CACHE_ENABLED": "false",
+        "SEMANTIC_CACHE_ENABLED": "false",
+        "TRANSCRIPT_CACHE_ENABLED": "false",
+        "ROUTER_CLASSIFIER_ENABLED": "false",
+        "VECTOR_INDEX_ENABLED": "false",
+        "SETTINGS_HOT_RELOAD": "false",
+        "TRACING_ENABLED": str(args.tracing).lower(),
+    }
+
+
+def _install_fake_models(root_agent: BaseAgent, args: argparse.Namespace):
+    """Give every LLM agent a fake model; the root one delegates to ``--delegate``."""
+
+    tool_names = {tool.name for tool in getattr(root_agent, "tools", [])}
+    if args.delegate != "none" and args.delegate not in tool_names:
+        sys.exit(
+            f"Unknown agent tool {args.delegate!r}; choose one of {sorted(tool_names)}."
+        )
+    for agent in _agents(root_agent):
+        if isinstance(agent, LlmAgent):
+            agent.model = FakeLlm(
+                model=f"fake-{agent.name}",
+                latency=args.llm_latency,
+                jitter=args.llm_jitter,
+                output_tokens=args.output_tokens,
+                delegate=(
+                    args.delegate
+                    if agent is root_agent and args.delegate != "none"
+                    else None
+                ),
+            )
+
+
+class _Recorder:
+    """Collects the latency and outcome of every request, per endpoint."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.enabled = True
+
+    async def request(
+        self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, **kwargs
+    ) -> Optional[dict[str, Any]]:
+        """Send a request, record it, and return its JSON body when it succeeded."""
+
+        start = time.perf_counter()
+        body, error = None, None
+        try:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code < 400:
+                body = response.json()
+            else:
+                error = str(response.status_code)
+        except Exception as exc:  # pylint: disable=[W0718]
+            error = type(exc).__name__
+        if self.enabled:
+            self.latencies[endpoint].append(time.perf_counter() - start)
+            if error is not None:
+                self.errors[endpoint][error] += 1
+        return body
+
+    def report(self, duration: float) -> dict[str, Any]:
+        """Summarize the recorded requests."""
+
+        def summary(latencies: list[float], errors: dict[str, int]) -> dict[str, Any]:
+            count, failed = len(latencies), sum(errors.values())
+            values = np.array(latencies) * 1000
+            return {
+                "requests": count,
+                "errors": failed,
+                "error_rate": round(failed / count, 4) if count else 0.0,
+                "errors_by_kind": dict(errors),
+                "throughput_rps": round(count / duration, 2) if duration else 0.0,
+                "latency_ms": (
+                    {
+                        "p50": round(float(np.percentile(values, 50)), 2),
+                        "p95": round(float(np.percentile(values, 95)), 2),
+                        "p99": round(float(np.percentile(values, 99)), 2),
+                        "mean": round(float(values.mean()), 2),
+                        "max": round(float(values.max()), 2),
+                    }
+                    if count
+                    else {}
+                ),
+            }
+
+        all_errors: dict[str, int] = defaultdict(int)
+        for errors in self.errors.values():
+            for kind, count in errors.items():
+                all_errors[kind] += count
+        return {
+            "duration_s": round(duration, 3),
+            "total": summary(
+                [x for values in self.latencies.values() for x in values], all_errors
+            ),
+            "endpoints": {
+                endpoint: summary(latencies, self.errors.get(endpoint, {}))
+                for endpoint, latencies in sorted(self.latencies.items())
+            },
+        }
+
+
+async def _session_flow(
+    client: httpx.AsyncClient, recorder: _Recorder, user_id: str, turns: int, index: int
+):
+    """Create a session, chat in it, read its history and list the user's sessions."""
+
+    created = await recorder.request(
+        client, "create_session", "POST", f"/api/v1/data/create_session/{user_id}"
+    )
+    if created is None:
+        return
+    session_id = created["session_id"]
+    for turn in range(turns):
+        query = f"Take notes of https://www.youtube.com/watch?v=bench{index:04d}{turn:02d} please"
+        await recorder.request(
+            client,
+            "chat",
+            "POST",
+            f"/api/v1/nlp/chat/{session_id}/{user_id}",
+            params={"query": query},
+        )
+        await recorder.request(
+            client,
+            "chat_history",
+            "GET",
+            f"/api/v1/nlp/chat_history/{session_id}/{user_id}",
+        )
+    await recorder.request(
+        client,
+        "list_sessions",
+        "GET",
+        f"/api/v1/data/list_sessions/{user_id}",
+        params={"include_title": "true"},
+    )
+
+
+async def _run(app, args: argparse.Namespace) -> dict[str, Any]:
+    """Run the warm-up and the measured sessions against the app."""
+
+    recorder = _Recorder()
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=args.timeout
+        ) as client,
+    ):
+        recorder.enabled = False
+        for index in range(args.warmup):
+            await _session_flow(client, recorder, "bench-warmup", 1, index)
+        recorder.enabled = True
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(args.sessions):
+            queue.put_nowait(index)
+
+        async def worker():
+            while not queue.empty():
+                index = queue.get_nowait()
+                await _session_flow(
+                    client,
+                    recorder,
+                    f"bench-user-{index % args.users}",
+                    args.turns,
+                    index,
+                )
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        duration = time.perf_counter() - start
+    return recorder.report(duration)
+
+
+def main():
+    """Entry Point for the Program."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=20, help="Measured sessions.")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Sessions run at once."
+    )
+    parser.add_argument("--turns", type=int, default=2, help="Chat turns per session.")
+    parser.add_argument(
+        "--users", type=int, default=4, help="Distinct users owning the sessions."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Unmeasured sessions run first."
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.1, help="Seconds per model call."
+    )
+    parser.add_argument(
+        "--llm-jitter", type=float, default=0.0, help="Max deviation, in seconds."
+    )
+    parser.add_argument(
+        "--output-tokens", type=int, default=64, help="Words per model answer."
+    )
+    parser.add_argument(
+        "--mcp-latency", type=float, default=0.0, help="Seconds per MCP tool call."
+    )
+    parser.add_argument(
+        "--delegate",
+        default="YouTubeTranscriptAgent",
+        help="Agent tool the root model calls first, or `none`.",
+    )
+    parser.add_argument(
+        "--tracing", action="store_true", help="Keep span tracing enabled."
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=120.0, help="Request timeout, in seconds."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the latency jitter."
+    )
+    parser.add_argument(
+        "--output", default=None, help="Also write the JSON report to this file."
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Keep the application's info logs."
+    )
+    args = parser.parse_args()
+    random.seed(args.seed)
+    if not args.verbose:
+        # The application logs to stdout, where the report goes.
+        logging.disable(logging.INFO)
+
+    os.chdir(ROOT_DIR)  # the settings are read from config/config.yaml
+    with tempfile.TemporaryDirectory(prefix="bench_load_") as work_dir:
+        os.environ.update(_offline_env(args, work_dir))
+        for name in _PLACEHOLDER_ENV:
+            os.environ.setdefault(name, "offline")
+
+        # The settings are cached on first use: import the app only now.
+        from core.obsidian_mate.agent import root_agent  # pylint: disable=[C0415]
+        from main import app  # pylint: disable=[C0415]
+
+        _install_fake_models(root_agent, args)
+        report = asyncio.run(_run(app, args))
+
+    report = {
+        "config": {
+            key: getattr(args, key)
+            for key in (
+                "sessions",
+                "concurrency",
+                "turns",
+                "users",
+                "llm_latency",
+                "llm_jitter",
+                "output_tokens",
+                "mcp_latency",
+                "delegate",
+                "tracing",
+            )
+        },
+        **report,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Settings Benchmark Module.
+
+Measures the per-request overhead of resolving the application settings, before
+(a fresh ``Settings()`` parse per call) and after (the cached ``get_settings()``).
+A ``/chat`` request resolves the settings twice (one per controller).
+
+Run from the project root:
+    python benchmarks/bench_settings.py --requests 200
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from utils.config_utils import get_settings, load_settings  # pylint: disable=[C0413]
+
+CALLS_PER_REQUEST = 2
+
+
+def _time_per_request(resolve, requests: int) -> float:
+    """Return the mean wall time (ms) spent resolving settings per request."""
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        for _ in range(CALLS_PER_REQUEST):
+            resolve()
+    return (time.perf_counter() - start) * 1000 / requests
+
+
+def main():
+    """Entry Point for the Program."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    get_settings()  # warm the cache
+    before = _time_per_request(load_settings, args.requests)
+    after = _time_per_request(get_settings, args.requests)
+
+    print(f"requests           : {args.requests}")
+    print(f"before (ms/request): {before:.4f}")
+    print(f"after  (ms/request): {after:.4f}")
+    print(f"speed-up           : {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,45 @@ Main script for the application.
 """
 
 import os
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from google.adk.sessions.database_session_service import DatabaseSessionService
 from google.adk.memory import InMemoryMemoryService
 from google.adk.runners import Runner
+from google.adk.tools.mcp_tool import McpToolset
 
 from core.obsidian_mate.agent import root_agent
-from routes import base, data, nlp
-from utils.config_utils import get_settings
+from core.obsidian_mate.sub_agents.summary_agent import text_summary_agent
+from core.summarization import ContextCompactionPlugin, MapReduceSummarizer
+from core.tools.conversation_extraction_tool import extract_conversation
+from core.tools.obsidian_interaction_tool import obsidian_tool, obsidian_write_buffer
+from core.tools.youtube_transcript_tool import transcript_tool
+from stores.mcp import MCPConnectionManager
+from stores.memory import SqliteMemoryService
+from stores.session import SessionStore, TracedDatabaseSessionService
+from stores.vault import get_vault_index, get_vector_index
+from stores.youtube import get_transcript_cache
+from routes import base, data, metrics, nlp, vault
+from utils.config_utils import get_settings, SettingsWatcher
 from utils.logging_utils import setup_logger
+from utils.tracing_utils import TracingMiddleware, setup_tracing
+
+
+async def _refresh_vault_index(index, interval: float, logger):
+    """
+    Refresh a vault index now, then incrementally every ``interval`` seconds.
+
+    A failed refresh (unreadable note, full disk, ...) is logged and retried on the
+    next tick instead of stopping the refreshes.
+    """
+
+    while True:
+        try:
+            await asyncio.to_thread(index.refresh)
+        except Exception:  # pylint: disable=[W0718]
+            logger.exception("Refreshing the %s failed.", type(index).__name__)
+        await asyncio.sleep(interval)
 
 
 @asynccontextmanager
@@ -24,29 +52,99 @@ async def lifespan(app: FastAPI):  # pylint: disable=[W0621]
     settings = get_settings()
     logger = setup_logger(
         log_file=__file__,
-        log_dir=get_settings().PATH_LOGS,
+        log_dir=settings.PATH_LOGS,
         log_to_console=True,
         file_mode="a",
     )
     logger.info("Application is starting up...")
 
     app.state.settings = settings
+    tracer_provider = setup_tracing(settings)
     os.environ["GOOGLE_API_KEY"] = app.state.settings.GOOGLE_API_KEY.get_secret_value()
     app.state.db_url = f"sqlite+aiosqlite:///{app.state.settings.SQLITE_DB_PATH}"
-    app.state.session_service = DatabaseSessionService(db_url=app.state.db_url)
-    app.state.memory_service = InMemoryMemoryService()
+    app.state.session_service = TracedDatabaseSessionService(db_url=app.state.db_url)
+    app.state.session_store = SessionStore(app.state.session_service)
+    if settings.MEMORY_BACKEND == "sqlite":
+        app.state.memory_service = SqliteMemoryService(
+            db_path=settings.MEMORY_DB_PATH
+            or os.path.join(settings.PATH_DATA_ROOT, "memory.db"),
+            search_limit=settings.MEMORY_SEARCH_LIMIT,
+        )
+    else:
+        app.state.memory_service = InMemoryMemoryService()
+    extract_conversation.session_service = app.state.session_service
+    app.state.summarizer = MapReduceSummarizer(
+        model=text_summary_agent.canonical_model,
+        chunk_token_budget=settings.SUMMARY_CHUNK_TOKENS,
+        max_concurrency=settings.SUMMARY_MAX_CONCURRENCY,
+        max_retries=settings.SUMMARY_MAX_RETRIES,
+    )
+    plugins = []
+    if settings.CONTEXT_COMPACTION_ENABLED:
+        plugins.append(
+            ContextCompactionPlugin(
+                summarizer=app.state.summarizer, config=settings.CONTEXT_COMPACTION
+            )
+        )
     app.state.runner = Runner(
         agent=root_agent,
         app_name=settings.APP_NAME,
         session_service=app.state.session_service,
         memory_service=app.state.memory_service,
+        plugins=plugins,
     )
     logger.info("Database Connection Stablished")
 
+    app.state.mcp_manager = None
+    if settings.MCP_POOL_ENABLED:
+        app.state.mcp_manager = MCPConnectionManager(
+            pool_size=settings.MCP_POOL_SIZE,
+            health_check_interval=settings.MCP_HEALTH_CHECK_INTERVAL,
+        )
+        if isinstance(obsidian_tool, McpToolset):
+            app.state.mcp_manager.register("obsidian", obsidian_tool)
+        app.state.mcp_manager.register("youtube_transcript", transcript_tool)
+        await app.state.mcp_manager.start()
+
+    app.state.vault_index = await asyncio.to_thread(get_vault_index)
+    app.state.vector_index = await asyncio.to_thread(get_vector_index)
+    vault_refresh_tasks = [
+        asyncio.create_task(
+            _refresh_vault_index(index, settings.VAULT_INDEX_REFRESH_INTERVAL, logger)
+        )
+        for index in (app.state.vault_index, app.state.vector_index)
+        if index is not None
+    ]
+
+    settings_watcher = None
+    if settings.SETTINGS_HOT_RELOAD:
+        settings_watcher = SettingsWatcher(
+            interval=settings.SETTINGS_RELOAD_INTERVAL,
+            on_reload=lambda new_settings: setattr(app.state, "settings", new_settings),
+        )
+        settings_watcher.start()
+        logger.info("Watching configuration files for changes.")
+
     yield  # The application runs here
 
     # Shutdown
     logger.info("Application is shutting down...")
+    if obsidian_write_buffer is not None:
+        for error in await obsidian_write_buffer.flush_all():
+            logger.error("Pending note write lost on shutdown: %s", error)
+    transcript_cache = get_transcript_cache()
+    if transcript_cache is not None:
+        await asyncio.to_thread(transcript_cache.flush)
+    if app.state.mcp_manager is not None:
+        await app.state.mcp_manager.close()
+    for task in vault_refresh_tasks:
+        task.cancel()
+    if isinstance(app.state.memory_service, SqliteMemoryService):
+        app.state.memory_service.close()
+    if settings_watcher is not None:
+        settings_watcher.stop()
+    if tracer_provider is not None:
+        tracer_provider.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -62,10 +160,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(TracingMiddleware)
 
 app.include_router(base.base_router)
 app.include_router(data.data_router)
 app.include_router(nlp.nlp_router)
+app.include_router(vault.vault_router)
+app.include_router(metrics.metrics_router)
 
 
 def main():
@@ -4,6 +4,7 @@ import os
 import random
 import string
 from utils.config_utils import get_settings
+from utils.id_utils import generate_ulid
 
 
 class BaseController:
@@ -28,7 +29,7 @@ class BaseController:
         self.files_dir = os.path.join(self.base_dir, "assets", "files")
         self.db_dir = os.path.join(self.base_dir, "assets", "database")
 
-    async def generate_random_string(self, length: int = 12) -> str:
+    def generate_random_string(self, length: int = 12) -> str:
         """Generate a random alphanumeric string of given length.
 
         Args:
@@ -38,7 +39,7 @@ class BaseController:
             str: A random alphanumeric string.
 
         Raises:
-             ValueError: If ``k`` is negative.
+             ValueError: If ``length`` is not positive.
         """
 
         if length <= 0:
@@ -46,6 +47,16 @@ class BaseController:
 
         return "".join(random.choices(string.ascii_lowercase + string.digits, k=length))
 
+    def generate_session_id(self) -> str:
+        """Generate a time-ordered, collision-resistant session ID (ULID layout).
+
+        Returns:
+            str: A 26-character lowercase ID whose lexicographic order matches
+                creation order.
+        """
+
+        return generate_ulid()
+
     def get_database_path(self, db_name):
         """
         Get the file system path for a given database and ensure its directory exists.
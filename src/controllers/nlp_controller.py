@@ -3,11 +3,14 @@ NLP Controller Module.
 """
 
 import os
-from typing import Any
+from typing import Any, AsyncGenerator, Optional
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import Session
 from google.genai import types
 from controllers.base_controller import BaseController
+from core.summarization import MapReduceSummarizer
+from stores.llm.templates import TemplateParser
 from utils.logging_utils import setup_logger
 
 
@@ -32,6 +35,7 @@ class NLPController(BaseController):
 
         super().__init__()
         self.runner = runner
+        self.template_parser = TemplateParser()
         self.logger = setup_logger(
             log_file=__file__,
             log_dir=self.app_settings.PATH_LOGS,
@@ -79,6 +83,81 @@ class NLPController(BaseController):
         self.logger.info("Done answering the query")
         return answer
 
+    async def stream_query(
+        self,
+        session: Session,
+        query: str,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Stream a user query to the model and yield frames as events arrive.
+
+        The runner is driven in SSE streaming mode so partial model tokens are
+        forwarded as soon as they are produced, together with the intermediate
+        tool calls and tool results of the root agent and its sub-agents.
+
+        Args:
+            session (Session): The session object containing user and session IDs.
+            query (str): The user's query text.
+
+        Yields:
+            dict[str, Any]: A frame with a ``type`` key, one of:
+                - ``token``: a partial text chunk (``author``, ``text``).
+                - ``message``: a complete, non-partial text (``author``, ``text``).
+                - ``tool_call``: a tool invocation (``author``, ``name``, ``args``).
+                - ``tool_result``: a tool response (``author``, ``name``, ``response``).
+                - ``error``: the run failed (``error``).
+                - ``done``: always the last frame, carrying the full ``answer``.
+        """
+
+        if len(query) == 0:
+            self.logger.warning("Can't get answer for an empty query!")
+            yield {"type": "done", "answer": ""}
+            return
+
+        self.logger.info("Streaming the answer of the query...")
+        query_content = types.Content(role="user", parts=[types.Part(text=query)])
+        run_config = RunConfig(streaming_mode=StreamingMode.SSE)
+
+        answer = ""
+        try:
+            async for event in self.runner.run_async(
+                user_id=session.user_id,
+                session_id=session.id,
+                new_message=query_content,
+                run_config=run_config,
+            ):
+                for function_call in event.get_function_calls():
+                    yield {
+                        "type": "tool_call",
+                        "author": event.author,
+                        "name": function_call.name,
+                        "args": function_call.args,
+                    }
+                for function_response in event.get_function_responses():
+                    yield {
+                        "type": "tool_result",
+                        "author": event.author,
+                        "name": function_response.name,
+                        "response": function_response.response,
+                    }
+
+                if not (event.content and event.content.parts):
+                    continue
+                text = event.content.parts[0].text
+                if not text or text == "None":
+                    continue
+                if event.partial:
+                    yield {"type": "token", "author": event.author, "text": text}
+                else:
+                    answer = text
+                    yield {"type": "message", "author": event.author, "text": text}
+        except Exception as e:  # pylint: disable=[W0718]
+            self.logger.error("Streaming the answer failed: %s", e)
+            yield {"type": "error", "error": str(e)}
+
+        self.logger.info("Done streaming the answer of the query")
+        yield {"type": "done", "answer": answer}
+
     async def get_conversation(self, session: Session) -> list[dict[str, Any]]:
         """
         Retrieve the conversation history from a session.
@@ -102,6 +181,34 @@ class NLPController(BaseController):
 
         return chat_history
 
+    async def summarize_conversation(
+        self, session: Session, summarizer: MapReduceSummarizer
+    ) -> Optional[dict[str, Any]]:
+        """
+        Summarize the conversation of a session with map-reduce summarization.
+
+        Args:
+            session (Session): The session whose conversation is summarized.
+            summarizer (MapReduceSummarizer): The summarization engine.
+
+        Returns:
+            Optional[dict[str, Any]]: ``{"summary": str, "stages": [...]}`` with
+                the token counts of each stage, or None if there is no history.
+
+        Raises:
+            SummarizationError: If the summarization fails after its retries.
+        """
+
+        chat_history = await self.get_conversation(session)
+        if not chat_history:
+            self.logger.warning("Can't summarize an empty conversation!")
+            return None
+
+        self.logger.info("Summarizing %s messages...", len(chat_history))
+        summary = await summarizer.summarize(chat_history)
+        self.logger.info("Done summarizing. Stages: %s", summary["stages"])
+        return summary
+
 
 def main():
     """
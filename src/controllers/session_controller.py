@@ -1,21 +1,33 @@
 """Session Controller Module."""
 
 import os
-from typing import Optional
+from typing import Any, Literal, Optional
 from google.adk.sessions import Session, BaseSessionService
 from google.adk.errors.already_exists_error import AlreadyExistsError
 from controllers.base_controller import BaseController
+from stores.session import SessionStore
 from utils.logging_utils import setup_logger
 
 
 class SessionController(BaseController):
     """Controller for managing sessions."""
 
-    def __init__(self, session_service: BaseSessionService):
-        """Initialize the SessionController."""
+    def __init__(
+        self,
+        session_service: BaseSessionService,
+        session_store: Optional[SessionStore] = None,
+    ):
+        """Initialize the SessionController.
+
+        Args:
+            session_service (BaseSessionService): The ADK session service.
+            session_store (Optional[SessionStore]): Shared storage-layer queries used
+                by the paths that must not hydrate whole sessions.
+        """
 
         super().__init__()
         self.session_service = session_service
+        self.session_store = session_store
         self.logger = setup_logger(
             log_file=__file__,
             log_dir=self.app_settings.PATH_LOGS,
@@ -128,6 +140,57 @@ class SessionController(BaseController):
             )
         return session
 
+    async def get_chat_history(
+        self,
+        app_name: Optional[str],
+        user_id: str,
+        session_id: str,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Retrieve a page of a session's chat history straight from the storage layer.
+
+        Args:
+            app_name (Optional[str]): Name of the application. If ``None``, the
+                default application name from settings is used.
+            user_id (str): Unique identifier of the user.
+            session_id (str): Unique identifier of the session.
+            limit (Optional[int]): Maximum number of messages to return.
+            before (Optional[str]): Event id cursor; return messages older than it.
+            after (Optional[str]): Event id cursor; return messages newer than it.
+
+        Returns:
+            Optional[dict[str, Any]]: ``{"events": [...], "has_more": bool}``, or
+                None if the session does not exist.
+
+        Raises:
+            ValueError: If a cursor does not belong to the session.
+        """
+
+        app_name = self.app_settings.APP_NAME if app_name is None else app_name
+        if self.session_store is None:
+            raise RuntimeError("A SessionStore is required to page chat history.")
+
+        self.logger.info("Attempting to retrieve the chat history of a session.")
+        if not await self.session_store.session_exists(
+            app_name=app_name, user_id=user_id, session_id=session_id
+        ):
+            self.logger.warning(
+                "No Session found with session_id=%s, user_id=%s", session_id, user_id
+            )
+            return None
+
+        return await self.session_store.list_text_events(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            limit=limit,
+            before=before,
+            after=after,
+        )
+
     async def list_sessions(
         self, app_name: Optional[str], user_id: str
     ) -> list[Session]:
@@ -155,22 +218,83 @@ class SessionController(BaseController):
             self.logger.info("Found %s sessions for user_id=%s", len(sessions), user_id)
         return sessions
 
+    async def list_session_summaries(
+        self,
+        app_name: Optional[str],
+        user_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order: Literal["asc", "desc"] = "desc",
+        include_title: bool = False,
+    ) -> dict[str, Any]:
+        """List a user's sessions as metadata only (no events or state).
+
+        Args:
+            app_name (Optional[str]): Name of the application. If ``None``, the
+                default application name from settings is used.
+            user_id (str): Unique identifier of the user.
+            limit (Optional[int]): Maximum number of sessions to return.
+            offset (int): Number of sessions to skip.
+            order (Literal["asc", "desc"]): Sort order of the last update time.
+            include_title (bool): Whether to include a title snippet per session.
+
+        Returns:
+            dict[str, Any]: ``{"total": int, "sessions": [...]}`` as returned by
+                ``SessionStore.list_session_summaries``.
+        """
+
+        app_name = self.app_settings.APP_NAME if app_name is None else app_name
+        if self.session_store is None:
+            raise RuntimeError("A SessionStore is required to list session metadata.")
+
+        self.logger.info("Attempting to list session metadata for user_id=%s", user_id)
+        summaries = await self.session_store.list_session_summaries(
+            app_name=app_name,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            order=order,
+            include_title=include_title,
+        )
+        self.logger.info(
+            "Found %s sessions for user_id=%s", summaries["total"], user_id
+        )
+        return summaries
+
     async def delete_sessions(
         self, app_name: Optional[str], user_id: str
     ) -> tuple[bool, int]:
         """
         Delete all sessions for a given user.
 
+        With a ``SessionStore``, the sessions and their events are deleted in one
+        transaction without loading any events; otherwise each session is deleted
+        through the session service.
+
         Args:
             app_name (str): Name of the application.
             user_id (str): Unique identifier of the user whose sessions are to be deleted.
 
         Returns:
-            bool: True if sessions were successfully deleted, False otherwise.
+            tuple[bool, int]: True if sessions were successfully deleted, False
+                otherwise, and the number of deleted sessions.
         """
         app_name = self.app_settings.APP_NAME if app_name is None else app_name
 
         self.logger.warning("Attempting to delete all sessions for user_id=%s", user_id)
+        if self.session_store is not None:
+            deleted = await self.session_store.delete_user_sessions(
+                app_name=app_name, user_id=user_id
+            )
+            if deleted == 0:
+                self.logger.info(
+                    "No sessions found for user_id=%s. Cannot delete.",
+                    user_id,
+                )
+                return False, 0
+            self.logger.info("All sessions for user_id=%s has beed deleted.", user_id)
+            return True, deleted
+
         sessions = await self.list_sessions(
             app_name=app_name,
             user_id=user_id,
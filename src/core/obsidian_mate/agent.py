@@ -10,20 +10,48 @@ from utils.config_utils import get_settings
 from models.enums import AgentNameEnum
 from stores.llm.templates import TemplateParser
 from core.obsidian_mate.sub_agents.chat_agent import chat_agent
-from core.obsidian_mate.sub_agents.obsidian_interaction_agent import obsidian_interaction_agent
-from core.obsidian_mate.sub_agents.excalidraw_interaction_agent import excalidraw_interaction_agent
+from core.obsidian_mate.sub_agents.obsidian_interaction_agent import (
+    obsidian_interaction_agent,
+)
+from core.obsidian_mate.sub_agents.excalidraw_interaction_agent import (
+    excalidraw_interaction_agent,
+)
 from core.obsidian_mate.sub_agents.smart_notes_agent import smart_notes_pipeline
 from core.obsidian_mate.sub_agents.summary_agent import text_summary_agent
 from core.obsidian_mate.sub_agents.transcript_agent import yt_transcript_agent
 from core.tools.youtube_transcript_tool import transcript_tool
+from core.tools.vault_search_tool import vault_search_tool
+from core.tools.conversation_extraction_tool import record_root_session_callback
+from core.tools.parallel_dispatch_tool import (
+    BoundedAgentTool,
+    ConcurrencyLimit,
+    ParallelDispatchTool,
+)
+from core.routing import IntentClassifier, PreRouter
 
 
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+    instrument_before_tool_callback,
+    instrument_after_tool_callback,
+    instrument_on_tool_error_callback,
+)
+from utils.agent_utils import (
+    llm_cache_before_model_callback,
+    llm_cache_after_model_callback,
+    llm_cache_on_model_error_callback,
+)
+
 app_settings = get_settings()
 template_parser = TemplateParser()
 logger = setup_logger(
-    log_file = __file__,
-    log_dir = app_settings.PATH_LOGS,
+    log_file=__file__,
+    log_dir=app_settings.PATH_LOGS,
 )
 
 retry_config = types.HttpRetryOptions(
@@ -33,27 +61,71 @@ retry_config = types.HttpRetryOptions(
     http_status_codes=app_settings.RETRY_HTTP_STATUS_CODE,
 )
 
+parallel_mode = app_settings.ORCHESTRATION_MODE == "parallel"
+if parallel_mode:
+    # Shared by every sub-agent tool: caps both the function calls of one model
+    # turn (run concurrently by ADK) and the tasks of `run_in_parallel`.
+    sub_agent_concurrency = ConcurrencyLimit(app_settings.PARALLEL_MAX_CONCURRENCY)
+
+    def make_agent_tool(agent):
+        return BoundedAgentTool(agent, sub_agent_concurrency)
+
+else:
+    make_agent_tool = agent_tool.AgentTool
+
+sub_agent_tools = [
+    make_agent_tool(chat_agent),
+    make_agent_tool(smart_notes_pipeline),
+    make_agent_tool(obsidian_interaction_agent),
+    make_agent_tool(yt_transcript_agent),
+    # make_agent_tool(excalidraw_interaction_agent),
+]
+
+pre_router = PreRouter(
+    classifier=IntentClassifier() if app_settings.ROUTER_CLASSIFIER_ENABLED else None,
+    min_confidence=app_settings.ROUTER_MIN_CONFIDENCE,
+    classifier_min_confidence=app_settings.ROUTER_CLASSIFIER_MIN_CONFIDENCE,
+    agent_names={tool.name for tool in sub_agent_tools},
+)
+before_model_callbacks = [
+    llm_cache_before_model_callback,
+    instrument_before_model_callback,
+]
+if app_settings.ROUTER_ENABLED:
+    before_model_callbacks.insert(0, pre_router.before_model_callback)
 
 obsidian_mate_agent = Agent(
     name=AgentNameEnum.OBSIDIAN_MATE_AGENT,
     # model=Gemini(model=app_settings.CHATT_MODEL_NAME, retry_options=retry_config),
     model=LiteLlm(app_settings.DEFAULT_MODEL_NAME),
     description="Helpfull obsidian support agent",
-    instruction=template_parser.get("root", "INSTRUCTIONS"),  # type: ignore
+    instruction=template_parser.get(
+        "root", "PARALLEL_INSTRUCTIONS" if parallel_mode else "INSTRUCTIONS"
+    ),  # type: ignore
     tools=[
-        agent_tool.AgentTool(chat_agent),
-        agent_tool.AgentTool(smart_notes_pipeline),
-        agent_tool.AgentTool(obsidian_interaction_agent),
-        agent_tool.AgentTool(yt_transcript_agent),
-        # agent_tool.AgentTool(excalidraw_interaction_agent),
+        *sub_agent_tools,
+        *([ParallelDispatchTool(sub_agent_tools)] if parallel_mode else []),
+        vault_search_tool,
     ],
-
-    before_agent_callback=logger.info("%s is starting...", AgentNameEnum.OBSIDIAN_MATE_AGENT),
-    after_agent_callback=logger.info("%s is Finishing...", AgentNameEnum.OBSIDIAN_MATE_AGENT),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
-    before_tool_callback=logger.info("Obsidiab Tool is about to be invoked..."),
-    after_tool_callback=logger.info("Obsidian Tool has been invoked."),
+    # Records the session whose conversation `extract_conversation` reads from the
+    # smart notes pipeline (run under an AgentTool, in a throwaway session).
+    before_agent_callback=[
+        record_root_session_callback,
+        instrument_before_agent_callback,
+    ],
+    after_agent_callback=instrument_after_agent_callback,
+    before_model_callback=before_model_callbacks,
+    after_model_callback=[
+        instrument_after_model_callback,
+        llm_cache_after_model_callback,
+    ],
+    on_model_error_callback=[
+        instrument_on_model_error_callback,
+        llm_cache_on_model_error_callback,
+    ],
+    before_tool_callback=instrument_before_tool_callback,
+    after_tool_callback=instrument_after_tool_callback,
+    on_tool_error_callback=instrument_on_tool_error_callback,
 )
 
 root_agent = obsidian_mate_agent
@@ -3,13 +3,31 @@
 import os
 from google.adk.agents import Agent
 from google.adk.models.google_llm import Gemini
-from google.adk.tools.google_search_tool import google_search
+from google.adk.tools.google_search_tool import GoogleSearchTool
 from google.genai import types
 
+from core.tools.vault_retrieval_tool import vault_retrieval_tool
 from models.enums import AgentNameEnum
 from stores.llm.templates import TemplateParser
 from utils.config_utils import get_settings
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+    instrument_before_tool_callback,
+    instrument_after_tool_callback,
+    instrument_on_tool_error_callback,
+)
+from utils.agent_utils import (
+    llm_cache_before_model_callback,
+    llm_cache_after_model_callback,
+    llm_cache_on_model_error_callback,
+    semantic_cache_before_agent_callback,
+    semantic_cache_after_model_callback,
+)
 
 app_settings = get_settings()
 template_parser = TemplateParser()
@@ -30,13 +48,29 @@ chat_agent = Agent(
     model=Gemini(model=app_settings.CHAT_MODEL_NAME, retry_options=retry_config),
     description="A simple agent that can answer general questions.",
     instruction=template_parser.get("chat", "INSTRUCTIONS"),  # type: ignore
-    tools=[google_search],
-    before_agent_callback=logger.info("%s is starting...", AgentNameEnum.CHAT_AGENT),
-    after_agent_callback=logger.info("%s is Finishing...", AgentNameEnum.CHAT_AGENT),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
-    before_tool_callback=logger.info("Callinge Google Search tool..."),
-    after_tool_callback=logger.info("Google Search Tool call done."),
+    # Built-in search cannot share an agent with function tools unless bypassed.
+    tools=[GoogleSearchTool(bypass_multi_tools_limit=True), vault_retrieval_tool],
+    before_agent_callback=[
+        semantic_cache_before_agent_callback,
+        instrument_before_agent_callback,
+    ],
+    after_agent_callback=instrument_after_agent_callback,
+    before_model_callback=[
+        llm_cache_before_model_callback,
+        instrument_before_model_callback,
+    ],
+    after_model_callback=[
+        instrument_after_model_callback,
+        llm_cache_after_model_callback,
+        semantic_cache_after_model_callback,
+    ],
+    on_model_error_callback=[
+        instrument_on_model_error_callback,
+        llm_cache_on_model_error_callback,
+    ],
+    before_tool_callback=instrument_before_tool_callback,
+    after_tool_callback=instrument_after_tool_callback,
+    on_tool_error_callback=instrument_on_tool_error_callback,
 )
 
 
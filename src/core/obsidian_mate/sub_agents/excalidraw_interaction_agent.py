@@ -9,12 +9,22 @@ from stores.llm.templates import TemplateParser
 from utils.config_utils import get_settings
 from core.tools.excalidraw_interaction_tool import excalidraw_tool
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+    instrument_before_tool_callback,
+    instrument_after_tool_callback,
+    instrument_on_tool_error_callback,
+)
 
 app_settings = get_settings()
 template_parser = TemplateParser()
 logger = setup_logger(
-    log_file = __file__,
-    log_dir = app_settings.PATH_LOGS,
+    log_file=__file__,
+    log_dir=app_settings.PATH_LOGS,
 )
 
 retry_config = types.HttpRetryOptions(
@@ -31,13 +41,14 @@ excalidraw_interaction_agent = Agent(
     description="A simple agent that can manage obsigian interactions.",
     instruction=template_parser.get("interact_excalidraw", "INSTRUCTIONS"),  # type: ignore
     tools=[excalidraw_tool],
-
-    before_agent_callback=logger.info("%s is starting...", AgentNameEnum.EXCALIDRAW_INTERACTION_AGENT),
-    after_agent_callback=logger.info("%s is Finishing...", AgentNameEnum.EXCALIDRAW_INTERACTION_AGENT),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
-    before_tool_callback=logger.info("Tool is about to be invoked..."),
-    after_tool_callback=logger.info("Tool has been invoked."),
+    before_agent_callback=instrument_before_agent_callback,
+    after_agent_callback=instrument_after_agent_callback,
+    before_model_callback=instrument_before_model_callback,
+    after_model_callback=instrument_after_model_callback,
+    on_model_error_callback=instrument_on_model_error_callback,
+    before_tool_callback=instrument_before_tool_callback,
+    after_tool_callback=instrument_after_tool_callback,
+    on_tool_error_callback=instrument_on_tool_error_callback,
 )
 
 
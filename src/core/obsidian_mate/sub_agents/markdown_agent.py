@@ -6,12 +6,24 @@ from utils.config_utils import get_settings
 from models.enums import AgentNameEnum
 from stores.llm.templates import TemplateParser
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+)
+from utils.agent_utils import (
+    llm_cache_before_model_callback,
+    llm_cache_after_model_callback,
+    llm_cache_on_model_error_callback,
+)
 
 app_settings = get_settings()
 template_parser = TemplateParser()
 logger = setup_logger(
-    log_file = __file__,
-    log_dir = app_settings.PATH_LOGS,
+    log_file=__file__,
+    log_dir=app_settings.PATH_LOGS,
 )
 
 retry_config = types.HttpRetryOptions(
@@ -27,13 +39,23 @@ markdown_agent = Agent(
     description="A simple agent that can answer general questions.",
     instruction=template_parser.get("markdown", "INSTRUCTIONS"),  # type: ignore
     output_key="markdown",
-
-    before_agent_callback=logger.info("%s is starting...", AgentNameEnum.MARKDOWN_FORMATTER_AGENT),
-    after_agent_callback=logger.info("%s is Finishing...", AgentNameEnum.MARKDOWN_FORMATTER_AGENT),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
+    before_agent_callback=instrument_before_agent_callback,
+    after_agent_callback=instrument_after_agent_callback,
+    before_model_callback=[
+        llm_cache_before_model_callback,
+        instrument_before_model_callback,
+    ],
+    after_model_callback=[
+        instrument_after_model_callback,
+        llm_cache_after_model_callback,
+    ],
+    on_model_error_callback=[
+        instrument_on_model_error_callback,
+        llm_cache_on_model_error_callback,
+    ],
 )
 
+
 def main():
     """Entry Point for the Program."""
     print(
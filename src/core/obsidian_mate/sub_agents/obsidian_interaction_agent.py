@@ -7,14 +7,28 @@ from google.genai import types
 from models.enums import AgentNameEnum
 from stores.llm.templates import TemplateParser
 from utils.config_utils import get_settings
-from core.tools.obsidian_interaction_tool import obsidian_tool
+from core.tools.obsidian_interaction_tool import (
+    buffered_obsidian_tool,
+    obsidian_write_buffer,
+)
+from core.tools.vault_search_tool import vault_search_tool
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+    instrument_before_tool_callback,
+    instrument_after_tool_callback,
+    instrument_on_tool_error_callback,
+)
 
 app_settings = get_settings()
 template_parser = TemplateParser()
 logger = setup_logger(
-    log_file = __file__,
-    log_dir = app_settings.PATH_LOGS,
+    log_file=__file__,
+    log_dir=app_settings.PATH_LOGS,
 )
 
 retry_config = types.HttpRetryOptions(
@@ -31,15 +45,41 @@ obsidian_interaction_agent = Agent(
     description="A simple agent that can manage obsigian interactions.",
     instruction=template_parser.get("interact_obsidian", "INSTRUCTIONS"),  # type: ignore
     tools=[
-        obsidian_tool
+        buffered_obsidian_tool,
+        vault_search_tool,
+    ],
+    before_agent_callback=instrument_before_agent_callback,
+    # Instrumentation first: the flush returns a Content when a write fails,
+    # which would skip the callbacks after it.
+    after_agent_callback=[
+        instrument_after_agent_callback,
+        *(
+            [obsidian_write_buffer.after_agent_callback]
+            if obsidian_write_buffer
+            else []
+        ),
+    ],
+    before_model_callback=instrument_before_model_callback,
+    after_model_callback=instrument_after_model_callback,
+    # The buffer comes last on errors: it drops the failed invocation's writes.
+    on_model_error_callback=[
+        instrument_on_model_error_callback,
+        *(
+            [obsidian_write_buffer.on_model_error_callback]
+            if obsidian_write_buffer
+            else []
+        ),
+    ],
+    before_tool_callback=instrument_before_tool_callback,
+    after_tool_callback=instrument_after_tool_callback,
+    on_tool_error_callback=[
+        instrument_on_tool_error_callback,
+        *(
+            [obsidian_write_buffer.on_tool_error_callback]
+            if obsidian_write_buffer
+            else []
+        ),
     ],
-
-    before_agent_callback=logger.info("%s is starting...", AgentNameEnum.OBSIDIAN_INTERACTION_AGENT),
-    after_agent_callback=logger.info("%s is Finishing...", AgentNameEnum.OBSIDIAN_INTERACTION_AGENT),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
-    before_tool_callback=logger.info("Obsidiab Tool is about to be invoked..."),
-    after_tool_callback=logger.info("Obsidian Tool has been invoked."),
 )
 
 
@@ -9,12 +9,19 @@ from models.enums import AgentNameEnum
 from utils.config_utils import get_settings
 from stores.llm.templates import TemplateParser
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+)
 
 app_settings = get_settings()
 template_parser = TemplateParser()
 logger = setup_logger(
-    log_file = __file__,
-    log_dir = app_settings.PATH_LOGS,
+    log_file=__file__,
+    log_dir=app_settings.PATH_LOGS,
 )
 
 
@@ -33,11 +40,11 @@ smart_notes_pipeline = Agent(
     instruction=template_parser.get("take_notes", "INSTRUCTIONS"),  # type: ignore
     output_key="final_notes",
     sub_agents=[text_summary_agent],
-
-    before_agent_callback=logger.info("%s is starting...", AgentNameEnum.SMART_NOTE_PIPELINE_AGENT),
-    after_agent_callback=logger.info("%s is Finishing...", AgentNameEnum.SMART_NOTE_PIPELINE_AGENT),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
+    before_agent_callback=instrument_before_agent_callback,
+    after_agent_callback=instrument_after_agent_callback,
+    before_model_callback=instrument_before_model_callback,
+    after_model_callback=instrument_after_model_callback,
+    on_model_error_callback=instrument_on_model_error_callback,
 )
 
 
@@ -1,5 +1,9 @@
 import os
-from google.adk.agents import Agent
+import asyncio
+from typing import AsyncGenerator
+from google.adk.agents import Agent, BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
 from google.adk.models.google_llm import Gemini
 from google.adk.models.lite_llm import LiteLlm
 from google.genai import types
@@ -7,8 +11,19 @@ from google.genai import types
 from models.enums import AgentNameEnum
 from stores.llm.templates import TemplateParser
 from utils.config_utils import get_settings
-from core.tools.youtube_transcript_tool import transcript_tool
+from core.tools.youtube_transcript_tool import cached_transcript_tool, fetch_transcript
+from stores.youtube import find_video_ids
 from utils.logging_utils import setup_logger
+from utils.instrumentation_utils import (
+    instrument_before_agent_callback,
+    instrument_after_agent_callback,
+    instrument_before_model_callback,
+    instrument_after_model_callback,
+    instrument_on_model_error_callback,
+    instrument_before_tool_callback,
+    instrument_after_tool_callback,
+    instrument_on_tool_error_callback,
+)
 
 app_settings = get_settings()
 template_parser = TemplateParser()
@@ -24,24 +39,101 @@ retry_config = types.HttpRetryOptions(
     http_status_codes=app_settings.RETRY_HTTP_STATUS_CODE,
 )
 
-yt_transcript_agent = Agent(
+yt_transcript_llm_agent = Agent(
     name=AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT,
     # model=Gemini(model=app_settings.CHAT_MODEL_NAME, retry_options=retry_config),
     model=LiteLlm(app_settings.DEFAULT_MODEL_NAME),
     description="A simple agent that can extract transcripts from YouTube videos.",
     instruction=template_parser.get("get_transcript", "INSTRUCTIONS"),  # type: ignore
     output_key="video_transcript",
-    tools=[transcript_tool],
-    before_agent_callback=logger.info(
-        "%s is starting...", AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT
-    ),
-    after_agent_callback=logger.info(
-        "%s is Finishing...", AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT
-    ),
-    before_model_callback=logger.info("Model is about to generate a response..."),
-    after_model_callback=logger.info("Model has generated a response."),
-    before_tool_callback=logger.info("Tool is about to be invoked..."),
-    after_tool_callback=logger.info("Tool has been invoked."),
+    tools=[cached_transcript_tool],
+    before_agent_callback=instrument_before_agent_callback,
+    after_agent_callback=instrument_after_agent_callback,
+    before_model_callback=instrument_before_model_callback,
+    after_model_callback=instrument_after_model_callback,
+    on_model_error_callback=instrument_on_model_error_callback,
+    before_tool_callback=instrument_before_tool_callback,
+    after_tool_callback=instrument_after_tool_callback,
+    on_tool_error_callback=instrument_on_tool_error_callback,
+)
+
+
+class DirectTranscriptAgent(BaseAgent):
+    """
+    Transcript agent without a model: fetches the transcripts of the videos linked
+    in the request through the transcript cache / MCP server and writes them to
+    ``state["video_transcript"]`` as they are, instead of having a model copy them
+    token by token.
+    """
+
+    lang: str = "en"
+    output_key: str = "video_transcript"
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        parts = (
+            ctx.user_content.parts
+            if ctx.user_content and ctx.user_content.parts
+            else []
+        )
+        request = "".join(part.text for part in parts if part.text)
+        video_ids = find_video_ids(request)
+        if not video_ids:
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                content=types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(
+                            text="No YouTube video link was found in the request."
+                        )
+                    ],
+                ),
+            )
+            return
+
+        results = await asyncio.gather(
+            *(fetch_transcript(video_id, self.lang) for video_id in video_ids)
+        )
+        sections = []
+        for video_id, result in zip(video_ids, results):
+            if result["status"] == "success":
+                body = result["transcript"]
+            else:
+                logger.error(
+                    "Transcript of %s failed: %s", video_id, result["error_message"]
+                )
+                body = f"Transcript unavailable: {result['error_message']}"
+            sections.append(body if len(video_ids) == 1 else f"## {video_id}\n\n{body}")
+        transcript = "\n\n".join(sections)
+
+        succeeded = any(result["status"] == "success" for result in results)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=transcript)]),
+            actions=EventActions(
+                state_delta={self.output_key: transcript} if succeeded else {}
+            ),
+        )
+
+
+yt_transcript_direct_agent = DirectTranscriptAgent(
+    name=AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT,
+    description="Extracts the transcripts of the YouTube videos linked in the request.",
+    lang=app_settings.TRANSCRIPT_LANG,
+    before_agent_callback=instrument_before_agent_callback,
+    after_agent_callback=instrument_after_agent_callback,
+)
+
+yt_transcript_agent = (
+    yt_transcript_direct_agent
+    if app_settings.TRANSCRIPT_AGENT_MODE == "direct"
+    else yt_transcript_llm_agent
 )
 
 
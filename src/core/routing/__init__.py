@@ -0,0 +1,3 @@
+from core.routing.pre_router import IntentClassifier, PreRouter, RouteDecision
+
+__all__ = ["IntentClassifier", "PreRouter", "RouteDecision"]
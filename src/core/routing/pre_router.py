@@ -0,0 +1,352 @@
+"""
+Pre-Router Module.
+
+Routes obvious requests straight to a sub-agent so the root agent does not spend a
+model call choosing the tool. Rules (and an optional local nearest-neighbour
+classifier) score the user message; when the best decision is confident enough,
+the root agent's ``before_model_callback`` answers with the ``AgentTool`` call
+itself, and once the sub-agent replies it passes the reply through as the final
+answer, skipping the second root model call too. Every decision is logged with
+its confidence for tuning.
+"""
+
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from functools import cache
+from typing import Callable, Optional
+import numpy as np
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from models.enums import AgentNameEnum
+from stores.llm.embeddings import HashingEmbedder
+from stores.llm.templates import TemplateParser
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+# Function call ids of routed calls start with this prefix. Unlike ADK's own
+# ``adk-`` ids they stay in the session history and are sent back to the model as
+# tool call ids, which OpenAI limits to 40 characters.
+ROUTED_CALL_PREFIX = "preroute-"
+_ROUTED_CALL_ID_HEX_CHARS = 24
+
+_YOUTUBE_URL_PATTERN = re.compile(
+    r"https?://(?:www\.|m\.)?(?:youtube\.com/(?:watch\?\S*v=|shorts/|live/)|youtu\.be/)[\w-]{11}\S*"
+)
+_TRANSCRIPT_WORDS = {"transcript", "transcribe", "captions", "subtitles"}
+
+
+@dataclass
+class RouteDecision:
+    """
+    A routing decision.
+
+    Attributes:
+        agent_name (str): Name of the target sub-agent (its ``AgentTool`` name).
+        request (str): The request sent to the sub-agent.
+        confidence (float): Confidence in [0, 1].
+        source (str): The rule or classifier that produced the decision.
+    """
+
+    agent_name: str
+    request: str
+    confidence: float
+    source: str
+
+
+RoutingRule = Callable[[str], Optional[RouteDecision]]
+
+
+def youtube_url_rule(text: str) -> Optional[RouteDecision]:
+    """Route a bare YouTube URL (or a transcript request for one) to the transcript agent."""
+
+    urls = _YOUTUBE_URL_PATTERN.findall(text)
+    if len(urls) != 1:
+        return None
+    rest = _YOUTUBE_URL_PATTERN.sub(" ", text)
+    words = set(re.findall(r"\w+", rest.lower()))
+    if not words:
+        confidence = 0.99
+    elif words & _TRANSCRIPT_WORDS and len(words) <= 8:
+        confidence = 0.95
+    else:
+        # Something else is asked about the video: leave it to the root agent.
+        confidence = 0.5
+    return RouteDecision(
+        agent_name=AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT,
+        request=f"Extract the transcript of {urls[0]}",
+        confidence=confidence,
+        source="youtube_url",
+    )
+
+
+@cache
+def _write_summary_prefix() -> str:
+    """Return the fixed part of the summary write-out query."""
+
+    return str(
+        TemplateParser().get("summarize", "WRITE_SUMMARY_QUERY", {"summary": ""})
+    ).strip()
+
+
+def write_summary_rule(text: str) -> Optional[RouteDecision]:
+    """Route the summary write-out built by the ``summary`` chat keyword to the Obsidian agent."""
+
+    prefix = _write_summary_prefix()
+    if not prefix or not text.startswith(prefix):
+        return None
+    return RouteDecision(
+        agent_name=AgentNameEnum.OBSIDIAN_INTERACTION_AGENT,
+        request=text,
+        confidence=1.0,
+        source="write_summary",
+    )
+
+
+DEFAULT_RULES: list[RoutingRule] = [write_summary_rule, youtube_url_rule]
+
+DEFAULT_INTENT_EXAMPLES: dict[str, list[str]] = {
+    AgentNameEnum.OBSIDIAN_INTERACTION_AGENT: [
+        "create a new note called meeting notes",
+        "append this to my daily note",
+        "list the files in my vault",
+        "delete the note named draft",
+        "open my note about project ideas",
+        "add a todo item to my tasks note",
+    ],
+    AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT: [
+        "get the transcript of this youtube video",
+        "extract the captions from this video",
+        "transcribe this youtube link",
+    ],
+    AgentNameEnum.SMART_NOTE_PIPELINE_AGENT: [
+        "take smart notes of our conversation",
+        "turn this conversation into notes",
+        "make notes from what we discussed",
+    ],
+    AgentNameEnum.CHAT_AGENT: [
+        "what is the capital of france",
+        "explain how transformers work",
+        "what is the weather like today",
+        "who won the world cup",
+        "how do i reverse a list in python",
+    ],
+}
+
+
+class IntentClassifier:
+    """
+    Nearest-neighbour intent classifier over labelled example utterances, using the
+    local hashing embedder (no model call).
+
+    Attributes:
+        embedder (HashingEmbedder): Embeds the examples and the messages.
+        margin (float): Minimum similarity gap between the two best intents; closer
+            calls have their confidence halved.
+    """
+
+    def __init__(
+        self,
+        examples: Optional[dict[str, list[str]]] = None,
+        embedder: Optional[HashingEmbedder] = None,
+        margin: float = 0.1,
+    ):
+        """
+        Initialize the classifier.
+
+        Args:
+            examples (Optional[dict[str, list[str]]]): Example utterances by agent name.
+            embedder (Optional[HashingEmbedder]): Embeds the examples and messages.
+            margin (float): Minimum similarity gap between the two best intents.
+        """
+
+        self.embedder = embedder or HashingEmbedder()
+        self.margin = margin
+        examples = examples or DEFAULT_INTENT_EXAMPLES
+        self._labels = [label for label, texts in examples.items() for _ in texts]
+        self._matrix = self.embedder.embed_many(
+            [text for texts in examples.values() for text in texts]
+        )
+
+    def __call__(self, text: str) -> Optional[RouteDecision]:
+        """Classify a message; the confidence is the similarity of the nearest example."""
+
+        similarities = self._matrix @ self.embedder.embed(text)
+        best_by_label: dict[str, float] = {}
+        for label, similarity in zip(self._labels, similarities.tolist()):
+            best_by_label[label] = max(best_by_label.get(label, -1.0), similarity)
+        ranked = sorted(best_by_label.items(), key=lambda item: item[1], reverse=True)
+        if not ranked or ranked[0][1] <= 0:
+            return None
+        confidence = ranked[0][1]
+        if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < self.margin:
+            confidence /= 2
+        return RouteDecision(
+            agent_name=ranked[0][0],
+            request=text,
+            confidence=float(np.clip(confidence, 0.0, 1.0)),
+            source="classifier",
+        )
+
+
+class PreRouter:
+    """
+    Rules plus an optional classifier in front of the root agent's model.
+
+    Attributes:
+        rules (list[RoutingRule]): Rules, tried in order.
+        classifier (Optional[IntentClassifier]): Fallback classifier.
+        min_confidence (float): Minimum confidence of a routed rule decision.
+        classifier_min_confidence (float): Minimum confidence of a routed
+            classifier decision (similarities of short texts run lower).
+        agent_names (Optional[set[str]]): Sub-agents that may be routed to.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[list[RoutingRule]] = None,
+        classifier: Optional[IntentClassifier] = None,
+        min_confidence: float = 0.9,
+        classifier_min_confidence: float = 0.75,
+        agent_names: Optional[set[str]] = None,
+    ):
+        """
+        Initialize the PreRouter.
+
+        Args:
+            rules (Optional[list[RoutingRule]]): Rules, tried in order.
+            classifier (Optional[IntentClassifier]): Fallback classifier.
+            min_confidence (float): Minimum confidence of a routed rule decision.
+            classifier_min_confidence (float): Minimum confidence of a routed
+                classifier decision.
+            agent_names (Optional[set[str]]): Sub-agents that may be routed to.
+        """
+
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.classifier = classifier
+        self.min_confidence = min_confidence
+        self.classifier_min_confidence = classifier_min_confidence
+        self.agent_names = agent_names
+
+    def is_confident(self, decision: Optional[RouteDecision]) -> bool:
+        """Whether a decision passes the threshold of its source."""
+
+        if decision is None:
+            return False
+        threshold = (
+            self.classifier_min_confidence
+            if decision.source == "classifier"
+            else self.min_confidence
+        )
+        return decision.confidence >= threshold
+
+    def route(self, text: str) -> Optional[RouteDecision]:
+        """
+        Return the most confident decision for a message, routed or not.
+
+        Args:
+            text (str): The user message.
+
+        Returns:
+            Optional[RouteDecision]: The best decision, or None if nothing matched.
+        """
+
+        decisions = [decision for rule in self.rules if (decision := rule(text))]
+        if self.classifier is not None and not any(map(self.is_confident, decisions)):
+            decision = self.classifier(text)
+            if decision is not None:
+                decisions.append(decision)
+        decisions = [
+            decision
+            for decision in decisions
+            if self.agent_names is None or decision.agent_name in self.agent_names
+        ]
+        confident = [decision for decision in decisions if self.is_confident(decision)]
+        return max(
+            confident or decisions,
+            key=lambda decision: decision.confidence,
+            default=None,
+        )
+
+    async def before_model_callback(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """
+        Answer the root model call with a routed tool call, or pass a routed tool's
+        reply through as the final answer.
+
+        Returns:
+            Optional[LlmResponse]: The synthetic response, or None to call the model.
+        """
+
+        if not llm_request.contents:
+            return None
+        last = llm_request.contents[-1]
+        parts = last.parts or []
+
+        routed_replies = [
+            part.function_response
+            for part in parts
+            if part.function_response
+            and (part.function_response.id or "").startswith(ROUTED_CALL_PREFIX)
+        ]
+        if routed_replies:
+            response = routed_replies[0].response or {}
+            text = response.get("result", response)
+            return LlmResponse(
+                content=types.Content(role="model", parts=[types.Part(text=str(text))])
+            )
+
+        if last.role != "user" or any(part.function_response for part in parts):
+            return None
+        text = "".join(part.text for part in parts if part.text).strip()
+        if not text:
+            return None
+
+        decision = self.route(text)
+        routed = self.is_confident(decision)
+        logger.info(
+            "Pre-router decision: agent=%s confidence=%.3f source=%s routed=%s invocation=%s",
+            decision.agent_name if decision else None,
+            decision.confidence if decision else 0.0,
+            decision.source if decision else None,
+            routed,
+            callback_context.invocation_id,
+        )
+        if decision is None or not routed:
+            return None
+        return LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        function_call=types.FunctionCall(
+                            id=f"{ROUTED_CALL_PREFIX}{uuid.uuid4().hex[:_ROUTED_CALL_ID_HEX_CHARS]}",
+                            name=decision.agent_name,  # type: ignore
+                            args={"request": decision.request},  # type: ignore
+                        )
+                    )
+                ],
+            )
+        )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
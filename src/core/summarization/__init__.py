@@ -0,0 +1,15 @@
+from core.summarization.map_reduce_summarizer import (
+    MapReduceSummarizer,
+    SummarizationError,
+)
+from core.summarization.context_compaction import (
+    CompactionPolicy,
+    ContextCompactionPlugin,
+)
+
+__all__ = [
+    "MapReduceSummarizer",
+    "SummarizationError",
+    "CompactionPolicy",
+    "ContextCompactionPlugin",
+]
@@ -0,0 +1,257 @@
+"""
+Context Compaction Module.
+
+Keeps the model context of long sessions bounded. Before every model call the
+request history is split into turns (a turn starts at a user message); while the
+history stays under a token threshold it is sent as is. Once the threshold is
+crossed, every turn but the last ``keep_turns`` is folded into a rolling summary
+stored in the session state, and the request carries that summary followed by
+the recent turns verbatim. Later crossings only fold the turns added since the
+previous summary into it.
+
+Runs as a runner plugin, so it applies to every agent without changing them;
+the policy (enabled, ``keep_turns``, ``token_threshold``) is set per agent name in
+``CONTEXT_COMPACTION`` with a ``default`` entry.
+"""
+
+import os
+import json
+import hashlib
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Optional
+import litellm
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.plugins.base_plugin import BasePlugin
+from google.genai import types
+from core.summarization.map_reduce_summarizer import MapReduceSummarizer
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+# Session state key of an agent's rolling summary.
+STATE_KEY_PREFIX = "compaction:"
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+_TOOL_RESULT_CHARS = 2000
+
+
+@dataclass
+class CompactionPolicy:
+    """
+    Compaction settings of one agent.
+
+    Attributes:
+        enabled (bool): Whether the agent's context is compacted.
+        keep_turns (int): Number of most recent turns always sent verbatim.
+        token_threshold (int): History size, in tokens, above which older turns
+            are folded into the summary.
+    """
+
+    enabled: bool = True
+    keep_turns: int = 6
+    token_threshold: int = 8000
+
+    @classmethod
+    def from_config(
+        cls, config: dict[str, dict[str, Any]], agent_name: str
+    ) -> "CompactionPolicy":
+        """Build the policy of an agent: its own entry over the ``default`` entry."""
+
+        names = {field.name for field in fields(cls)}
+        values = {
+            **(config.get("default") or {}),
+            **(config.get(agent_name) or {}),
+        }
+        return cls(**{key: value for key, value in values.items() if key in names})
+
+
+def _content_text(content: types.Content) -> str:
+    """Render a content as text, tool calls and (truncated) tool results included."""
+
+    lines = []
+    for part in content.parts or []:
+        if part.text:
+            lines.append(part.text)
+        elif part.function_call:
+            lines.append(
+                f"[called {part.function_call.name} with {json.dumps(part.function_call.args, default=str)}]"
+            )
+        elif part.function_response:
+            result = json.dumps(part.function_response.response, default=str)
+            if len(result) > _TOOL_RESULT_CHARS:
+                result = f"{result[:_TOOL_RESULT_CHARS]}..."
+            lines.append(f"[{part.function_response.name} returned {result}]")
+    return "\n".join(lines)
+
+
+def split_turns(contents: list[types.Content]) -> list[list[types.Content]]:
+    """
+    Group a request history into turns; a turn starts at a user message with text.
+
+    Args:
+        contents (list[types.Content]): The request history, in order.
+
+    Returns:
+        list[list[types.Content]]: The turns, in order.
+    """
+
+    turns: list[list[types.Content]] = []
+    for content in contents:
+        starts_turn = content.role == "user" and any(
+            part.text for part in content.parts or []
+        )
+        if starts_turn or not turns:
+            turns.append([])
+        turns[-1].append(content)
+    return turns
+
+
+def _turns_digest(turns: list[list[types.Content]]) -> str:
+    """Fingerprint turns, to detect a history that no longer matches the summary."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for turn in turns:
+        for content in turn:
+            digest.update(_content_text(content).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ContextCompactionPlugin(BasePlugin):
+    """
+    Replaces old turns of the model context with a stored rolling summary.
+
+    Attributes:
+        summarizer (MapReduceSummarizer): Folds turns into the summary.
+        config (dict[str, dict[str, Any]]): Policies by agent name, with a
+            ``default`` entry.
+        token_counter (Callable[[str], int]): Counts the tokens of a text.
+    """
+
+    def __init__(
+        self,
+        summarizer: MapReduceSummarizer,
+        config: Optional[dict[str, dict[str, Any]]] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        Initialize the ContextCompactionPlugin.
+
+        Args:
+            summarizer (MapReduceSummarizer): Folds turns into the summary.
+            config (Optional[dict[str, dict[str, Any]]]): Policies by agent name.
+            token_counter (Optional[Callable[[str], int]]): Counts the tokens of a
+                text. Defaults to ``litellm.token_counter`` for the summarizer's model.
+        """
+
+        super().__init__(name="context_compaction")
+        self.summarizer = summarizer
+        self.config = config or {}
+        self.token_counter = token_counter or (
+            lambda text: litellm.token_counter(model=summarizer.model.model, text=text)
+        )
+        self._policies: dict[str, CompactionPolicy] = {}
+
+    def policy(self, agent_name: str) -> CompactionPolicy:
+        """Return the (cached) policy of an agent."""
+
+        if agent_name not in self._policies:
+            self._policies[agent_name] = CompactionPolicy.from_config(
+                self.config, agent_name
+            )
+        return self._policies[agent_name]
+
+    def _count(self, turns: list[list[types.Content]]) -> int:
+        """Count the tokens of some turns."""
+
+        text = "\n".join(_content_text(content) for turn in turns for content in turn)
+        return self.token_counter(text) if text else 0
+
+    async def _fold(self, summary: str, turns: list[list[types.Content]]) -> str:
+        """Return the summary extended with the given turns."""
+
+        messages = [{"author": "summary so far", "text": summary}] if summary else []
+        messages += [
+            {"author": content.role or "model", "text": text}
+            for turn in turns
+            for content in turn
+            if (text := _content_text(content))
+        ]
+        result = await self.summarizer.summarize(messages)
+        return result["summary"]
+
+    async def before_model_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Compact the request history in place; never answers the call itself."""
+
+        policy = self.policy(callback_context.agent_name)
+        if not policy.enabled or not llm_request.contents:
+            return None
+        turns = split_turns(llm_request.contents)
+        if len(turns) <= policy.keep_turns:
+            return None
+
+        key = f"{STATE_KEY_PREFIX}{callback_context.agent_name}"
+        stored = callback_context.state.get(key) or {}
+        summary, covered = stored.get("summary", ""), stored.get("turns", 0)
+        if covered > len(turns) - 1 or stored.get("digest") != _turns_digest(
+            turns[max(0, covered - 1) : covered]
+        ):
+            # The history was rewound or belongs to another branch: start over.
+            summary, covered = "", 0
+
+        summary_tokens = self.token_counter(summary) if summary else 0
+        if summary_tokens + self._count(turns[covered:]) > policy.token_threshold:
+            fold_until = len(turns) - policy.keep_turns
+            if fold_until > covered:
+                try:
+                    folded = await self._fold(summary, turns[covered:fold_until])
+                except Exception as exc:  # pylint: disable=[W0718]
+                    # Compaction must not fail the turn: send the unfolded turns
+                    # and retry on the next model call.
+                    logger.error(
+                        "Compacting the context of %s failed, sending it uncompacted: %s",
+                        callback_context.agent_name,
+                        exc,
+                    )
+                else:
+                    summary = folded
+                    logger.info(
+                        "Compacted %d turns of %s into the rolling summary (%d turns summarized).",
+                        fold_until - covered,
+                        callback_context.agent_name,
+                        fold_until,
+                    )
+                    covered = fold_until
+                    callback_context.state[key] = {
+                        "summary": summary,
+                        "turns": covered,
+                        "digest": _turns_digest(turns[covered - 1 : covered]),
+                    }
+
+        if covered:
+            llm_request.contents = [
+                types.Content(
+                    role="user", parts=[types.Part(text=f"{SUMMARY_PREFIX}{summary}")]
+                ),
+                *(content for turn in turns[covered:] for content in turn),
+            ]
+        return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
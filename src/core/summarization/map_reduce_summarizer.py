@@ -0,0 +1,273 @@
+"""
+Map-Reduce Summarizer Module.
+
+Summarizes conversations that do not fit in one model context: the history is split
+by a token budget, the chunks are summarized concurrently (map), and the partial
+summaries are merged (reduce), recursively if they still exceed the budget.
+A failed call is retried; a chunk that still fails aborts the summary with a
+``SummarizationError``.
+"""
+
+import os
+import asyncio
+from typing import Any, Callable, Optional
+import litellm
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from stores.llm.templates import TemplateParser
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+
+class SummarizationError(RuntimeError):
+    """Raised when a chunk of a stage still fails after its retries."""
+
+
+class MapReduceSummarizer:
+    """
+    Token-budgeted map-reduce summarization over a conversation.
+
+    Attributes:
+        model (BaseLlm): The model used for the map and reduce calls.
+        chunk_token_budget (int): Maximum number of tokens sent in one call.
+        max_concurrency (int): Maximum number of model calls in flight.
+        max_retries (int): Retries of a failed call before the summary is aborted.
+        retry_delay (float): Delay before the first retry, in seconds (doubled on
+            each retry).
+        token_counter (Callable[[str], int]): Counts the tokens of a text.
+    """
+
+    def __init__(
+        self,
+        model: BaseLlm,
+        chunk_token_budget: int = 6000,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        retry_delay: float = 1.0,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        Initialize the MapReduceSummarizer.
+
+        Args:
+            model (BaseLlm): The model used for the map and reduce calls.
+            chunk_token_budget (int): Maximum number of tokens sent in one call.
+            max_concurrency (int): Maximum number of model calls in flight.
+            max_retries (int): Retries of a failed call before the summary is aborted.
+            retry_delay (float): Delay before the first retry, in seconds (doubled
+                on each retry).
+            token_counter (Optional[Callable[[str], int]]): Counts the tokens of a
+                text. Defaults to ``litellm.token_counter`` for the model.
+
+        Raises:
+            ValueError: If ``chunk_token_budget`` or ``max_concurrency`` is not
+                positive, or ``max_retries`` is negative.
+        """
+
+        if chunk_token_budget <= 0 or max_concurrency <= 0:
+            raise ValueError("chunk_token_budget and max_concurrency must be positive.")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+
+        self.model = model
+        self.chunk_token_budget = chunk_token_budget
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.token_counter = token_counter or (
+            lambda text: litellm.token_counter(model=self.model.model, text=text)
+        )
+        self.template_parser = TemplateParser()
+
+    def _split_text(self, text: str, tokens: int) -> list[str]:
+        """Split a single oversized text into pieces that fit the budget."""
+
+        chars_per_piece = max(
+            1, int(len(text) * self.chunk_token_budget * 0.9 / tokens)
+        )
+        return [
+            text[start : start + chars_per_piece]
+            for start in range(0, len(text), chars_per_piece)
+        ]
+
+    def split(self, texts: list[str]) -> list[str]:
+        """
+        Pack consecutive texts into chunks of at most ``chunk_token_budget`` tokens.
+
+        Args:
+            texts (list[str]): Texts in order (e.g. rendered messages).
+
+        Returns:
+            list[str]: The chunks, in order.
+        """
+
+        chunks: list[str] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = self.token_counter(text)
+            pieces = (
+                self._split_text(text, tokens)
+                if tokens > self.chunk_token_budget
+                else [text]
+            )
+            for piece in pieces:
+                piece_tokens = tokens if len(pieces) == 1 else self.token_counter(piece)
+                if current and current_tokens + piece_tokens > self.chunk_token_budget:
+                    chunks.append("\n".join(current))
+                    current, current_tokens = [], 0
+                current.append(piece)
+                current_tokens += piece_tokens
+        if current:
+            chunks.append("\n".join(current))
+        return chunks
+
+    async def _generate(self, instruction: str, text: str) -> str:
+        """Run a single, non-streaming model call and return its text."""
+
+        llm_request = LlmRequest(
+            model=self.model.model,
+            contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+            config=types.GenerateContentConfig(system_instruction=instruction),
+        )
+        answer = ""
+        async for llm_response in self.model.generate_content_async(llm_request):
+            if llm_response.content and llm_response.content.parts:
+                answer += "".join(
+                    part.text for part in llm_response.content.parts if part.text
+                )
+        return answer
+
+    async def _run_stage(
+        self,
+        stage: str,
+        instruction: str,
+        chunks: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[str], dict[str, Any]]:
+        """
+        Summarize all chunks concurrently and return the outputs in order.
+
+        Raises:
+            SummarizationError: If a chunk still fails after ``max_retries`` retries.
+        """
+
+        async def run(index: int, chunk: str) -> str:
+            attempt = 0
+            while True:
+                try:
+                    async with semaphore:
+                        return await self._generate(instruction, chunk)
+                except Exception as exc:  # pylint: disable=[W0718]
+                    if attempt >= self.max_retries:
+                        raise
+                    logger.warning(
+                        "Summarization %s stage: chunk %s failed (%s), retrying.",
+                        stage,
+                        index,
+                        exc,
+                    )
+                    await asyncio.sleep(self.retry_delay * 2**attempt)
+                    attempt += 1
+
+        results = await asyncio.gather(
+            *(run(index, chunk) for index, chunk in enumerate(chunks)),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.error(
+                "Summarization %s stage: %s of %s chunks failed: %s",
+                stage,
+                len(failures),
+                len(chunks),
+                failures[0],
+            )
+            raise SummarizationError(
+                f"{len(failures)} of {len(chunks)} chunks of the {stage} stage failed: "
+                f"{failures[0]}"
+            ) from failures[0]
+        outputs: list[str] = results  # type: ignore
+        stats = {
+            "stage": stage,
+            "calls": len(chunks),
+            "input_tokens": sum(self.token_counter(chunk) for chunk in chunks),
+            "output_tokens": sum(self.token_counter(output) for output in outputs),
+        }
+        logger.info(
+            "Summarization %s stage: %s calls, %s input tokens, %s output tokens.",
+            stage,
+            stats["calls"],
+            stats["input_tokens"],
+            stats["output_tokens"],
+        )
+        return outputs, stats
+
+    async def summarize(self, messages: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Summarize a conversation.
+
+        Args:
+            messages (list[dict[str, Any]]): The conversation as ``{"author", "text"}``
+                dictionaries, in order.
+
+        Returns:
+            dict[str, Any]: ``{"summary": str, "stages": [...]}`` where each stage
+                reports its number of calls and its input/output token counts.
+
+        Raises:
+            SummarizationError: If a chunk still fails after its retries.
+        """
+
+        texts = [f"{message['author']}: {message['text']}" for message in messages]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        stages: list[dict[str, Any]] = []
+
+        chunks = self.split(texts)
+        partials, stats = await self._run_stage(
+            "map",
+            self.template_parser.get("summarize", "MAP_INSTRUCTIONS"),  # type: ignore
+            chunks,
+            semaphore,
+        )
+        stages.append(stats)
+
+        reduce_instruction = self.template_parser.get(
+            "summarize", "REDUCE_INSTRUCTIONS"
+        )
+        while len(partials) > 1:
+            chunks = self.split(partials)
+            if len(chunks) >= len(partials):
+                # Every partial fills a chunk by itself; merge pairwise to make progress.
+                chunks = [
+                    "\n".join(partials[index : index + 2])
+                    for index in range(0, len(partials), 2)
+                ]
+            partials, stats = await self._run_stage(
+                f"reduce-{len(stages)}",
+                reduce_instruction,  # type: ignore
+                chunks,
+                semaphore,
+            )
+            stages.append(stats)
+
+        return {"summary": partials[0] if partials else "", "stages": stages}
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
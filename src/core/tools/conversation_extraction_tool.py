@@ -1,7 +1,9 @@
 """tool to extract conversation"""
 
-from typing import Any, Callable
-from google.adk.agents import InvocationContext
+from typing import Any, Callable, Optional
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService
 from google.adk.sessions.database_session_service import DatabaseSessionService
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_context import ToolContext
@@ -12,11 +14,36 @@ class ExtractConversationTool(FunctionTool):
     """
     Tool to extract conversation history from a session object.
 
-    This tool wraps an asynchronous function that retrieves all events
-    from the given session in a structured format. It is intended to
+    This tool wraps an asynchronous function that retrieves the events
+    of the current session in a structured format. It is intended to
     be called by an agent in the ADK framework.
+
+    Attributes:
+        session_service (Optional[BaseSessionService]): Shared session service used
+            when the in-memory session of the tool context has no events or is not
+            the top-level one. Injected by the application (see ``main.lifespan``);
+            when None, a process-wide service over the configured database is
+            created on first use.
     """
 
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        session_service: Optional[BaseSessionService] = None,
+    ):
+        """
+        Initialize the ExtractConversationTool.
+
+        Args:
+            func (Callable[..., Any]): The extraction function.
+            session_service (Optional[BaseSessionService]): Shared session service
+                used as a fallback source of events.
+        """
+
+        super().__init__(func=func)
+        self._ignore_params.append("session_service")
+        self.session_service = session_service
+
     async def run_async(
         self, *, args: dict[str, Any], tool_context: ToolContext
     ) -> Any:
@@ -24,37 +51,150 @@ class ExtractConversationTool(FunctionTool):
         Execute the tool asynchronously.
 
         Args:
-            args (dict[str, Any]): Dictionary of arguments passed to the tool.
+            args (dict[str, Any]): Dictionary of arguments passed to the tool
+                (``last_n_turns`` and/or ``since_event_id``).
             tool_context (ToolContext): Context object containing session info
                                         and other metadata.
 
         Returns:
             dict: Result dictionary containing either:
-                - success: {"status": "success", "session_events": [...]}
+                - success: {"status": "success", "conversation": [...]}
                 - error: {"status": "error", "error_message": "..."}
         """
 
-        return await self.func(tool_context)
+        window_args = {
+            key: value
+            for key, value in args.items()
+            if key in ("last_n_turns", "since_event_id")
+        }
+        return await self.func(
+            tool_context, session_service=self.session_service, **window_args
+        )
+
+
+# Session-state key holding the id of the runner's top-level session. AgentTool
+# copies the session state into the throwaway sessions of its children (all but
+# the ``temp:`` keys, hence a session-scoped key).
+ROOT_SESSION_ID_STATE_KEY = "root_session_id"
+
+_default_session_service: Optional[BaseSessionService] = None
+
+
+def record_root_session_callback(callback_context: CallbackContext) -> None:
+    """
+    Record the id of the top-level session (``before_agent_callback`` of the root agent).
+
+    Lets ``extract_conversation`` read the user's conversation when it runs under an
+    AgentTool, whose child session only holds the request sent to the sub-agent.
+    """
+
+    if ROOT_SESSION_ID_STATE_KEY not in callback_context.state:
+        callback_context.state[ROOT_SESSION_ID_STATE_KEY] = callback_context.session.id
+
 
+def _get_default_session_service() -> BaseSessionService:
+    """Return a process-wide session service over the configured database.
 
-async def _extract_conversation(tool_context: ToolContext):
+    Used when none was injected, e.g. when the agents run outside the API.
     """
-    Extracts conversation events from the session.
 
-    Iterates over the session's events and collects the author and text
-    of each event into a structured list. Provides a status field to
-    indicate success or failure.
+    global _default_session_service  # pylint: disable=[W0603]
+    if _default_session_service is None:
+        settings = get_settings()
+        _default_session_service = DatabaseSessionService(
+            db_url=f"sqlite+aiosqlite:///{settings.SQLITE_DB_PATH}"
+        )
+    return _default_session_service
+
+
+async def _load_events(
+    tool_context: ToolContext, session_service: Optional[BaseSessionService]
+) -> list[Event]:
+    """Return the session events, preferring the already-hydrated in-memory session.
+
+    Under an AgentTool the in-memory session is the child's throwaway one, so the
+    top-level session recorded by ``record_root_session_callback`` is loaded from
+    the session service instead.
+
+    The stored session is loaded whole: turns span a variable number of events, so
+    neither a turn window nor the absolute turn indices can be computed from its
+    most recent events alone.
+    """
+
+    session_id = (
+        tool_context.state.get(ROOT_SESSION_ID_STATE_KEY) or tool_context.session.id
+    )
+    if session_id == tool_context.session.id and tool_context.session.events:
+        return tool_context.session.events
+
+    session = await (session_service or _get_default_session_service()).get_session(
+        app_name=get_settings().APP_NAME,
+        user_id=tool_context.user_id,
+        session_id=session_id,
+    )
+    return session.events if session is not None else []
+
+
+def _event_text(event: Event) -> str:
+    """Return the text of an event, or an empty string for calls and empty events."""
+
+    if not event.content or not event.content.parts:
+        return ""
+    return "".join(
+        part.text for part in event.content.parts if part.text and not part.thought
+    )
+
+
+def _split_turns(events: list[Event]) -> list[list[tuple[int, Event]]]:
+    """
+    Group events into turns; a turn starts at each message of the user.
+
+    Args:
+        events (list[Event]): The session events, in order.
+
+    Returns:
+        list[list[tuple[int, Event]]]: The ``(event index, event)`` pairs of each
+            turn, in order. Events before the first user message form the first turn.
+    """
+
+    turns: list[list[tuple[int, Event]]] = []
+    for idx, event in enumerate(events):
+        if not turns or event.author == "user":
+            turns.append([])
+        turns[-1].append((idx, event))
+    return turns
+
+
+async def _extract_conversation(
+    tool_context: ToolContext,
+    last_n_turns: int = 0,
+    since_event_id: str = "",
+    session_service: Optional[BaseSessionService] = None,
+):
+    """
+    Extracts the conversation of the session, grouped by turn.
+
+    A turn is a message of the user and the agent messages answering it. Events
+    without text (tool calls and responses) are left out. The window arguments
+    limit the output so the whole history does not have to be serialized every
+    time; turn indices are absolute, so windowed results stay comparable.
 
     Args:
         tool_context (ToolContext): Context providing access to the session object.
+        last_n_turns (int): If positive, only return the last N turns.
+        since_event_id (str): If set, only return the messages after this event ID.
+        session_service (Optional[BaseSessionService]): Source of events when the
+            in-memory session is empty or not the top-level one (a shared service
+            over the configured database when None).
 
     Returns:
         dict: Dictionary with the extraction result:
             - On success:
                 {
                     "status": "success",
-                    "session_events": [
-                        {"author": "author_name", "text": "event_text"}, ...
+                    "conversation": [
+                        {"turn-<idx>": [{"author": "author_name", "text": "event_text"}, ...]},
+                        ...
                     ]
                 }
             - On error:
@@ -64,36 +204,39 @@ async def _extract_conversation(tool_context: ToolContext):
                 }
     """
 
-    settings = get_settings()
-    db_url = f"sqlite+aiosqlite:///{settings.SQLITE_DB_PATH}"
-    session_service = DatabaseSessionService(db_url=db_url)
-    session = await session_service.get_session(
-        app_name=settings.APP_NAME,
-        user_id=tool_context.user_id,
-        session_id=tool_context.session.id,
-    )
-    session_events = None
-    if session is not None:
-        session_events = session.events
-    author = "unknown"
-    text = "no text"
-    conversation = []
-    if session_events is not None:
-        for idx, event in enumerate(session_events):
-            if event.author:
-                author = event.author
-
-            if event.content and event.content.parts:
-                if (
-                    event.content.parts[0].text != "None"
-                    and event.content.parts[0].text
-                ):
-                    text = event.content.parts[0].text
+    session_events = await _load_events(tool_context, session_service)
+    if not session_events:
+        return {"status": "error", "error_message": "No events found in the session."}
+
+    first_event_idx = 0
+    if since_event_id:
+        position = next(
+            (
+                idx
+                for idx, event in enumerate(session_events)
+                if event.id == since_event_id
+            ),
+            None,
+        )
+        if position is None:
+            return {
+                "status": "error",
+                "error_message": f"Event {since_event_id} not found in the session.",
+            }
+        first_event_idx = position + 1
 
-            conversation.append({f"turn-{idx}": {"author": author, "text": text}})
+    conversation = []
+    for turn_idx, turn in enumerate(_split_turns(session_events)):
+        messages = [
+            {"author": event.author or "unknown", "text": text}
+            for idx, event in turn
+            if idx >= first_event_idx and (text := _event_text(event))
+        ]
+        if messages:
+            conversation.append({f"turn-{turn_idx}": messages})
+    if last_n_turns > 0:
+        conversation = conversation[-last_n_turns:]
 
-    if not session_events:
-        return {"status": "error", "eror_message": "No events found in the session."}
     return {"status": "success", "conversation": conversation}
 
 
@@ -30,7 +30,8 @@ excalidraw_tool = McpToolset(
                 "EXPRESS_SERVER_URL": "http://localhost:3000",
                 "ENABLE_CANVAS_SYNC": "true",
             },
-        )
+        ),
+        timeout=app_settings.MCP_TIMEOUT,
     )
 )
 
@@ -0,0 +1,204 @@
+"""Obsidian Filesystem Tool Module."""
+
+import os
+from typing import Any, Optional
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.function_tool import FunctionTool
+from stores.vault import FilesystemVault
+
+
+class ObsidianFilesystemToolset(BaseToolset):
+    """
+    Drop-in replacement for the ``mcp/obsidian`` toolset working directly on a
+    locally mounted vault. Tool names and arguments mirror the MCP server's, so the
+    agent instructions work with either backend.
+
+    Attributes:
+        vault (FilesystemVault): The sandboxed vault backend.
+    """
+
+    def __init__(self, vault_path: str):
+        """
+        Initialize the ObsidianFilesystemToolset.
+
+        Args:
+            vault_path (str): Absolute path of the vault's root directory.
+        """
+
+        super().__init__()
+        self.vault = FilesystemVault(vault_path)
+        self._tools = [
+            FunctionTool(func=method)
+            for method in (
+                self.obsidian_list_files_in_vault,
+                self.obsidian_list_files_in_dir,
+                self.obsidian_get_file_contents,
+                self.obsidian_batch_get_file_contents,
+                self.obsidian_simple_search,
+                self.obsidian_append_content,
+                self.obsidian_patch_content,
+                self.obsidian_delete_file,
+            )
+        ]
+
+    async def get_tools(
+        self, readonly_context: Optional[ReadonlyContext] = None
+    ) -> list[BaseTool]:
+        """Return the vault tools."""
+
+        return [
+            tool
+            for tool in self._tools
+            if self._is_tool_selected(tool, readonly_context)
+        ]
+
+    @staticmethod
+    def _error(exc: Exception) -> dict[str, Any]:
+        """Turn a backend error into a tool error result."""
+
+        return {"status": "error", "error_message": f"{type(exc).__name__}: {exc}"}
+
+    async def obsidian_list_files_in_vault(self) -> dict[str, Any]:
+        """Lists all files and directories in the root directory of the Obsidian vault."""
+
+        try:
+            return {"status": "success", "files": await self.vault.list_files()}
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_list_files_in_dir(self, dirpath: str) -> dict[str, Any]:
+        """
+        Lists all files and directories that exist in a specific Obsidian directory.
+
+        Args:
+            dirpath (str): Path to list files from (relative to the vault root).
+        """
+
+        try:
+            return {"status": "success", "files": await self.vault.list_files(dirpath)}
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_get_file_contents(self, filepath: str) -> dict[str, Any]:
+        """
+        Return the content of a single file in the vault.
+
+        Args:
+            filepath (str): Path to the file (relative to the vault root).
+        """
+
+        try:
+            return {
+                "status": "success",
+                "content": await self.vault.read_file(filepath),
+            }
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_batch_get_file_contents(
+        self, filepaths: list[str]
+    ) -> dict[str, Any]:
+        """
+        Return the contents of several files in the vault.
+
+        Args:
+            filepaths (list[str]): Paths of the files (relative to the vault root).
+        """
+
+        try:
+            return {
+                "status": "success",
+                "contents": await self.vault.read_files(filepaths),
+            }
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_simple_search(
+        self, query: str, context_length: int = 100
+    ) -> dict[str, Any]:
+        """
+        Simple search for documents matching a specified text query across all files in the vault.
+
+        Args:
+            query (str): Text to search for in the vault.
+            context_length (int): How much context to return around the matching string.
+        """
+
+        try:
+            return {
+                "status": "success",
+                "results": await self.vault.search(query, context_length),
+            }
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_append_content(
+        self, filepath: str, content: str
+    ) -> dict[str, Any]:
+        """
+        Append content to a new or existing file in the vault.
+
+        Args:
+            filepath (str): Path to the file (relative to the vault root).
+            content (str): Content to append to the file.
+        """
+
+        try:
+            await self.vault.append(filepath, content)
+            return {"status": "success", "filepath": filepath}
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_patch_content(
+        self, filepath: str, operation: str, target_type: str, target: str, content: str
+    ) -> dict[str, Any]:
+        """
+        Insert content into an existing note relative to a heading, block reference, or frontmatter field.
+
+        Args:
+            filepath (str): Path to the file (relative to the vault root).
+            operation (str): Operation to perform (append, prepend, or replace).
+            target_type (str): Type of target to patch (heading, block, or frontmatter).
+            target (str): Target identifier (heading path like "Heading::Sub-heading",
+                block reference, or frontmatter field).
+            content (str): Content to insert.
+        """
+
+        try:
+            await self.vault.patch(filepath, operation, target_type, target, content)  # type: ignore
+            return {"status": "success", "filepath": filepath}
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+    async def obsidian_delete_file(
+        self, filepath: str, confirm: bool
+    ) -> dict[str, Any]:
+        """
+        Delete a file or directory from the vault.
+
+        Args:
+            filepath (str): Path to the file or directory to delete (relative to the vault root).
+            confirm (bool): Confirmation to delete the file (must be true).
+        """
+
+        if not confirm:
+            return {
+                "status": "error",
+                "error_message": "confirm must be true to delete a file.",
+            }
+        try:
+            await self.vault.delete(filepath)
+            return {"status": "success", "filepath": filepath}
+        except (OSError, ValueError) as exc:
+            return self._error(exc)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)")
+
+
+if __name__ == "__main__":
+    main()
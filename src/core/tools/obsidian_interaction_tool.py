@@ -1,44 +1,66 @@
 """Obsidian Interaction Tool Module."""
+
 import os
 from google.adk.tools.mcp_tool import McpToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
 from mcp import StdioServerParameters
+from core.tools.obsidian_filesystem_tool import ObsidianFilesystemToolset
+from core.tools.write_coalescing_toolset import CoalescingToolset, WriteBuffer
+from stores.mcp.stub_server import stub_connection_params
 from utils.config_utils import get_settings
 
 
 app_settings = get_settings()
 
-obsidian_tool = McpToolset(
-            connection_params=StdioConnectionParams(
-                server_params=StdioServerParameters(
-                    command="docker",
-                    args=[
-                        "run",
-                        "-i",
-                        "--rm",
-                        "-e",
-                        "OBSIDIAN_HOST",
-                        "-e",
-                        "OBSIDIAN_API_KEY",
-                        "mcp/obsidian",
-                    ],
-                    env={
-                        "OBSIDIAN_HOST": "host.docker.internal",
-                        "OBSIDIAN_API_KEY": str(
-                            app_settings.OBSIDIAN_API_KEY.get_secret_value()  # pylint: disable=[E1101]
-                        ),
-                    },
-                )
-            )
+if app_settings.OBSIDIAN_BACKEND == "filesystem":
+    if not app_settings.VAULT_PATH:
+        raise ValueError("OBSIDIAN_BACKEND is `filesystem` but VAULT_PATH is not set.")
+    obsidian_tool = ObsidianFilesystemToolset(vault_path=app_settings.VAULT_PATH)
+else:
+    if app_settings.MCP_USE_STUB_SERVER:
+        obsidian_connection_params = stub_connection_params(
+            latency=app_settings.MCP_STUB_LATENCY
+        )
+    else:
+        obsidian_connection_params = StdioConnectionParams(
+            server_params=StdioServerParameters(
+                command="docker",
+                args=[
+                    "run",
+                    "-i",
+                    "--rm",
+                    "-e",
+                    "OBSIDIAN_HOST",
+                    "-e",
+                    "OBSIDIAN_API_KEY",
+                    "mcp/obsidian",
+                ],
+                env={
+                    "OBSIDIAN_HOST": "host.docker.internal",
+                    "OBSIDIAN_API_KEY": str(
+                        app_settings.OBSIDIAN_API_KEY.get_secret_value()  # pylint: disable=[E1101]
+                    ),
+                },
+            ),
+            timeout=app_settings.MCP_TIMEOUT,
         )
+    obsidian_tool = McpToolset(connection_params=obsidian_connection_params)
+
+# Agents use the buffered toolset; the raw one is what the MCP pool manages.
+obsidian_write_buffer = None
+buffered_obsidian_tool = obsidian_tool
+if app_settings.WRITE_COALESCE_MODE != "off":
+    obsidian_write_buffer = WriteBuffer(
+        mode=app_settings.WRITE_COALESCE_MODE,
+        window=app_settings.WRITE_COALESCE_WINDOW,
+        max_age=app_settings.WRITE_COALESCE_MAX_AGE,
+    )
+    buffered_obsidian_tool = CoalescingToolset(obsidian_tool, obsidian_write_buffer)
 
 
 def main():
     """Entry Point for the Program."""
-    print(
-        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)"
-    )
-
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,267 @@
+"""
+Parallel Dispatch Tool Module.
+
+Runs independent sub-agent calls of the root agent concurrently:
+
+- ``BoundedAgentTool`` is an ``AgentTool`` that holds a slot of a shared
+  ``ConcurrencyLimit`` while it runs, so the function calls of one model turn
+  (which ADK already runs as concurrent tasks and merges in call order) never
+  exceed the concurrency cap.
+- ``ParallelDispatchTool`` (``run_in_parallel``) takes a planned list of
+  ``{"agent", "request"}`` tasks, runs them with ``asyncio.gather`` under the same
+  cap and returns one result per task, in task order. A failing task reports its
+  error without cancelling the others. Each task runs with its own tool context,
+  and the state it writes is stored under ``<key>:<task index>`` so that tasks
+  writing the same output key (e.g. ``video_transcript``) do not overwrite each
+  other.
+
+Wall-clock latency of a fan-out is then close to its slowest branch instead of
+the sum of all branches.
+"""
+
+import os
+import time
+import asyncio
+import weakref
+from typing import Any, Optional
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+PARALLEL_DISPATCH_TOOL_NAME = "run_in_parallel"
+
+
+class ConcurrencyLimit:
+    """
+    A concurrency cap shared by several tools.
+
+    Semaphores are bound to an event loop, so one is created lazily per running
+    loop; the tools are built at import time, before any loop exists.
+
+    Attributes:
+        limit (int): Maximum number of concurrent runs.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize the ConcurrencyLimit.
+
+        Args:
+            limit (int): Maximum number of concurrent runs (at least 1).
+        """
+
+        self.limit = max(1, limit)
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore of the running event loop."""
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+
+class BoundedAgentTool(AgentTool):
+    """
+    An ``AgentTool`` whose runs are limited by a cap shared with its siblings.
+
+    Attributes:
+        concurrency (ConcurrencyLimit): Caps the concurrent sub-agent runs.
+    """
+
+    def __init__(self, agent: BaseAgent, concurrency: ConcurrencyLimit, **kwargs: Any):
+        """
+        Initialize the BoundedAgentTool.
+
+        Args:
+            agent (BaseAgent): The wrapped sub-agent.
+            concurrency (ConcurrencyLimit): Caps the concurrent sub-agent runs.
+            **kwargs: Passed to ``AgentTool``.
+        """
+
+        super().__init__(agent, **kwargs)
+        self.concurrency = concurrency
+
+    async def run_async(
+        self, *, args: dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        """Run the sub-agent once a concurrency slot is free."""
+
+        async with self.concurrency.semaphore():
+            return await super().run_async(args=args, tool_context=tool_context)
+
+
+class ParallelDispatchTool(BaseTool):
+    """
+    Fans a list of independent sub-agent requests out concurrently.
+
+    Attributes:
+        tools (dict[str, AgentTool]): The sub-agent tools, by name.
+    """
+
+    def __init__(self, tools: list[AgentTool]):
+        """
+        Initialize the ParallelDispatchTool.
+
+        Args:
+            tools (list[AgentTool]): The sub-agent tools that may be dispatched to;
+                use ``BoundedAgentTool`` to cap the concurrency.
+        """
+
+        super().__init__(
+            name=PARALLEL_DISPATCH_TOOL_NAME,
+            description=(
+                "Run several independent sub-agent requests at the same time. "
+                "Each task names the sub-agent tool and the request to send it; "
+                "the results are returned in the order of the tasks."
+            ),
+        )
+        self.tools = {tool.name: tool for tool in tools}
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        return types.FunctionDeclaration(
+            name=self.name,
+            description=self.description,
+            parameters=types.Schema(
+                type=types.Type.OBJECT,
+                properties={
+                    "tasks": types.Schema(
+                        type=types.Type.ARRAY,
+                        description="The independent sub-tasks to run.",
+                        items=types.Schema(
+                            type=types.Type.OBJECT,
+                            properties={
+                                "agent": types.Schema(
+                                    type=types.Type.STRING,
+                                    enum=list(self.tools),
+                                    description="Name of the sub-agent tool.",
+                                ),
+                                "request": types.Schema(
+                                    type=types.Type.STRING,
+                                    description="The request sent to the sub-agent.",
+                                ),
+                            },
+                            required=["agent", "request"],
+                        ),
+                    )
+                },
+                required=["tasks"],
+            ),
+        )
+
+    async def _run_task(
+        self, index: int, task: dict[str, Any], tool_context: ToolContext
+    ) -> dict[str, Any]:
+        """Run one task and wrap its outcome."""
+
+        agent_name = str(task.get("agent", ""))
+        request = str(task.get("request", ""))
+        outcome: dict[str, Any] = {"task": index, "agent": agent_name}
+        tool = self.tools.get(agent_name)
+        if tool is None:
+            return {
+                **outcome,
+                "status": "error",
+                "error_message": f"Unknown agent `{agent_name}`; expected one of {list(self.tools)}.",
+            }
+        # A context of its own, so the task neither sees nor overwrites the state
+        # written by its siblings.
+        task_context = ToolContext(
+            tool_context._invocation_context,  # pylint: disable=[W0212]
+            function_call_id=tool_context.function_call_id,
+        )
+        started = time.perf_counter()
+        try:
+            result = await tool.run_async(
+                args={"request": request}, tool_context=task_context
+            )
+        except Exception as exc:  # pylint: disable=[W0718]
+            logger.error("Parallel task %d (%s) failed: %s", index, agent_name, exc)
+            return {
+                **outcome,
+                "status": "error",
+                "error_message": f"{type(exc).__name__}: {exc}",
+            }
+        finally:
+            self._merge_actions(index, task_context, tool_context)
+        logger.info(
+            "Parallel task %d (%s) finished in %.2fs",
+            index,
+            agent_name,
+            time.perf_counter() - started,
+        )
+        return {**outcome, "status": "success", "result": result}
+
+    @staticmethod
+    def _merge_actions(
+        index: int, task_context: ToolContext, tool_context: ToolContext
+    ):
+        """Copy the state (keyed by task) and artifacts a task wrote to the shared context."""
+
+        actions = task_context.actions
+        for key, value in actions.state_delta.items():
+            tool_context.state[f"{key}:{index}"] = value
+        tool_context.actions.artifact_delta.update(actions.artifact_delta)
+        if actions.skip_summarization:
+            tool_context.actions.skip_summarization = True
+
+    async def run_async(
+        self, *, args: dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        """
+        Run the tasks concurrently.
+
+        Returns:
+            dict: ``{"status", "results"}`` with one result per task, in task order.
+        """
+
+        tasks = args.get("tasks") or []
+        if not isinstance(tasks, list) or not all(
+            isinstance(task, dict) for task in tasks
+        ):
+            return {
+                "status": "error",
+                "error_message": "`tasks` must be a list of {agent, request} objects.",
+            }
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self._run_task(index, task, tool_context)
+                for index, task in enumerate(tasks)
+            )
+        )
+        logger.info(
+            "Ran %d parallel tasks in %.2fs (invocation=%s)",
+            len(tasks),
+            time.perf_counter() - started,
+            tool_context.invocation_id,
+        )
+        failed = sum(result["status"] == "error" for result in results)
+        return {
+            "status": "error" if tasks and failed == len(tasks) else "success",
+            "results": results,
+        }
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
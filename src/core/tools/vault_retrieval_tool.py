@@ -0,0 +1,68 @@
+"""Vault Retrieval Tool Module."""
+
+import os
+import asyncio
+from typing import Any
+import litellm
+from google.adk.tools.function_tool import FunctionTool
+from stores.vault.vector_index import get_vector_index
+from utils.config_utils import get_settings
+
+
+def _retrieve(index, query: str, top_k: int) -> list[dict[str, Any]]:
+    """Search the index and keep the best passages that fit in the token budget."""
+
+    settings = get_settings()
+    passages, used_tokens = [], 0
+    for passage in index.search(query, top_k=top_k):
+        tokens = litellm.token_counter(
+            model=settings.CHAT_MODEL_NAME, text=passage["text"]
+        )
+        if used_tokens + tokens > settings.RETRIEVAL_TOKEN_BUDGET:
+            break
+        passages.append(passage)
+        used_tokens += tokens
+    return passages
+
+
+async def retrieve_notes(query: str, top_k: int = 0) -> dict[str, Any]:
+    """
+    Retrieve the passages of the user's own Obsidian notes most relevant to a question.
+
+    Use this before searching the web whenever the question may be answered by the
+    user's notes.
+
+    Args:
+        query (str): The question or topic to look up.
+        top_k (int): Maximum number of passages (0 uses the configured default).
+
+    Returns:
+        dict: Result dictionary containing either:
+            - success: {"status": "success", "passages": [{"path", "heading", "text", "score"}, ...]}
+            - error: {"status": "error", "error_message": "..."}
+    """
+
+    # Loading the index, embedding the query and counting tokens are blocking:
+    # keep them off the event loop.
+    index = await asyncio.to_thread(get_vector_index)
+    if index is None:
+        return {
+            "status": "error",
+            "error_message": "The local notes index is not configured.",
+        }
+
+    top_k = top_k if top_k > 0 else get_settings().RETRIEVAL_TOP_K
+    passages = await asyncio.to_thread(_retrieve, index, query, top_k)
+    return {"status": "success", "passages": passages}
+
+
+vault_retrieval_tool = FunctionTool(func=retrieve_notes)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Vault Search Tool Module."""
+
+import os
+import asyncio
+from typing import Any
+from google.adk.tools.function_tool import FunctionTool
+from stores.vault import get_vault_index
+
+
+async def search_vault(query: str, limit: int = 10) -> dict[str, Any]:
+    """
+    Search the user's Obsidian vault notes by keywords (local BM25 full-text index).
+
+    Use this to find notes about a topic before reading or editing them.
+
+    Args:
+        query (str): Keywords to search for.
+        limit (int): Maximum number of notes to return.
+
+    Returns:
+        dict: Result dictionary containing either:
+            - success: {"status": "success", "results": [{"path", "score", "snippet"}, ...]}
+            - error: {"status": "error", "error_message": "..."}
+    """
+
+    # Loading the index and ranking are blocking: keep them off the event loop.
+    index = await asyncio.to_thread(get_vault_index)
+    if index is None:
+        return {
+            "status": "error",
+            "error_message": "The local vault index is not configured.",
+        }
+    results = await asyncio.to_thread(index.search, query, limit=max(1, min(limit, 50)))
+    return {"status": "success", "results": results}
+
+
+vault_search_tool = FunctionTool(func=search_vault)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)")
+
+
+if __name__ == "__main__":
+    main()
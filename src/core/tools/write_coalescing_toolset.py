@@ -0,0 +1,513 @@
+"""
+Write Coalescing Toolset Module.
+
+Wraps an Obsidian toolset (MCP or filesystem) so that the appends and patches an
+agent issues against the same note are buffered and flushed as a single write:
+
+- ``invocation`` mode (the default): writes return ``queued`` immediately and
+  are flushed when the agent finishes (``WriteBuffer.after_agent_callback``), so
+  the appends of several model turns become one write; failures replace the
+  agent's answer so the calling agent learns about them. When the invocation
+  fails instead (a model or tool error), its queued writes are dropped
+  (``WriteBuffer.on_model_error_callback``/``on_tool_error_callback``), and
+  batches left behind by runs that ended without any callback (a cancelled
+  request) are dropped once older than ``max_age`` seconds.
+- ``window`` mode: writes to a path within ``window`` seconds are merged; every
+  caller waits for the merged write and gets its real outcome.
+
+Any other tool call first flushes the pending writes it could observe: those of
+the paths it names, or all of them when it names none (searches, listings), so
+reads never see a note without its queued writes.
+"""
+
+import os
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Literal, Optional
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.tool_context import ToolContext
+from google.genai.types import Content, Part
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+APPEND_TOOL_NAME = "obsidian_append_content"
+PATCH_TOOL_NAME = "obsidian_patch_content"
+
+
+@dataclass
+class _WriteOp:
+    """A buffered append or patch."""
+
+    tool: BaseTool
+    args: dict[str, Any]
+    tool_context: ToolContext
+
+
+@dataclass
+class _Batch:
+    """The buffered writes of one path, and the future of their flush."""
+
+    ops: list[_WriteOp] = field(default_factory=list)
+    done: Optional[asyncio.Future] = None
+    created: float = field(default_factory=time.monotonic)
+
+
+def _is_error(result: Any) -> bool:
+    """Whether an MCP (``isError``) or function tool (``status``) result is a failure."""
+
+    return isinstance(result, dict) and (
+        bool(result.get("isError"))
+        or result.get("status") == "error"
+        or bool(result.get("error"))
+    )
+
+
+def coalesce(ops: list[_WriteOp]) -> list[_WriteOp]:
+    """
+    Merge consecutive writes that can be applied as one.
+
+    Runs of appends are joined; runs of patches on the same target with the same
+    ``append``/``prepend`` operation are joined (in application order); for runs of
+    ``replace`` patches on the same target only the last one is kept.
+
+    Args:
+        ops (list[_WriteOp]): Writes of a single path, in call order.
+
+    Returns:
+        list[_WriteOp]: The equivalent, shorter list of writes.
+    """
+
+    merged: list[_WriteOp] = []
+    for op in ops:
+        previous = merged[-1] if merged else None
+        if previous is not None and previous.tool.name == op.tool.name:
+            if op.tool.name == APPEND_TOOL_NAME:
+                previous.args = {
+                    **previous.args,
+                    "content": f"{previous.args['content']}\n{op.args['content']}",
+                }
+                previous.tool_context = op.tool_context
+                continue
+            keys = ("operation", "target_type", "target")
+            if all(previous.args.get(key) == op.args.get(key) for key in keys):
+                operation = op.args.get("operation")
+                if operation == "append":
+                    content = f"{previous.args['content']}\n{op.args['content']}"
+                elif operation == "prepend":
+                    content = f"{op.args['content']}\n{previous.args['content']}"
+                else:
+                    content = op.args["content"]
+                previous.args = {**previous.args, "content": content}
+                previous.tool_context = op.tool_context
+                continue
+        merged.append(_WriteOp(op.tool, dict(op.args), op.tool_context))
+    return merged
+
+
+class WriteBuffer:
+    """
+    Per-path buffer of note writes.
+
+    Attributes:
+        mode (str): ``window`` or ``invocation``.
+        window (float): Coalescing window of the ``window`` mode, in seconds.
+        max_age (float): Age, in seconds, after which an ``invocation`` batch whose
+            flush never came is dropped.
+        writes_requested (int): Number of buffered writes.
+        writes_flushed (int): Number of writes actually issued.
+        writes_dropped (int): Number of writes dropped with their failed invocation.
+    """
+
+    def __init__(
+        self,
+        mode: Literal["window", "invocation"] = "invocation",
+        window: float = 0.25,
+        max_age: float = 300.0,
+    ):
+        """
+        Initialize the WriteBuffer.
+
+        Args:
+            mode (str): ``window`` or ``invocation``.
+            window (float): Coalescing window of the ``window`` mode, in seconds.
+            max_age (float): Age, in seconds, after which an ``invocation`` batch
+                whose flush never came is dropped.
+        """
+
+        self.mode = mode
+        self.window = window
+        self.max_age = max_age
+        self.writes_requested = 0
+        self.writes_flushed = 0
+        self.writes_dropped = 0
+        # (scope, path) -> batch; scope is the invocation id in "invocation" mode.
+        self._batches: dict[tuple[str, str], _Batch] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, op: _WriteOp) -> Any:
+        """
+        Buffer a write.
+
+        Returns:
+            Any: The outcome of the merged write (``window`` mode), or a ``queued``
+                acknowledgement (``invocation`` mode).
+        """
+
+        path = str(op.args.get("filepath", ""))
+        key = (self._scope(op.tool_context), path)
+        self.writes_requested += 1
+        if self.mode == "invocation":
+            self._drop_stale(key[0])
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(
+                done=asyncio.get_running_loop().create_future()
+            )
+            if self.mode == "window":
+                task = asyncio.create_task(self._flush_later(key))
+                self._flush_tasks.add(task)
+                task.add_done_callback(self._flush_tasks.discard)
+        batch.ops.append(op)
+
+        if self.mode == "invocation":
+            return {"status": "queued", "filepath": path}
+        return await asyncio.shield(batch.done)  # type: ignore
+
+    def _scope(self, tool_context: ToolContext) -> str:
+        """Return the batch scope of a call: its invocation in ``invocation`` mode."""
+
+        return tool_context.invocation_id if self.mode == "invocation" else ""
+
+    async def flush_paths(
+        self, tool_context: ToolContext, paths: Optional[list[str]]
+    ) -> list[str]:
+        """
+        Flush the pending writes a call could observe, before it runs.
+
+        Args:
+            tool_context (ToolContext): The context of the call.
+            paths (Optional[list[str]]): The paths the call touches, or None to
+                flush every pending write of its scope.
+
+        Returns:
+            list[str]: The error messages of the failed writes.
+        """
+
+        scope = self._scope(tool_context)
+        keys = [
+            key
+            for key in self._batches
+            if key[0] == scope and (paths is None or key[1] in paths)
+        ]
+        if not keys:
+            return []
+        errors = await asyncio.gather(*(self._flush(key) for key in keys))
+        return [error for error in errors if error]
+
+    async def _flush_later(self, key: tuple[str, str]):
+        """Flush a batch once its window is over."""
+
+        await asyncio.sleep(self.window)
+        await self._flush(key)
+
+    async def _flush(self, key: tuple[str, str]) -> Optional[str]:
+        """
+        Issue the merged writes of a batch.
+
+        Returns:
+            Optional[str]: An error message if a write failed, else None.
+        """
+
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return None
+
+        error = None
+        for op in coalesce(batch.ops):
+            self.writes_flushed += 1
+            try:
+                result = await op.tool.run_async(
+                    args=op.args, tool_context=op.tool_context
+                )
+            except Exception as exc:  # pylint: disable=[W0718]
+                result = {
+                    "status": "error",
+                    "error_message": f"{type(exc).__name__}: {exc}",
+                }
+            if _is_error(result):
+                error = f"Writing `{key[1]}` failed: {result}"
+                logger.error(error)
+                break
+        else:
+            result = {"status": "success", "filepath": key[1], "writes": len(batch.ops)}
+
+        if batch.done is not None and not batch.done.done():
+            batch.done.set_result(
+                {"status": "error", "error_message": error} if error else result
+            )
+        return error
+
+    def drop_scope(self, scope: str) -> int:
+        """
+        Drop the pending batches of a scope without writing them.
+
+        Returns:
+            int: The number of dropped writes.
+        """
+
+        keys = [key for key in self._batches if key[0] == scope]
+        dropped = 0
+        for key in keys:
+            batch = self._batches.pop(key)
+            dropped += len(batch.ops)
+            if batch.done is not None and not batch.done.done():
+                batch.done.set_result(
+                    {
+                        "status": "error",
+                        "error_message": f"Writing `{key[1]}` was cancelled.",
+                    }
+                )
+        if dropped:
+            self.writes_dropped += dropped
+            logger.warning(
+                f"Dropped {dropped} queued write(s) of the failed invocation `{scope}`."
+            )
+        return dropped
+
+    def _drop_stale(self, current_scope: str):
+        """Drop the scopes (other than the current one) older than ``max_age``."""
+
+        deadline = time.monotonic() - self.max_age
+        stale = {
+            scope
+            for (scope, _), batch in self._batches.items()
+            if scope != current_scope and batch.created < deadline
+        }
+        for scope in stale:
+            self.drop_scope(scope)
+
+    async def flush_scope(self, scope: str) -> list[str]:
+        """Flush every batch of a scope and return the error messages."""
+
+        keys = [key for key in self._batches if key[0] == scope]
+        errors = await asyncio.gather(*(self._flush(key) for key in keys))
+        return [error for error in errors if error]
+
+    async def flush_all(self) -> list[str]:
+        """Flush every pending batch (used on shutdown) and return the error messages."""
+
+        keys = list(self._batches)
+        errors = await asyncio.gather(*(self._flush(key) for key in keys))
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        return [error for error in errors if error]
+
+    async def after_agent_callback(
+        self, callback_context: CallbackContext
+    ) -> Optional[Content]:
+        """
+        Flush the writes of the finishing invocation (``invocation`` mode).
+
+        Returns:
+            Optional[Content]: A failure report that replaces the agent's answer when
+                a write failed, else None.
+        """
+
+        if self.mode != "invocation":
+            return None
+        errors = await self.flush_scope(callback_context.invocation_id)
+        if not errors:
+            return None
+        return Content(
+            role="model",
+            parts=[
+                Part(
+                    text="Some note writes failed and were not saved:\n"
+                    + "\n".join(errors)
+                )
+            ],
+        )
+
+    def on_model_error_callback(
+        self,
+        callback_context: CallbackContext,
+        llm_request: LlmRequest,
+        error: Exception,
+    ) -> None:
+        """
+        Drop the writes of an invocation whose model call failed (``invocation`` mode).
+
+        Must come last in the agent's callbacks: it only runs, and the invocation only
+        fails, when the callbacks before it did not recover from the error.
+        """
+
+        del llm_request, error
+        if self.mode == "invocation":
+            self.drop_scope(callback_context.invocation_id)
+
+    def on_tool_error_callback(
+        self,
+        tool: BaseTool,
+        args: dict[str, Any],
+        tool_context: ToolContext,
+        error: Exception,
+    ) -> None:
+        """
+        Drop the writes of an invocation whose tool call failed (``invocation`` mode).
+
+        Must come last in the agent's callbacks, as ``on_model_error_callback``.
+        """
+
+        del tool, args, error
+        if self.mode == "invocation":
+            self.drop_scope(tool_context.invocation_id)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of requested, issued and dropped writes and the pending batches."""
+
+        return {
+            "writes_requested": self.writes_requested,
+            "writes_flushed": self.writes_flushed,
+            "writes_dropped": self.writes_dropped,
+            "pending_batches": len(self._batches),
+        }
+
+
+class _BufferedWriteTool(BaseTool):
+    """Routes an append/patch tool through the write buffer."""
+
+    def __init__(self, tool: BaseTool, buffer: WriteBuffer):
+        """
+        Initialize the _BufferedWriteTool.
+
+        Args:
+            tool (BaseTool): The wrapped append or patch tool.
+            buffer (WriteBuffer): The write buffer.
+        """
+
+        super().__init__(name=tool.name, description=tool.description)
+        self._tool = tool
+        self._buffer = buffer
+
+    def _get_declaration(self):
+        """Return the declaration of the wrapped tool."""
+
+        return self._tool._get_declaration()  # pylint: disable=[W0212]
+
+    async def run_async(
+        self, *, args: dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        """Buffer the write and return its outcome (or ``queued`` acknowledgement)."""
+
+        return await self._buffer.submit(_WriteOp(self._tool, args, tool_context))
+
+
+class _FlushingTool(BaseTool):
+    """Flushes the pending writes a non-write tool could observe before running it."""
+
+    def __init__(self, tool: BaseTool, buffer: WriteBuffer):
+        """
+        Initialize the _FlushingTool.
+
+        Args:
+            tool (BaseTool): The wrapped tool (a read, search, listing or delete).
+            buffer (WriteBuffer): The write buffer.
+        """
+
+        super().__init__(name=tool.name, description=tool.description)
+        self._tool = tool
+        self._buffer = buffer
+
+    def _get_declaration(self):
+        """Return the declaration of the wrapped tool."""
+
+        return self._tool._get_declaration()  # pylint: disable=[W0212]
+
+    async def run_async(
+        self, *, args: dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        """Flush the pending writes of the paths in ``args``, then run the tool."""
+
+        if "filepath" in args:
+            paths: Optional[list[str]] = [str(args["filepath"])]
+        elif "filepaths" in args:
+            paths = [str(path) for path in args["filepaths"] or []]
+        else:
+            paths = None
+        errors = await self._buffer.flush_paths(tool_context, paths)
+        if errors:
+            return {"status": "error", "error_message": "\n".join(errors)}
+        return await self._tool.run_async(args=args, tool_context=tool_context)
+
+
+class CoalescingToolset(BaseToolset):
+    """
+    Exposes the tools of an Obsidian toolset, with appends and patches buffered.
+
+    Attributes:
+        toolset (BaseToolset): The wrapped toolset.
+        buffer (WriteBuffer): The write buffer.
+    """
+
+    def __init__(self, toolset: BaseToolset, buffer: WriteBuffer):
+        """
+        Initialize the CoalescingToolset.
+
+        Args:
+            toolset (BaseToolset): The wrapped toolset.
+            buffer (WriteBuffer): The write buffer.
+        """
+
+        super().__init__()
+        self.toolset = toolset
+        self.buffer = buffer
+
+    async def get_tools(
+        self, readonly_context: Optional[ReadonlyContext] = None
+    ) -> list[BaseTool]:
+        """
+        Return the wrapped tools: writes go through the buffer, other tools flush it.
+
+        Args:
+            readonly_context (Optional[ReadonlyContext]): Context used to filter
+                the wrapped toolset's tools.
+
+        Returns:
+            list[BaseTool]: The wrapped tools.
+        """
+
+        return [
+            (
+                _BufferedWriteTool(tool, self.buffer)
+                if tool.name in (APPEND_TOOL_NAME, PATCH_TOOL_NAME)
+                else _FlushingTool(tool, self.buffer)
+            )
+            for tool in await self.toolset.get_tools(readonly_context)
+        ]
+
+    async def close(self):
+        """Close the wrapped toolset. Pending writes are left to their flush trigger."""
+
+        await self.toolset.close()
+
+
+def main():
+    """Entry Point for the Program."""
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,237 @@
-"""Obsidian Interaction Tool Module."""
+"""YouTube Transcript Tool Module."""
+
 import os
+import asyncio
+from typing import Any, Optional
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
 from google.adk.tools.mcp_tool import McpToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+from google.adk.tools.tool_context import ToolContext
 from mcp import StdioServerParameters
+from stores.mcp.stub_server import stub_connection_params
+from stores.youtube import canonical_video_id, get_transcript_cache
 from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+from utils.tracing_utils import tracer
 
 
 app_settings = get_settings()
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=app_settings.PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+TRANSCRIPT_TOOL_NAME = "get_transcript"
+
+if app_settings.MCP_USE_STUB_SERVER:
+    transcript_connection_params = stub_connection_params(
+        latency=app_settings.MCP_STUB_LATENCY
+    )
+else:
+    transcript_connection_params = StdioConnectionParams(
+        server_params=StdioServerParameters(
+            command="docker",
+            args=[
+                "run",
+                "-i",
+                "--rm",
+                "mcp/youtube-transcript",
+            ],
+        ),
+        timeout=app_settings.MCP_TIMEOUT,
+    )
+
+transcript_tool = McpToolset(connection_params=transcript_connection_params)
+
+
+def _result_text(result: Any) -> Optional[str]:
+    """Return the transcript text of a complete, successful MCP result, else None."""
+
+    if not isinstance(result, dict) or result.get("isError"):
+        return None
+    structured = result.get("structuredContent") or {}
+    if isinstance(structured, dict) and structured.get("next_cursor"):
+        # Only the first page of a long transcript: not worth caching as a whole.
+        return None
+    text = "\n".join(
+        part.get("text", "")
+        for part in result.get("content", [])
+        if part.get("type") == "text"
+    )
+    return text or None
+
+
+def _text_result(text: str) -> dict[str, Any]:
+    """Wrap a cached transcript like an MCP tool result."""
+
+    return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+async def _call_mcp(
+    tool: BaseTool, args: dict[str, Any], tool_context: Optional[ToolContext]
+) -> Any:
+    """Call an MCP tool inside its own span, apart from the cache lookups."""
+
+    with tracer.start_as_current_span(f"mcp.call_tool {tool.name}"):
+        return await tool.run_async(args=args, tool_context=tool_context)  # type: ignore
+
+
+async def _cached_call(
+    tool: BaseTool, args: dict[str, Any], tool_context: Optional[ToolContext]
+) -> tuple[Any, bool]:
+    """
+    Call the MCP transcript tool unless the transcript is cached, and cache new ones.
+
+    Returns:
+        tuple[Any, bool]: The tool result and whether it came from the cache.
+    """
+
+    cache = get_transcript_cache()
+    video_id = canonical_video_id(str(args.get("url", "")))
+    lang = str(args.get("lang") or "en")
+    if cache is None or video_id is None or args.get("next_cursor"):
+        return await _call_mcp(tool, args, tool_context), False
+
+    transcript = await asyncio.to_thread(cache.get, video_id, lang)
+    if transcript is not None:
+        logger.info("Transcript cache hit for %s (%s)", video_id, lang)
+        return _text_result(transcript), True
+
+    result = await _call_mcp(tool, args, tool_context)
+    text = _result_text(result)
+    if text is not None:
+        await asyncio.to_thread(cache.put, video_id, text, lang)
+    return result, False
+
+
+async def fetch_transcript(url: str, lang: str = "en") -> dict[str, Any]:
+    """
+    Return the transcript of a video, from the cache or through the MCP server.
+
+    Args:
+        url (str): The video URL (or ID).
+        lang (str): Language code of the transcript.
 
-transcript_tool = McpToolset(
-            connection_params=StdioConnectionParams(
-                server_params=StdioServerParameters(
-                    command="docker",
-                    args=[
-                        "run",
-                        "-i",
-                        "--rm",
-                        "mcp/youtube-transcript"
-                    ],
-                )
-            )
+    Returns:
+        dict: ``{"status": "success", "video_id", "transcript", "cached"}``, or
+            ``{"status": "error", "error_message"}``.
+    """
+
+    video_id = canonical_video_id(url)
+    if video_id is None:
+        return {"status": "error", "error_message": f"Not a YouTube video URL: {url}"}
+    with tracer.start_as_current_span("fetch_transcript") as span:
+        span.set_attribute("youtube.video_id", video_id)
+        span.set_attribute("youtube.lang", lang)
+        result = await _fetch_transcript(video_id, lang)
+        span.set_attribute("transcript.cached", bool(result.get("cached")))
+        return result
+
+
+async def _fetch_transcript(video_id: str, lang: str) -> dict[str, Any]:
+    """Fetch the transcript of a canonical video ID (see ``fetch_transcript``)."""
+
+    # Check the cache before listing the tools, which starts the MCP server.
+    cache = get_transcript_cache()
+    transcript = await asyncio.to_thread(cache.get, video_id, lang) if cache else None
+    if transcript is not None:
+        return {
+            "status": "success",
+            "video_id": video_id,
+            "transcript": transcript,
+            "cached": True,
+        }
+
+    try:
+        # Listing the tools starts the MCP server, which may fail (no docker, timeout).
+        tools = {tool.name: tool for tool in await transcript_tool.get_tools()}
+        tool = tools.get(TRANSCRIPT_TOOL_NAME)
+        if tool is None:
+            return {
+                "status": "error",
+                "error_message": f"The transcript server has no `{TRANSCRIPT_TOOL_NAME}` tool.",
+            }
+        # Checks the cache again, in case another caller stored the transcript meanwhile.
+        result, cached = await _cached_call(
+            tool,
+            {"url": f"https://www.youtube.com/watch?v={video_id}", "lang": lang},
+            None,
         )
+    except Exception as exc:  # pylint: disable=[W0718]
+        return {"status": "error", "error_message": f"{type(exc).__name__}: {exc}"}
+    text = _result_text(result)
+    if text is None:
+        return {"status": "error", "error_message": f"Transcript unavailable: {result}"}
+    return {
+        "status": "success",
+        "video_id": video_id,
+        "transcript": text,
+        "cached": cached,
+    }
+
+
+class _CachedTranscriptTool(BaseTool):
+    """Serves ``get_transcript`` calls from the transcript cache when possible."""
+
+    def __init__(self, tool: BaseTool):
+        super().__init__(name=tool.name, description=tool.description)
+        self._tool = tool
+
+    def _get_declaration(self):
+        return self._tool._get_declaration()  # pylint: disable=[W0212]
+
+    async def run_async(
+        self, *, args: dict[str, Any], tool_context: ToolContext
+    ) -> Any:
+        result, _ = await _cached_call(self._tool, args, tool_context)
+        return result
+
+
+class CachedTranscriptToolset(BaseToolset):
+    """
+    Exposes the tools of the transcript toolset, with ``get_transcript`` cached.
+
+    Attributes:
+        toolset (BaseToolset): The wrapped toolset.
+    """
+
+    def __init__(self, toolset: BaseToolset):
+        """
+        Initialize the CachedTranscriptToolset.
+
+        Args:
+            toolset (BaseToolset): The wrapped toolset.
+        """
+
+        super().__init__()
+        self.toolset = toolset
+
+    async def get_tools(
+        self, readonly_context: Optional[ReadonlyContext] = None
+    ) -> list[BaseTool]:
+        """Return the wrapped tools, with the transcript tool going through the cache."""
+
+        return [
+            _CachedTranscriptTool(tool) if tool.name == TRANSCRIPT_TOOL_NAME else tool
+            for tool in await self.toolset.get_tools(readonly_context)
+        ]
+
+    async def close(self):
+        """Close the wrapped toolset."""
+
+        await self.toolset.close()
+
+
+cached_transcript_tool = CachedTranscriptToolset(transcript_tool)
 
 
 def main():
     """Entry Point for the Program."""
-    print(
-        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)"
-    )
-
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. (❁´◡`❁)")
 
 
 if __name__ == "__main__":
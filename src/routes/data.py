@@ -2,7 +2,8 @@
 
 import os
 import logging
-from fastapi import APIRouter, Request, status
+from typing import Literal, Optional
+from fastapi import APIRouter, Request, status, Query
 from fastapi.responses import JSONResponse
 from controllers import SessionController
 
@@ -30,14 +31,7 @@ async def create_session(request: Request, user_id: str):
 
     app_state = request.app.state
     session_controller = SessionController(session_service=app_state.session_service)
-    session_id = await session_controller.generate_random_string(length=12)
-    while (
-        await session_controller.get_session(
-            app_name=app_state.settings.APP_NAME, user_id=user_id, session_id=session_id
-        )
-        is not None
-    ):
-        session_id = await session_controller.generate_random_string(length=12)
+    session_id = session_controller.generate_session_id()
     session = await session_controller.create_session(
         app_name=app_state.settings.APP_NAME, user_id=user_id, session_id=session_id
     )
@@ -99,32 +93,60 @@ async def get_session(session_id: str, user_id: str, request: Request):
 
 
 @data_router.get("/list_sessions/{user_id}")
-async def list_sessions(request: Request, user_id: str):
-    """Retrieve all sessions belonging to a specific user.
+async def list_sessions(
+    request: Request,
+    user_id: str,
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of sessions to return."
+    ),
+    offset: int = Query(0, ge=0, description="Number of sessions to skip."),
+    order: Literal["asc", "desc"] = Query(
+        "desc", description="Sort order of the last update time."
+    ),
+    include_title: bool = Query(
+        False, description="Include a snippet of the first user message."
+    ),
+):
+    """Retrieve the sessions belonging to a specific user as lightweight metadata.
+
+    Sessions are read straight from the storage layer; their events and state
+    are never loaded.
 
     Args:
         request (Request): The incoming FastAPI request object containing
             application state and configuration.
         user_id (str): The unique identifier of the user whose sessions
             should be listed.
+        limit (Optional[int]): Maximum number of sessions to return.
+        offset (int): Number of sessions to skip.
+        order (str): ``desc`` (most recently updated first) or ``asc``.
+        include_title (bool): Whether to include a title snippet per session.
 
     Returns:
         JSONResponse: A response containing:
             - ``signal``: Status of the operation
               (e.g., "list_sessions_success" or "no_sessions_found").
             - ``user_id``: The user ID associated with the retrieved sessions.
-            - ``number_of_sessions_found`` (optional): Count of retrieved sessions.
-            - ``sessions_ids`` (optional): List of session IDs associated
-              with the user.
+            - ``number_of_sessions_found`` (optional): Total count of the user's sessions.
+            - ``sessions_ids`` (optional): Session IDs of the returned page.
+            - ``sessions`` (optional): Per-session ``id``, ``last_update_time``,
+              ``event_count`` and, if requested, ``title``.
     """
 
-    print("Here")
     app_state = request.app.state
-    session_controller = SessionController(session_service=app_state.session_service)
-    sessions = await session_controller.list_sessions(
-        app_name=app_state.settings.APP_NAME, user_id=user_id
+    session_controller = SessionController(
+        session_service=app_state.session_service,
+        session_store=app_state.session_store,
+    )
+    summaries = await session_controller.list_session_summaries(
+        app_name=app_state.settings.APP_NAME,
+        user_id=user_id,
+        limit=limit,
+        offset=offset,
+        order=order,
+        include_title=include_title,
     )
-    if len(sessions) == 0:
+    if summaries["total"] == 0:
         return JSONResponse(
             content={"signal": "no_sessions_found"}, status_code=status.HTTP_200_OK
         )
@@ -133,8 +155,9 @@ async def list_sessions(request: Request, user_id: str):
         content={
             "signal": "list_sessions_success",
             "user_id": user_id,
-            "number_of_sessions_found": len(sessions),
-            "sessions_ids": [session.id for session in sessions],
+            "number_of_sessions_found": summaries["total"],
+            "sessions_ids": [session["id"] for session in summaries["sessions"]],
+            "sessions": summaries["sessions"],
         }
     )
 
@@ -203,7 +226,10 @@ async def delete_sessions(user_id: str, request: Request):
     app_state = request.app.state
     app_name = request.app.state.settings.APP_NAME
 
-    session_controller = SessionController(session_service=app_state.session_service)
+    session_controller = SessionController(
+        session_service=app_state.session_service,
+        session_store=app_state.session_store,
+    )
 
     ## Delete all user's sessions
     result = await session_controller.delete_sessions(
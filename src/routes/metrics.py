@@ -0,0 +1,36 @@
+"""Metrics Route Module."""
+
+import os
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from utils.metrics_utils import metrics_registry
+
+metrics_router = APIRouter(
+    tags=["metrics"],
+)
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Expose the agent, model and tool metrics for Prometheus to scrape.
+
+    Returns:
+        PlainTextResponse: The metrics in the Prometheus text exposition format.
+    """
+
+    return PlainTextResponse(
+        content=metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,69 @@
 """NLP Routes Module."""
 
 import os
+import json
 import logging
+from typing import Any, AsyncGenerator, Literal, Optional, Union
 from fastapi import APIRouter, Request, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from controllers import SessionController, NLPController
+from stores.memory import SqliteMemoryService
+from stores.llm.semantic_cache import get_semantic_cache
+from core.summarization import SummarizationError
+from core.tools.youtube_transcript_tool import fetch_transcript
 
 
 logger = logging.getLogger("uvicorn")
 nlp_router = APIRouter(prefix="/api/v1/nlp", tags=["api_v1", "nlp"])
 
 
+async def _remember(app_state: Any, session: Any):
+    """Add the new events of an answered session to the memory service."""
+
+    memory_service = app_state.memory_service
+    if isinstance(memory_service, SqliteMemoryService):
+        # Fetches only the events after the session's high-water mark, including
+        # the answer just produced (the route's ``session`` predates it).
+        await memory_service.sync_session(
+            app_state.session_service, session.app_name, session.user_id, session.id
+        )
+    else:
+        await memory_service.add_session_to_memory(session)
+
+
+async def _summary_query(
+    nlp_controller: NLPController, session: Any, summarizer: Any
+) -> Union[str, JSONResponse]:
+    """
+    Turn a ``summary`` request into the query asking the agent to save the summary.
+
+    Returns:
+        Union[str, JSONResponse]: The rewritten query, or the error response:
+            - 404 NOT FOUND if the session has no chat history.
+            - 502 BAD GATEWAY if the summarization fails.
+    """
+
+    try:
+        summary = await nlp_controller.summarize_conversation(session, summarizer)
+    except SummarizationError:
+        return JSONResponse(
+            content={
+                "signal": "summary_failed",
+            },
+            status_code=status.HTTP_502_BAD_GATEWAY,
+        )
+    if summary is None:
+        return JSONResponse(
+            content={
+                "signal": "no chat history found",
+            },
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+    return nlp_controller.template_parser.get(
+        "summarize", "WRITE_SUMMARY_QUERY", {"summary": summary["summary"]}
+    )
+
+
 @nlp_router.post("/chat/{session_id}/{user_id}")
 async def answer_question(
     request: Request,
@@ -33,7 +86,9 @@ async def answer_question(
         JSONResponse:
             - 200 OK with the answer if successful.
             - 400 BAD REQUEST if the session is not found.
-            - 400 BAD REQUEST if the answer generation fails.
+            - 404 NOT FOUND if the answer generation fails, or if a summary is
+              requested on an empty history.
+            - 502 BAD GATEWAY if a summary is requested and the summarization fails.
     """
 
     app_state = request.app.state
@@ -54,16 +109,9 @@ async def answer_question(
     nlp_controller = NLPController(app_state.runner)
 
     if query.lower() == "summary":
-        chat_history = await nlp_controller.get_conversation(session)
-        chat_history = str(chat_history) if chat_history else ""
-        if chat_history == "":
-            return JSONResponse(
-                content={
-                    "signal": "no chat history found",
-                },
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
-        query = f"Summarize and write The summarization in 'summary.md' in my obsidian vault \n==========\n {chat_history}"
+        query = await _summary_query(nlp_controller, session, app_state.summarizer)
+        if isinstance(query, JSONResponse):
+            return query
 
     answer = await nlp_controller.answer_query(session=session, query=query)
     if answer == "":
@@ -73,7 +121,7 @@ async def answer_question(
             },
             status_code=status.HTTP_404_NOT_FOUND,
         )
-    await request.app.state.memory_service.add_session_to_memory(session)
+    await _remember(request.app.state, session)
     return JSONResponse(
         content={
             "signal": "answer_success",
@@ -83,30 +131,56 @@ async def answer_question(
     )
 
 
-@nlp_router.get("/chat_history/{session_id}/{user_id}")
-async def get_chat_history(request: Request, session_id: str, user_id: str):
+def _encode_frame(frame: dict[str, Any], stream_format: str) -> str:
+    """Serialize a stream frame as an SSE event or an NDJSON line."""
+
+    data = json.dumps(frame, default=str, ensure_ascii=False)
+    if stream_format == "sse":
+        return f"event: {frame['type']}\ndata: {data}\n\n"
+    return f"{data}\n"
+
+
+@nlp_router.post("/chat_stream/{session_id}/{user_id}")
+async def stream_answer_question(
+    request: Request,
+    session_id: str,
+    user_id: str,
+    query: str = Query(
+        ..., default_factory=str, description="The user's question to be answered."
+    ),
+    stream_format: Literal["sse", "ndjson"] = Query(
+        "sse", description="Wire format of the stream: `sse` or `ndjson`."
+    ),
+):
     """
-    Endpoint to retrieve the chat history of a session.
+    Endpoint to answer a user's question within a session as a stream.
+
+    Partial model tokens, intermediate messages and tool calls/results of the
+    agents are forwarded as they arrive. The last frame is always of type
+    ``done`` and carries the full answer.
 
     Args:
         request (Request): The FastAPI request object.
         session_id (str): Unique identifier of the session.
         user_id (str): Unique identifier of the user.
+        query (str): The user's question to be answered.
+        stream_format (str): ``sse`` for Server-Sent Events or ``ndjson`` for
+            newline-delimited JSON.
 
     Returns:
-        JSONResponse:
-            - 200 OK with the chat history if successful.
+        StreamingResponse | JSONResponse:
+            - 200 OK with a stream of frames.
             - 400 BAD REQUEST if the session is not found.
+            - 404 NOT FOUND if a summary is requested on an empty history.
+            - 502 BAD GATEWAY if a summary is requested and the summarization fails.
     """
 
     app_state = request.app.state
     session_controller = SessionController(session_service=app_state.session_service)
-    nlp_controller = NLPController(app_state.runner)
 
     session = await session_controller.get_session(
         app_name=app_state.settings.APP_NAME, user_id=user_id, session_id=session_id
     )
-    
 
     if session is None:
         return JSONResponse(
@@ -115,12 +189,188 @@ async def get_chat_history(request: Request, session_id: str, user_id: str):
             },
             status_code=status.HTTP_400_BAD_REQUEST,
         )
-    chat_history = await nlp_controller.get_conversation(session)
+
+    nlp_controller = NLPController(app_state.runner)
+
+    if query.lower() == "summary":
+        query = await _summary_query(nlp_controller, session, app_state.summarizer)
+        if isinstance(query, JSONResponse):
+            return query
+
+    async def frames() -> AsyncGenerator[str, None]:
+        answer = ""
+        async for frame in nlp_controller.stream_query(session=session, query=query):
+            if frame["type"] == "done":
+                answer = frame["answer"]
+            yield _encode_frame(frame, stream_format)
+        if answer != "":
+            await _remember(app_state, session)
+
+    media_type = (
+        "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    )
+    return StreamingResponse(
+        frames(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@nlp_router.get("/chat_history/{session_id}/{user_id}")
+async def get_chat_history(
+    request: Request,
+    session_id: str,
+    user_id: str,
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of messages to return."
+    ),
+    before: Optional[str] = Query(
+        None, description="Event id cursor: return messages older than this event."
+    ),
+    after: Optional[str] = Query(
+        None, description="Event id cursor: return messages newer than this event."
+    ),
+):
+    """
+    Endpoint to retrieve the chat history of a session, optionally paginated.
+
+    Without a cursor, ``limit`` returns the newest messages. Pass the id of the
+    first returned message as ``before`` to page back, or the id of the last one
+    as ``after`` to page forward.
+
+    Args:
+        request (Request): The FastAPI request object.
+        session_id (str): Unique identifier of the session.
+        user_id (str): Unique identifier of the user.
+        limit (Optional[int]): Maximum number of messages to return.
+        before (Optional[str]): Event id cursor for older messages.
+        after (Optional[str]): Event id cursor for newer messages.
+
+    Returns:
+        JSONResponse:
+            - 200 OK with the chat history if successful.
+            - 400 BAD REQUEST if the session or the cursor is not found.
+    """
+
+    app_state = request.app.state
+    session_controller = SessionController(
+        session_service=app_state.session_service,
+        session_store=app_state.session_store,
+    )
+
+    try:
+        page = await session_controller.get_chat_history(
+            app_name=app_state.settings.APP_NAME,
+            user_id=user_id,
+            session_id=session_id,
+            limit=limit,
+            before=before,
+            after=after,
+        )
+    except ValueError:
+        return JSONResponse(
+            content={
+                "signal": "cursor_not_found",
+            },
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if page is None:
+        return JSONResponse(
+            content={
+                "signal": "session_not_found",
+            },
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
 
     return JSONResponse(
         content={
             "signal": "chat_history_success",
-            "chat_history": chat_history,
+            "chat_history": page["events"],
+            "has_more": page["has_more"],
+        },
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@nlp_router.delete("/semantic_cache")
+async def invalidate_semantic_cache(
+    entry_id: Optional[int] = Query(default=None),
+    question: Optional[str] = Query(default=None),
+    user_id: Optional[str] = Query(default=None),
+):
+    """
+    Invalidate cached chat answers.
+
+    Args:
+        entry_id (Optional[int]): The id of a single entry to remove.
+        question (Optional[str]): Remove every entry similar to this question.
+            When neither is given, the whole cache is cleared.
+        user_id (Optional[str]): Restrict the ``question`` match to this user's entries.
+
+    Returns:
+        JSONResponse:
+            - 200 OK with the number of removed entries.
+            - 400 BAD REQUEST if the semantic cache is disabled.
+    """
+
+    cache = get_semantic_cache()
+    if cache is None:
+        return JSONResponse(
+            content={
+                "signal": "semantic_cache_disabled",
+            },
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if entry_id is None and question is None:
+        removed = cache.clear()
+    else:
+        removed = cache.invalidate(entry_id=entry_id, question=question, scope=user_id)
+    return JSONResponse(
+        content={
+            "signal": "semantic_cache_invalidated",
+            "removed": removed,
+            "stats": cache.stats(),
+        },
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@nlp_router.get("/transcript")
+async def get_transcript(
+    url: str = Query(..., min_length=1, description="The YouTube video URL."),
+    lang: str = Query(default="en", description="Language code of the transcript."),
+):
+    """
+    Fetch the transcript of a YouTube video, from the transcript cache when possible.
+
+    Args:
+        url (str): The YouTube video URL.
+        lang (str): Language code of the transcript.
+
+    Returns:
+        JSONResponse:
+            - 200 OK with the ``transcript`` and whether it was ``cached``.
+            - 400 BAD REQUEST if the URL is invalid or the transcript is unavailable.
+    """
+
+    result = await fetch_transcript(url, lang)
+    if result["status"] != "success":
+        return JSONResponse(
+            content={
+                "signal": "transcript_error",
+                "error": result["error_message"],
+            },
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return JSONResponse(
+        content={
+            "signal": "transcript_success",
+            "video_id": result["video_id"],
+            "transcript": result["transcript"],
+            "cached": result["cached"],
         },
         status_code=status.HTTP_200_OK,
     )
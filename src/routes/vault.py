@@ -0,0 +1,91 @@
+"""Vault Routes Module."""
+
+import os
+import asyncio
+import logging
+from fastapi import APIRouter, status, Query
+from fastapi.responses import JSONResponse
+from stores.vault import get_vault_index
+
+
+logger = logging.getLogger("uvicorn")
+vault_router = APIRouter(prefix="/api/v1/vault", tags=["api_v1", "vault"])
+
+
+@vault_router.get("/search")
+async def search_vault(
+    query: str = Query(..., min_length=1),
+    limit: int = Query(default=10, ge=1, le=100),
+):
+    """
+    Full-text search over the local vault index.
+
+    Args:
+        query (str): Free-text query.
+        limit (int): Maximum number of results.
+
+    Returns:
+        JSONResponse:
+            - 200 OK with the ranked ``results`` (path, score and snippet).
+            - 400 BAD REQUEST if ``VAULT_PATH`` is not configured.
+    """
+
+    index = get_vault_index()
+    if index is None:
+        return JSONResponse(
+            content={
+                "signal": "vault_index_disabled",
+            },
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    results = await asyncio.to_thread(index.search, query, limit)
+    return JSONResponse(
+        content={
+            "signal": "vault_search_success",
+            "results": results,
+        },
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@vault_router.post("/reindex")
+async def reindex_vault():
+    """
+    Refresh the local vault index now instead of waiting for the next scheduled refresh.
+
+    Returns:
+        JSONResponse:
+            - 200 OK with the refresh counts and the index stats.
+            - 400 BAD REQUEST if ``VAULT_PATH`` is not configured.
+    """
+
+    index = get_vault_index()
+    if index is None:
+        return JSONResponse(
+            content={
+                "signal": "vault_index_disabled",
+            },
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    counts = await asyncio.to_thread(index.refresh)
+    return JSONResponse(
+        content={
+            "signal": "vault_reindex_success",
+            "changes": counts,
+            "stats": index.stats(),
+        },
+        status_code=status.HTTP_200_OK,
+    )
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
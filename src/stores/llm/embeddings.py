@@ -0,0 +1,119 @@
+"""
+Local Embeddings Module.
+
+A dependency-free (NumPy only) hashing embedder: word unigrams, word bigrams and
+character trigrams are hashed into a fixed number of signed buckets, weighted by
+sublinear term frequency and L2-normalized, so the cosine similarity of two texts
+is a dot product. It runs offline and needs no model download.
+"""
+
+import os
+import re
+import hashlib
+from collections import Counter
+from functools import lru_cache
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@lru_cache(maxsize=1 << 20)
+def _hash_feature(feature: str) -> int:
+    """Return a stable 64-bit hash of a feature (cached: vocabularies are small)."""
+
+    return int.from_bytes(
+        hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+class HashingEmbedder:
+    """
+    Signed feature-hashing text embedder.
+
+    Attributes:
+        dim (int): Dimension of the embeddings.
+    """
+
+    def __init__(self, dim: int = 1024):
+        """
+        Initialize the HashingEmbedder.
+
+        Args:
+            dim (int): Dimension of the embeddings.
+
+        Raises:
+            ValueError: If ``dim`` is not positive.
+        """
+
+        if dim <= 0:
+            raise ValueError("dim must be a positive integer.")
+        self.dim = dim
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        """Lowercase a text and split it into word tokens."""
+
+        return _TOKEN_PATTERN.findall(text.lower())
+
+    def _features(self, text: str) -> Counter:
+        """Return the unigram, bigram and character-trigram counts of a text."""
+
+        words = self.tokenize(text)
+        features = Counter(f"w:{word}" for word in words)
+        features.update(
+            f"b:{first} {second}" for first, second in zip(words, words[1:])
+        )
+        for word in words:
+            padded = f"<{word}>"
+            features.update(f"c:{padded[i : i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a single text.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            np.ndarray: A ``float32`` vector of shape ``(dim,)`` with unit norm
+                (all zeros for a text without tokens).
+        """
+
+        vector = np.zeros(self.dim, dtype=np.float32)
+        features = self._features(text)
+        if not features:
+            return vector
+        digests = np.fromiter(
+            (_hash_feature(feature) for feature in features),
+            dtype=np.uint64,
+            count=len(features),
+        )
+        weights = 1.0 + np.log(
+            np.fromiter(features.values(), dtype=np.float32, count=len(features))
+        )
+        # The top bit of the digest gives the sign, the rest the bucket.
+        signs = np.where(digests >> np.uint64(63), 1.0, -1.0).astype(np.float32)
+        np.add.at(
+            vector, (digests % np.uint64(self.dim)).astype(np.intp), signs * weights
+        )
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embed_many(self, texts: list[str]) -> np.ndarray:
+        """Embed several texts into a ``(len(texts), dim)`` matrix."""
+
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([self.embed(text) for text in texts])
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+LLM Response Cache Module.
+
+A persistent, opt-in cache of model responses stored in a local SQLite file, keyed
+by the model name, the normalized request contents, the system instruction and the
+tool declarations. Entries expire after a TTL and the least recently used ones are
+evicted beyond a maximum size.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Optional
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+# Keys whose values change between otherwise identical requests (e.g. the
+# ``adk-<uuid>`` ids ADK assigns to function calls and responses).
+_VOLATILE_KEYS = {"id"}
+
+
+def _normalize(value: Any) -> Any:
+    """Drop volatile keys and strip text so equivalent requests hash the same."""
+
+    if isinstance(value, dict):
+        return {
+            key: _normalize(item)
+            for key, item in value.items()
+            if key not in _VOLATILE_KEYS
+        }
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def make_cache_key(llm_request: LlmRequest) -> str:
+    """
+    Build the cache key of a model request.
+
+    Args:
+        llm_request (LlmRequest): The request about to be sent to the model.
+
+    Returns:
+        str: A SHA-256 hex digest of the model name, normalized contents, system
+            instruction and tool declarations.
+    """
+
+    config = llm_request.config
+    tools = [
+        tool.model_dump(mode="json", exclude_none=True) for tool in (config.tools or [])
+    ]
+    payload = {
+        "model": llm_request.model,
+        "contents": [
+            content.model_dump(mode="json", exclude_none=True)
+            for content in llm_request.contents
+        ],
+        "instruction": (
+            config.system_instruction.model_dump(mode="json", exclude_none=True)
+            if hasattr(config.system_instruction, "model_dump")
+            else config.system_instruction
+        ),
+        "tools": tools,
+    }
+    serialized = json.dumps(_normalize(payload), sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    """
+    SQLite-backed model response cache with TTL and LRU eviction.
+
+    Attributes:
+        db_path (str): Path of the SQLite file.
+        ttl (float): Time to live of an entry, in seconds (0 disables expiry).
+        max_entries (int): Maximum number of entries kept (LRU eviction beyond it).
+        hits (int): Number of cache hits since start-up.
+        misses (int): Number of cache misses since start-up.
+        stores (int): Number of responses stored since start-up.
+    """
+
+    def __init__(self, db_path: str, ttl: float = 86400.0, max_entries: int = 10000):
+        """
+        Initialize the cache and create its table if needed.
+
+        Args:
+            db_path (str): Path of the SQLite file.
+            ttl (float): Time to live of an entry, in seconds (0 disables expiry).
+            max_entries (int): Maximum number of entries kept.
+        """
+
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_responses_last_access "
+            "ON llm_responses (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[LlmResponse]:
+        """
+        Return the cached response of a key, or None on a miss or expired entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[LlmResponse]: The cached response.
+        """
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] is not None and row[1] <= now:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return LlmResponse.model_validate_json(row[0])
+
+    def set(self, key: str, model: Optional[str], llm_response: LlmResponse):
+        """
+        Store a response and evict the least recently used entries beyond the limit.
+
+        Args:
+            key (str): The cache key.
+            model (Optional[str]): The model name (kept for inspection).
+            llm_response (LlmResponse): The response to cache.
+        """
+
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl > 0 else None
+        response = llm_response.model_dump_json(exclude_none=True)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, model, response, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, now, expires_at, now),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE key IN ("
+                "SELECT key FROM llm_responses ORDER BY last_access DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+            self.stores += 1
+
+    def clear(self):
+        """Remove every entry."""
+
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the hit/miss/store counters, the hit ratio and the entry count."""
+
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses"
+            ).fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+
+_llm_response_cache: Optional[LlmResponseCache] = None
+_llm_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LlmResponseCache]:
+    """
+    Return the process-wide response cache, or None if ``LLM_CACHE_ENABLED`` is false.
+
+    Returns:
+        Optional[LlmResponseCache]: The shared cache instance.
+    """
+
+    global _llm_response_cache  # pylint: disable=[W0603]
+    settings = get_settings()
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_response_cache is None:
+        with _llm_response_cache_lock:
+            if _llm_response_cache is None:
+                _llm_response_cache = LlmResponseCache(
+                    db_path=os.path.join(settings.PATH_DATA_ROOT, "llm_cache.db"),
+                    ttl=settings.LLM_CACHE_TTL,
+                    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                )
+                logger.info(
+                    "LLM response cache enabled at %s", _llm_response_cache.db_path
+                )
+    return _llm_response_cache
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
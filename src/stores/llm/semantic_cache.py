@@ -0,0 +1,362 @@
+"""
+Semantic Answer Cache Module.
+
+Caches question/answer pairs with their embeddings and serves the answer of the
+nearest previous question when its cosine similarity passes a threshold, so
+paraphrased questions skip the search and model round trips. Entries are persisted
+in SQLite and mirrored in an in-memory matrix for the nearest-neighbour lookup.
+
+Entries are scoped (per user), and a hit also needs both questions to have the
+same content words: hashed embeddings of "create a note" and "delete a note", or
+"Is 17 prime?" and "Is 18 prime?", are too close for a threshold alone.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from typing import Any, Optional
+import numpy as np
+from stores.llm.embeddings import HashingEmbedder
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+# Words that do not change what a question asks for.
+_STOP_WORDS = frozenset(
+    """
+    a an the and or but if of to in on at by for with about from into over as is are was
+    were be been being am do does did doing have has had i me my mine we us our you your
+    he him his she her it its they them their this that these those there here what
+    which who whom whose when where why how can could would should shall will may might
+    must please tell show give explain s t d ll re ve m let lets some any just also so
+    """.split()
+)
+# Candidates checked for matching content words, best first.
+_MAX_CANDIDATES = 5
+
+
+def content_words(tokens: list[str]) -> frozenset[str]:
+    """
+    Return the words of a question that carry its meaning.
+
+    Stop words are dropped and plurals folded (``notes`` -> ``note``).
+
+    Args:
+        tokens (list[str]): The lowercased word tokens of the question.
+
+    Returns:
+        frozenset[str]: The content words.
+    """
+
+    return frozenset(
+        (
+            token[:-1]
+            if len(token) > 3 and token.endswith("s") and not token.endswith("ss")
+            else token
+        )
+        for token in tokens
+        if token not in _STOP_WORDS
+    )
+
+
+class SemanticAnswerCache:
+    """
+    Nearest-neighbour question/answer cache with per-entry TTL, scoped per user.
+
+    Attributes:
+        embedder (HashingEmbedder): Embeds the questions.
+        threshold (float): Minimum cosine similarity of a hit (which also needs
+            matching content words).
+        ttl (float): Default time to live of an entry, in seconds (0 disables expiry).
+        max_entries (int): Maximum number of entries; the oldest are evicted beyond it.
+        hits (int): Number of cache hits since start-up.
+        misses (int): Number of cache misses since start-up.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        embedder: Optional[HashingEmbedder] = None,
+        threshold: float = 0.85,
+        ttl: float = 86400.0,
+        max_entries: int = 5000,
+    ):
+        """
+        Initialize the cache and load the persisted entries.
+
+        Args:
+            db_path (str): Path of the SQLite file.
+            embedder (Optional[HashingEmbedder]): Embeds the questions.
+            threshold (float): Minimum cosine similarity of a hit.
+            ttl (float): Default time to live of an entry, in seconds.
+            max_entries (int): Maximum number of entries.
+        """
+
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_answers ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, question TEXT NOT NULL, "
+            "answer TEXT NOT NULL, embedding BLOB NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL, scope TEXT NOT NULL DEFAULT '')"
+        )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(semantic_answers)")
+        }
+        if "scope" not in columns:
+            # Entries of the former process-wide cache have no owner: drop them.
+            self._conn.execute("DELETE FROM semantic_answers")
+            self._conn.execute(
+                "ALTER TABLE semantic_answers ADD COLUMN scope TEXT NOT NULL DEFAULT ''"
+            )
+        self._conn.commit()
+
+        self._ids: list[int] = []
+        self._scopes: list[str] = []
+        self._content_words: list[frozenset[str]] = []
+        self._expires_at: list[float] = []
+        self._answers: list[str] = []
+        self._matrix = np.zeros((0, self.embedder.dim), dtype=np.float32)
+        self._load()
+
+    def _load(self):
+        """Load the non-expired entries with a matching dimension into memory."""
+
+        now = time.time()
+        self._conn.execute(
+            "DELETE FROM semantic_answers WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        )
+        self._conn.commit()
+        rows = self._conn.execute(
+            "SELECT id, question, answer, embedding, expires_at, scope "
+            "FROM semantic_answers ORDER BY id"
+        ).fetchall()
+        vectors = []
+        for entry_id, question, answer, embedding, expires_at, scope in rows:
+            vector = np.frombuffer(embedding, dtype=np.float32)
+            if vector.shape[0] != self.embedder.dim:
+                continue
+            self._ids.append(entry_id)
+            self._scopes.append(scope)
+            self._content_words.append(content_words(self.embedder.tokenize(question)))
+            self._answers.append(answer)
+            self._expires_at.append(expires_at if expires_at is not None else np.inf)
+            vectors.append(vector)
+        if vectors:
+            self._matrix = np.stack(vectors)
+        logger.info("Semantic cache loaded %s entries.", len(self._ids))
+
+    def _remove_positions(self, positions: list[int]):
+        """Remove entries by their position in the in-memory arrays and in SQLite."""
+
+        if not positions:
+            return
+        removed_ids = [self._ids[position] for position in positions]
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[positions] = False
+        self._matrix = self._matrix[keep]
+        self._ids = [value for value, kept in zip(self._ids, keep) if kept]
+        self._scopes = [value for value, kept in zip(self._scopes, keep) if kept]
+        self._content_words = [
+            value for value, kept in zip(self._content_words, keep) if kept
+        ]
+        self._answers = [value for value, kept in zip(self._answers, keep) if kept]
+        self._expires_at = [
+            value for value, kept in zip(self._expires_at, keep) if kept
+        ]
+        self._conn.executemany(
+            "DELETE FROM semantic_answers WHERE id = ?", [(i,) for i in removed_ids]
+        )
+        self._conn.commit()
+
+    def lookup(self, question: str, scope: str = "") -> Optional[dict[str, Any]]:
+        """
+        Return the cached answer of the most similar previous question, if any.
+
+        A hit is an entry of the same scope whose similarity passes the threshold
+        and whose question has the same content words.
+
+        Args:
+            question (str): The incoming question.
+            scope (str): The owner of the entries to search (the user ID).
+
+        Returns:
+            Optional[dict[str, Any]]: ``{"id", "answer", "similarity"}`` on a hit,
+                None on a miss.
+        """
+
+        query = self.embedder.embed(question)
+        words = content_words(self.embedder.tokenize(question))
+        now = time.time()
+        with self._lock:
+            if not self._ids or not query.any():
+                self.misses += 1
+                return None
+            similarities = self._matrix @ query
+            similarities[np.asarray(self._expires_at) <= now] = -np.inf
+            similarities[np.asarray(self._scopes) != scope] = -np.inf
+            for position in np.argsort(-similarities)[:_MAX_CANDIDATES].tolist():
+                similarity = float(similarities[position])
+                if similarity < self.threshold:
+                    break
+                if self._content_words[position] == words:
+                    self.hits += 1
+                    return {
+                        "id": self._ids[position],
+                        "answer": self._answers[position],
+                        "similarity": similarity,
+                    }
+            self.misses += 1
+            return None
+
+    def put(
+        self, question: str, answer: str, ttl: Optional[float] = None, scope: str = ""
+    ) -> int:
+        """
+        Store a question/answer pair.
+
+        Args:
+            question (str): The question.
+            answer (str): Its answer.
+            ttl (Optional[float]): Time to live of this entry, in seconds; defaults
+                to the cache TTL (0 disables expiry).
+            scope (str): The owner of the entry (the user ID).
+
+        Returns:
+            int: The id of the new entry.
+        """
+
+        vector = self.embedder.embed(question)
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl > 0 else None
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO semantic_answers "
+                "(question, answer, embedding, created_at, expires_at, scope) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (question, answer, vector.tobytes(), now, expires_at, scope),
+            )
+            self._conn.commit()
+            self._ids.append(cursor.lastrowid)  # type: ignore
+            self._scopes.append(scope)
+            self._content_words.append(content_words(self.embedder.tokenize(question)))
+            self._answers.append(answer)
+            self._expires_at.append(expires_at if expires_at is not None else np.inf)
+            self._matrix = np.vstack([self._matrix, vector[None, :]])
+
+            overflow = len(self._ids) - self.max_entries
+            if overflow > 0:
+                self._remove_positions(list(range(overflow)))
+            return cursor.lastrowid  # type: ignore
+
+    def invalidate(
+        self,
+        entry_id: Optional[int] = None,
+        question: Optional[str] = None,
+        scope: Optional[str] = None,
+    ) -> int:
+        """
+        Remove one entry by id, or every entry similar to a question.
+
+        Args:
+            entry_id (Optional[int]): The id of the entry to remove.
+            question (Optional[str]): Remove every entry whose similarity with this
+                question passes the threshold.
+            scope (Optional[str]): Only remove the entries similar to ``question``
+                in this scope (every scope when None).
+
+        Returns:
+            int: The number of removed entries.
+        """
+
+        with self._lock:
+            positions: list[int] = []
+            if entry_id is not None and entry_id in self._ids:
+                positions.append(self._ids.index(entry_id))
+            if question is not None and self._ids:
+                similarities = self._matrix @ self.embedder.embed(question)
+                if scope is not None:
+                    similarities[np.asarray(self._scopes) != scope] = -np.inf
+                positions.extend(
+                    int(position)
+                    for position in np.flatnonzero(similarities >= self.threshold)
+                )
+            positions = sorted(set(positions))
+            self._remove_positions(positions)
+            return len(positions)
+
+    def clear(self) -> int:
+        """Remove every entry and return how many were removed."""
+
+        with self._lock:
+            count = len(self._ids)
+            self._remove_positions(list(range(count)))
+            return count
+
+    def stats(self) -> dict[str, Any]:
+        """Return the hit/miss counters, the hit ratio and the entry count."""
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._ids),
+        }
+
+
+_semantic_cache: Optional[SemanticAnswerCache] = None
+_semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> Optional[SemanticAnswerCache]:
+    """
+    Return the process-wide semantic cache, or None if ``SEMANTIC_CACHE_ENABLED`` is false.
+
+    Returns:
+        Optional[SemanticAnswerCache]: The shared cache instance.
+    """
+
+    global _semantic_cache  # pylint: disable=[W0603]
+    settings = get_settings()
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+    if _semantic_cache is None:
+        with _semantic_cache_lock:
+            if _semantic_cache is None:
+                _semantic_cache = SemanticAnswerCache(
+                    db_path=os.path.join(settings.PATH_DATA_ROOT, "semantic_cache.db"),
+                    embedder=HashingEmbedder(dim=settings.SEMANTIC_CACHE_DIM),
+                    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                    ttl=settings.SEMANTIC_CACHE_TTL,
+                    max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                )
+    return _semantic_cache
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ INSTRUCTIONS = Template(
     "\n".join(
         [
             "You are a helpful assistant. Answer user queries. ",
-            "Use Google Search for current info or if unsure."
+            "When the question may be about the user's own notes, call `retrieve_notes` first and answer from the returned passages, citing their note paths.",
+            "Use Google Search for current info or if unsure.",
         ]
     )
 )
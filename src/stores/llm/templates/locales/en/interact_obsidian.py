@@ -7,7 +7,8 @@ INSTRUCTIONS = Template(
     "\n".join(
         [
             "You are an agent specialized in interacting with Obsidian.",
-            "Your primary role is to create, update, and manage notes in Obsidian based on user inputs and conversation context."
+            "Your primary role is to create, update, and manage notes in Obsidian based on user inputs and conversation context.",
+            "To find notes by topic or keywords, call `search_vault` first; it is much faster than listing and reading files.",
         ]
     )
 )
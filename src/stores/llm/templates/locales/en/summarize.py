@@ -14,6 +14,30 @@ INSTRUCTIONS = Template(
     )
 )
 
+MAP_INSTRUCTIONS = Template(
+    "\n".join(
+        [
+            "You are summarizing one part of a longer conversation between a user and an assistant.",
+            "Write a concise markdown summary of this part only: keep decisions, facts, questions, code and action items.",
+            "Do not add an introduction or a conclusion; another step will merge the parts.",
+        ]
+    )
+)
+
+REDUCE_INSTRUCTIONS = Template(
+    "\n".join(
+        [
+            "You are given partial summaries of consecutive parts of one conversation, in order.",
+            "Merge them into a single coherent markdown summary with headings and bullet points.",
+            "Remove duplicates, keep the chronology, and keep every decision, fact and action item.",
+        ]
+    )
+)
+
+WRITE_SUMMARY_QUERY = Template(
+    "Write the following conversation summary as is in 'summary.md' in my obsidian vault \n==========\n $summary"
+)
+
 
 def main():
     """Entry Point for the Program."""
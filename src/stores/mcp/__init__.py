@@ -0,0 +1 @@
+from stores.mcp.mcp_connection_manager import MCPConnectionManager, MCPSessionPool
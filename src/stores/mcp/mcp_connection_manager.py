@@ -0,0 +1,349 @@
+"""
+MCP Connection Manager Module.
+
+Keeps a pool of pre-spawned, health-checked MCP client sessions per ``McpToolset``
+so tool calls reuse warm server processes instead of paying the ``docker run``
+start-up cost on first use and on every reconnect.
+"""
+
+import os
+import asyncio
+import itertools
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from google.adk.tools.mcp_tool import McpToolset
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+from mcp import ClientSession
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+
+class _PooledSession:
+    """A single MCP client session owned by a dedicated background task.
+
+    The transport and session contexts are entered and exited inside the same task
+    (no ``asyncio.wait_for`` wrapping), which the underlying anyio task groups
+    require, so a slot can be recycled from any request task.
+
+    Attributes:
+        session (Optional[ClientSession]): The initialized session once ready.
+        error (Optional[BaseException]): The start-up error, if any.
+    """
+
+    def __init__(self, pool: "MCPSessionPool"):
+        """Spawn the owner task of the slot."""
+
+        self.session: Optional[ClientSession] = None
+        self.error: Optional[BaseException] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._own(pool))
+
+    async def _own(self, pool: "MCPSessionPool"):
+        """Open the session, then hold it open until the slot is closed."""
+
+        timeout = pool.timeout
+        try:
+            async with AsyncExitStack() as exit_stack:
+                async with asyncio.timeout(timeout):
+                    client = pool._create_client()  # pylint: disable=[W0212]
+                    transports = await exit_stack.enter_async_context(client)
+                    session = await exit_stack.enter_async_context(
+                        ClientSession(
+                            *transports[:2],
+                            read_timeout_seconds=(
+                                timedelta(seconds=timeout) if timeout else None
+                            ),
+                        )
+                    )
+                    await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:  # pylint: disable=[W0718]
+            self.error = e
+            if not self._ready.is_set():
+                logger.error("[%s] Failed to start MCP session: %s", pool.name, e)
+            else:
+                logger.warning("[%s] MCP session closed with error: %s", pool.name, e)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def wait_ready(self) -> Optional[ClientSession]:
+        """Wait until the session is initialized (or failed) and return it."""
+
+        await self._ready.wait()
+        return self.session
+
+    async def close(self):
+        """Ask the owner task to close the session and wait for it."""
+
+        self._closing.set()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+class MCPSessionPool(MCPSessionManager):
+    """A drop-in replacement for ADK's ``MCPSessionManager`` backed by a session pool.
+
+    ``create_session`` hands out sessions round-robin, replacing any slot whose
+    transport has been closed (e.g. a crashed server process). Attaching the pool
+    to a toolset makes every ``MCPTool`` it creates use the pool too, and makes
+    ``McpToolset.close()`` a no-op so sessions survive across ``AgentTool`` calls.
+
+    Attributes:
+        name (str): Name of the pooled toolset, used in logs and stats.
+        pool_size (int): Number of sessions to keep open.
+        timeout (Optional[float]): Start-up and request timeout in seconds.
+    """
+
+    def __init__(self, name: str, toolset: McpToolset, pool_size: int = 1):
+        """
+        Initialize the pool and attach it to the toolset.
+
+        Args:
+            name (str): Name of the pooled toolset.
+            toolset (McpToolset): The toolset whose sessions should be pooled.
+            pool_size (int): Number of sessions to keep open.
+
+        Raises:
+            ValueError: If ``pool_size`` is not positive.
+        """
+
+        if pool_size <= 0:
+            raise ValueError("pool_size must be a positive integer.")
+
+        # pylint: disable=[W0212]
+        super().__init__(
+            connection_params=toolset._connection_params, errlog=toolset._errlog
+        )
+        toolset._mcp_session_manager = self
+        # pylint: enable=[W0212]
+
+        self.name = name
+        self.pool_size = pool_size
+        self.timeout = getattr(self._connection_params, "timeout", None)
+        self.recycled = 0
+        self._slots: list[Optional[_PooledSession]] = [None] * pool_size
+        self._cursor = itertools.cycle(range(pool_size))
+        self._pool_lock = asyncio.Lock()
+
+    async def start(self):
+        """Pre-spawn all sessions of the pool concurrently."""
+
+        async with self._pool_lock:
+            await asyncio.gather(
+                *(self._spawn(index) for index in range(self.pool_size))
+            )
+        logger.info(
+            "[%s] MCP pool started with %s/%s healthy sessions.",
+            self.name,
+            self.healthy_count(),
+            self.pool_size,
+        )
+
+    async def _spawn(self, index: int) -> Optional[ClientSession]:
+        """Close whatever occupies slot ``index`` and start a fresh session in it."""
+
+        previous = self._slots[index]
+        if previous is not None:
+            await previous.close()
+        slot = _PooledSession(self)
+        self._slots[index] = slot
+        return await slot.wait_ready()
+
+    def _is_slot_healthy(self, slot: Optional[_PooledSession]) -> bool:
+        """Return True if the slot holds a connected session."""
+
+        return (
+            slot is not None
+            and slot.session is not None
+            and not self._is_session_disconnected(slot.session)
+        )
+
+    def healthy_count(self) -> int:
+        """Return the number of connected sessions in the pool."""
+
+        return sum(self._is_slot_healthy(slot) for slot in self._slots)
+
+    async def create_session(
+        self, headers: Optional[Dict[str, str]] = None
+    ) -> ClientSession:
+        """
+        Return a pooled session, recycling the chosen slot if it is disconnected.
+
+        Args:
+            headers (Optional[Dict[str, str]]): Unused; stdio sessions have no headers.
+
+        Returns:
+            ClientSession: An initialized MCP client session.
+
+        Raises:
+            ConnectionError: If no session could be started.
+        """
+
+        index = next(self._cursor)
+        slot = self._slots[index]
+        if self._is_slot_healthy(slot):
+            return slot.session  # type: ignore
+
+        async with self._pool_lock:
+            slot = self._slots[index]
+            if self._is_slot_healthy(slot):
+                return slot.session  # type: ignore
+            if slot is not None:
+                logger.warning("[%s] Recycling disconnected MCP session.", self.name)
+                self.recycled += 1
+            session = await self._spawn(index)
+
+        if session is None:
+            raise ConnectionError(
+                f"Failed to create MCP session for {self.name}: {self._slots[index].error}"  # type: ignore
+            )
+        return session
+
+    async def health_check(self):
+        """Ping every session and recycle the ones that do not answer."""
+
+        for index, slot in enumerate(self._slots):
+            healthy = self._is_slot_healthy(slot)
+            if healthy:
+                try:
+                    await asyncio.wait_for(
+                        slot.session.send_ping(), timeout=self.timeout  # type: ignore
+                    )
+                except Exception as e:  # pylint: disable=[W0718]
+                    logger.warning("[%s] MCP session failed ping: %s", self.name, e)
+                    healthy = False
+            if not healthy:
+                async with self._pool_lock:
+                    if slot is not None:
+                        self.recycled += 1
+                    await self._spawn(index)
+
+    async def close(self):
+        """Keep the pool open when the toolset is closed.
+
+        ``AgentTool`` closes its child runner, and with it every toolset, after each
+        call; the pool's lifetime is owned by ``MCPConnectionManager`` instead.
+        """
+
+    async def shutdown(self):
+        """Close all sessions of the pool."""
+
+        async with self._pool_lock:
+            await asyncio.gather(
+                *(slot.close() for slot in self._slots if slot is not None)
+            )
+            self._slots = [None] * self.pool_size
+
+    def stats(self) -> dict[str, Any]:
+        """Return the pool size, healthy session count and recycle count."""
+
+        return {
+            "pool_size": self.pool_size,
+            "healthy": self.healthy_count(),
+            "recycled": self.recycled,
+        }
+
+
+class MCPConnectionManager:
+    """Owns the MCP session pools of the application's toolsets.
+
+    Started and stopped from the FastAPI ``lifespan``; a background task
+    health-checks every pool at a fixed interval.
+
+    Attributes:
+        pool_size (int): Number of sessions per toolset.
+        health_check_interval (float): Seconds between health checks (0 disables them).
+        pools (dict[str, MCPSessionPool]): Registered pools keyed by toolset name.
+    """
+
+    def __init__(self, pool_size: int = 1, health_check_interval: float = 30.0):
+        """
+        Initialize the MCPConnectionManager.
+
+        Args:
+            pool_size (int): Number of sessions per toolset.
+            health_check_interval (float): Seconds between health checks.
+        """
+
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+        self.pools: dict[str, MCPSessionPool] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, toolset: McpToolset) -> MCPSessionPool:
+        """
+        Attach a session pool to a toolset.
+
+        Args:
+            name (str): Name of the toolset.
+            toolset (McpToolset): The toolset to pool.
+
+        Returns:
+            MCPSessionPool: The pool now used by the toolset.
+        """
+
+        pool = MCPSessionPool(name=name, toolset=toolset, pool_size=self.pool_size)
+        self.pools[name] = pool
+        return pool
+
+    async def start(self):
+        """Pre-spawn every registered pool and start the health-check loop."""
+
+        logger.info("Pre-warming MCP pools: %s", ", ".join(self.pools))
+        await asyncio.gather(*(pool.start() for pool in self.pools.values()))
+        if self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self):
+        """Health-check all pools every ``health_check_interval`` seconds."""
+
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            for pool in self.pools.values():
+                try:
+                    await pool.health_check()
+                except Exception as e:  # pylint: disable=[W0718]
+                    logger.error("[%s] MCP health check failed: %s", pool.name, e)
+
+    async def close(self):
+        """Stop the health-check loop and close every pool."""
+
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        await asyncio.gather(*(pool.shutdown() for pool in self.pools.values()))
+        logger.info("MCP pools closed.")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the stats of every pool keyed by toolset name."""
+
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Stub MCP Server Module.
+
+A tiny stdio MCP server with a few deterministic tools, used to exercise the MCP
+connection pool and the agents' MCP plumbing without Docker.
+
+Run it directly (by path, so the ``stores`` package and its settings are not loaded):
+    python src/stores/mcp/stub_server.py --latency 0.05
+"""
+
+import os
+import sys
+import time
+import argparse
+from google.adk.tools.mcp_tool import McpToolset
+from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+from mcp import StdioServerParameters
+from mcp.server.fastmcp import FastMCP
+
+stub_server = FastMCP("obsidian-mate-stub")
+_latency = 0.0
+
+
+@stub_server.tool()
+def echo(text: str) -> str:
+    """Return the given text unchanged."""
+
+    time.sleep(_latency)
+    return text
+
+
+@stub_server.tool()
+def get_transcript(url: str, lang: str = "en") -> str:
+    """Return a fake transcript for a video URL."""
+
+    time.sleep(_latency)
+    return f"[stub transcript ({lang}) of {url}]"
+
+
+@stub_server.tool()
+def get_file_contents(filepath: str) -> str:
+    """Return fake contents for a vault file."""
+
+    time.sleep(_latency)
+    return f"# {os.path.basename(filepath)}\n\nStub note content."
+
+
+@stub_server.tool()
+def get_pid() -> int:
+    """Return the server process ID (useful to check session reuse)."""
+
+    return os.getpid()
+
+
+def stub_connection_params(
+    latency: float = 0.0, timeout: float = 10.0
+) -> StdioConnectionParams:
+    """
+    Build stdio connection parameters that launch this stub server.
+
+    Args:
+        latency (float): Artificial latency added to each tool call, in seconds.
+        timeout (float): Connection and request timeout, in seconds.
+
+    Returns:
+        StdioConnectionParams: Parameters usable by ``McpToolset``.
+    """
+
+    return StdioConnectionParams(
+        server_params=StdioServerParameters(
+            command=sys.executable,
+            args=[os.path.abspath(__file__), "--latency", str(latency)],
+        ),
+        timeout=timeout,
+    )
+
+
+def stub_toolset(latency: float = 0.0) -> McpToolset:
+    """Return an ``McpToolset`` connected to a stub server."""
+
+    return McpToolset(connection_params=stub_connection_params(latency=latency))
+
+
+def main():
+    """Entry Point for the Program."""
+
+    global _latency  # pylint: disable=[W0603]
+    parser = argparse.ArgumentParser(description="Stub MCP server (stdio).")
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    _latency = args.latency
+    stub_server.run(transport="stdio")
+
+
+if __name__ == "__main__":
+    main()
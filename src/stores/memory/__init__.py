@@ -0,0 +1 @@
+from stores.memory.sqlite_memory_service import SqliteMemoryService
@@ -0,0 +1,320 @@
+"""
+SQLite Memory Service Module.
+
+A persistent ``BaseMemoryService`` backed by a SQLite FTS5 index. Every session
+has a high-water mark (the timestamp of its last ingested event), so adding a
+session to memory only stores the events that are newer than that mark, and
+``sync_session`` fetches only those events from the session service. Searches
+are ranked with BM25. The database runs in WAL mode so that several workers can
+share it.
+"""
+
+import os
+import re
+import sqlite3
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any, Iterable, Optional
+from google.adk.events import Event
+from google.adk.memory import BaseMemoryService
+from google.adk.memory.base_memory_service import SearchMemoryResponse
+from google.adk.memory.memory_entry import MemoryEntry
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+from utils.tracing_utils import tracer
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS memory_events (
+        id INTEGER PRIMARY KEY,
+        event_id TEXT NOT NULL UNIQUE,
+        app_name TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        session_id TEXT NOT NULL,
+        author TEXT,
+        timestamp REAL NOT NULL,
+        content TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+        text, app_name UNINDEXED, user_id UNINDEXED, tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS memory_sessions (
+        app_name TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        session_id TEXT NOT NULL,
+        high_water_mark REAL NOT NULL,
+        PRIMARY KEY (app_name, user_id, session_id)
+    )
+    """,
+]
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _event_text(event: Event) -> str:
+    """Return the text parts of an event."""
+
+    if not event.content or not event.content.parts:
+        return ""
+    return "\n".join(part.text for part in event.content.parts if part.text).strip()
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching any of its words."""
+
+    words = dict.fromkeys(word.lower() for word in _WORD_PATTERN.findall(query))
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+class SqliteMemoryService(BaseMemoryService):
+    """
+    Persistent, incrementally ingested memory with ranked full-text search.
+
+    Attributes:
+        db_path (str): Path of the SQLite file.
+        search_limit (int): Maximum number of memories returned by a search.
+    """
+
+    def __init__(self, db_path: str, search_limit: int = 10):
+        """
+        Initialize the service and create its tables.
+
+        Args:
+            db_path (str): Path of the SQLite file.
+            search_limit (int): Maximum number of memories returned by a search.
+        """
+
+        self.db_path = db_path
+        self.search_limit = search_limit
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def _high_water_mark(
+        self, app_name: str, user_id: str, session_id: str
+    ) -> Optional[float]:
+        """Return the timestamp of the last ingested event of a session."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water_mark FROM memory_sessions "
+                "WHERE app_name = ? AND user_id = ? AND session_id = ?",
+                (app_name, user_id, session_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _ingest(
+        self, app_name: str, user_id: str, session_id: str, events: Iterable[Event]
+    ) -> int:
+        """
+        Store the text events of a session and move its high-water mark.
+
+        Returns:
+            int: Number of newly stored events.
+        """
+
+        rows = []
+        newest = None
+        for event in events:
+            newest = event.timestamp if newest is None else max(newest, event.timestamp)
+            # Tool calls, state-only events and events without content carry no text.
+            text = _event_text(event)
+            if event.content is None or not text:
+                continue
+            content = types.Content(
+                role=event.content.role, parts=[types.Part(text=text)]
+            )
+            rows.append((event, text, content.model_dump_json(exclude_none=True)))
+        if newest is None:
+            return 0
+
+        added = 0
+        with self._lock, self._conn:
+            for event, text, content in rows:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO memory_events "
+                    "(event_id, app_name, user_id, session_id, author, timestamp, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        event.id,
+                        app_name,
+                        user_id,
+                        session_id,
+                        event.author,
+                        event.timestamp,
+                        content,
+                    ),
+                )
+                if cursor.rowcount:
+                    self._conn.execute(
+                        "INSERT INTO memory_fts (rowid, text, app_name, user_id) VALUES (?, ?, ?, ?)",
+                        (cursor.lastrowid, text, app_name, user_id),
+                    )
+                    added += 1
+            self._conn.execute(
+                "INSERT INTO memory_sessions (app_name, user_id, session_id, high_water_mark) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (app_name, user_id, session_id) "
+                "DO UPDATE SET high_water_mark = MAX(high_water_mark, excluded.high_water_mark)",
+                (app_name, user_id, session_id, newest),
+            )
+        return added
+
+    async def add_session_to_memory(self, session: Session):
+        """
+        Store the events of a session that are newer than its high-water mark.
+
+        Args:
+            session (Session): The session to add.
+        """
+
+        with tracer.start_as_current_span("memory.add_session") as span:
+            span.set_attribute("session.id", session.id)
+            mark = await asyncio.to_thread(
+                self._high_water_mark, session.app_name, session.user_id, session.id
+            )
+            # Events are ordered by time: walk back from the end up to the mark.
+            new_events: list[Event] = []
+            for event in reversed(session.events):
+                if mark is not None and event.timestamp < mark:
+                    break
+                new_events.append(event)
+            added = await asyncio.to_thread(
+                self._ingest,
+                session.app_name,
+                session.user_id,
+                session.id,
+                reversed(new_events),
+            )
+            span.set_attribute("memory.added_events", added)
+        logger.debug(
+            "Ingested %d new events of session %s into memory", added, session.id
+        )
+
+    async def sync_session(
+        self,
+        session_service: BaseSessionService,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+    ) -> int:
+        """
+        Fetch the events of a session newer than its high-water mark and store them.
+
+        Args:
+            session_service (BaseSessionService): The service holding the session.
+            app_name (str): The application name.
+            user_id (str): The user ID.
+            session_id (str): The session ID.
+
+        Returns:
+            int: Number of newly stored events.
+        """
+
+        with tracer.start_as_current_span("memory.sync_session") as span:
+            span.set_attribute("session.id", session_id)
+            mark = await asyncio.to_thread(
+                self._high_water_mark, app_name, user_id, session_id
+            )
+            session = await session_service.get_session(
+                app_name=app_name,
+                user_id=user_id,
+                session_id=session_id,
+                config=(
+                    GetSessionConfig(after_timestamp=mark) if mark is not None else None
+                ),
+            )
+            if session is None:
+                return 0
+            added = await asyncio.to_thread(
+                self._ingest, app_name, user_id, session_id, session.events
+            )
+            span.set_attribute("memory.added_events", added)
+            return added
+
+    def _search(self, app_name: str, user_id: str, query: str) -> list[tuple[Any, ...]]:
+        """Return the best matching event rows, best first."""
+
+        match = _fts_query(query)
+        if not match:
+            return []
+        with self._lock:
+            return self._conn.execute(
+                "SELECT e.event_id, e.author, e.timestamp, e.content, e.session_id "
+                "FROM memory_fts JOIN memory_events AS e ON e.id = memory_fts.rowid "
+                "WHERE memory_fts MATCH ? AND memory_fts.app_name = ? AND memory_fts.user_id = ? "
+                "ORDER BY bm25(memory_fts) LIMIT ?",
+                (match, app_name, user_id, self.search_limit),
+            ).fetchall()
+
+    async def search_memory(
+        self, *, app_name: str, user_id: str, query: str
+    ) -> SearchMemoryResponse:
+        """
+        Return the memories of a user that best match a query, ranked by BM25.
+
+        Args:
+            app_name (str): The application name.
+            user_id (str): The user ID.
+            query (str): Free-text query.
+
+        Returns:
+            SearchMemoryResponse: The matching memories, best first.
+        """
+
+        with tracer.start_as_current_span("memory.search") as span:
+            rows = await asyncio.to_thread(self._search, app_name, user_id, query)
+            span.set_attribute("memory.results", len(rows))
+        response = SearchMemoryResponse()
+        for event_id, author, timestamp, content, session_id in rows:
+            response.memories.append(
+                MemoryEntry(
+                    id=event_id,
+                    content=types.Content.model_validate_json(content),
+                    author=author,
+                    timestamp=_format_timestamp(timestamp),
+                    custom_metadata={"session_id": session_id},
+                )
+            )
+        return response
+
+    def close(self):
+        """Close the database connection."""
+
+        with self._lock:
+            self._conn.close()
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format an event timestamp as ISO 8601."""
+
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
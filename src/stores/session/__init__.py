@@ -0,0 +1,2 @@
+from stores.session.session_store import SessionStore
+from stores.session.traced_session_service import TracedDatabaseSessionService
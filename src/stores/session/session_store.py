@@ -0,0 +1,353 @@
+"""
+Session Store Module.
+
+Direct, indexed queries against the tables of ADK's ``DatabaseSessionService`` for
+the read/delete paths that must not hydrate whole ``Session`` objects.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Any, Literal, Optional
+from google.adk.sessions.database_session_service import (
+    DatabaseSessionService,
+    StorageEvent,
+    StorageSession,
+)
+from sqlalchemy import String, and_, delete, func, or_, select, text
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+# Extra indexes on top of ADK's schema (its primary keys lead with the event id).
+_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_events_session_timestamp "
+    "ON events (app_name, user_id, session_id, timestamp, id)",
+    "CREATE INDEX IF NOT EXISTS ix_sessions_user_update_time "
+    "ON sessions (app_name, user_id, update_time)",
+]
+TITLE_SNIPPET_LENGTH = 80
+
+
+class SessionStore:
+    """Storage-layer queries sharing the engine of a ``DatabaseSessionService``.
+
+    Attributes:
+        session_service (DatabaseSessionService): The service whose engine, session
+            factory and tables are reused.
+    """
+
+    def __init__(self, session_service: DatabaseSessionService):
+        """
+        Initialize the SessionStore.
+
+        Args:
+            session_service (DatabaseSessionService): The application's session service.
+        """
+
+        self.session_service = session_service
+        self._indexes_created = False
+
+    async def _ensure_ready(self):
+        """Create ADK's tables and this store's indexes once."""
+
+        if self._indexes_created:
+            return
+        await self.session_service._ensure_tables_created()  # pylint: disable=[W0212]
+        async with self.session_service.db_engine.begin() as conn:
+            for statement in _INDEXES:
+                await conn.execute(text(statement))
+        self._indexes_created = True
+        logger.info("Session store indexes are ready.")
+
+    def _update_timestamp(self, update_time: datetime) -> float:
+        """Convert a session ``update_time`` to a POSIX timestamp like ADK does.
+
+        SQLite returns naive datetimes for ``func.now()`` values, which are UTC.
+        """
+
+        if self.session_service.db_engine.dialect.name == "sqlite":
+            update_time = update_time.replace(tzinfo=timezone.utc)
+        return update_time.timestamp()
+
+    async def session_exists(
+        self, app_name: str, user_id: str, session_id: str
+    ) -> bool:
+        """
+        Check whether a session exists, without loading its events or state.
+
+        Args:
+            app_name (str): Name of the application.
+            user_id (str): Unique identifier of the user.
+            session_id (str): Unique identifier of the session.
+
+        Returns:
+            bool: True if the session exists.
+        """
+
+        await self._ensure_ready()
+        async with self.session_service.database_session_factory() as sql_session:
+            result = await sql_session.execute(
+                select(StorageSession.id).where(
+                    StorageSession.app_name == app_name,
+                    StorageSession.user_id == user_id,
+                    StorageSession.id == session_id,
+                )
+            )
+            return result.scalar_one_or_none() is not None
+
+    async def list_text_events(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Page through the text events of a session in chronological order.
+
+        Only the event id, author, timestamp and first text part are read; the
+        page is selected with the ``(session, timestamp, id)`` index. Events are
+        keyset-paginated by ``(timestamp, id)``, using event ids as cursors.
+
+        Args:
+            app_name (str): Name of the application.
+            user_id (str): Unique identifier of the user.
+            session_id (str): Unique identifier of the session.
+            limit (Optional[int]): Maximum number of events to return. ``None``
+                returns every matching event.
+            before (Optional[str]): Only return events older than this event id.
+                Without ``after``, the page is the newest ``limit`` events before it.
+            after (Optional[str]): Only return events newer than this event id.
+
+        Returns:
+            dict[str, Any]: ``{"events": [{"id", "author", "text", "timestamp"}, ...],
+                "has_more": bool}``. ``has_more`` tells whether more events exist
+                beyond the page in the paging direction.
+
+        Raises:
+            ValueError: If a cursor does not match an event of the session.
+        """
+
+        await self._ensure_ready()
+        event_text = func.json_extract(
+            StorageEvent.content, "$.parts[0].text", type_=String
+        )
+        scope = and_(
+            StorageEvent.app_name == app_name,
+            StorageEvent.user_id == user_id,
+            StorageEvent.session_id == session_id,
+        )
+
+        async with self.session_service.database_session_factory() as sql_session:
+            stmt = select(
+                StorageEvent.id, StorageEvent.author, StorageEvent.timestamp, event_text
+            ).where(
+                scope,
+                event_text.is_not(None),
+                event_text.not_in(["", "null"]),
+            )
+
+            for cursor, newer in ((after, True), (before, False)):
+                if cursor is None:
+                    continue
+                cursor_result = await sql_session.execute(
+                    select(StorageEvent.timestamp).where(
+                        scope, StorageEvent.id == cursor
+                    )
+                )
+                cursor_timestamp = cursor_result.scalar_one_or_none()
+                if cursor_timestamp is None:
+                    raise ValueError(f"Unknown cursor event id: {cursor}")
+                if newer:
+                    stmt = stmt.where(
+                        or_(
+                            StorageEvent.timestamp > cursor_timestamp,
+                            and_(
+                                StorageEvent.timestamp == cursor_timestamp,
+                                StorageEvent.id > cursor,
+                            ),
+                        )
+                    )
+                else:
+                    stmt = stmt.where(
+                        or_(
+                            StorageEvent.timestamp < cursor_timestamp,
+                            and_(
+                                StorageEvent.timestamp == cursor_timestamp,
+                                StorageEvent.id < cursor,
+                            ),
+                        )
+                    )
+
+            # Page backwards from the newest events unless paging forward.
+            descending = after is None and limit is not None
+            if descending:
+                stmt = stmt.order_by(
+                    StorageEvent.timestamp.desc(), StorageEvent.id.desc()
+                )
+            else:
+                stmt = stmt.order_by(StorageEvent.timestamp, StorageEvent.id)
+            if limit is not None:
+                stmt = stmt.limit(limit + 1)
+
+            rows = (await sql_session.execute(stmt)).all()
+
+        has_more = limit is not None and len(rows) > limit
+        rows = rows[:limit] if limit is not None else rows
+        if descending:
+            rows = rows[::-1]
+
+        return {
+            "events": [
+                {
+                    "id": row[0],
+                    "author": row[1],
+                    "text": row[3],
+                    "timestamp": row[2].timestamp(),
+                }
+                for row in rows
+            ],
+            "has_more": has_more,
+        }
+
+    async def list_session_summaries(
+        self,
+        app_name: str,
+        user_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        order: Literal["asc", "desc"] = "desc",
+        include_title: bool = False,
+    ) -> dict[str, Any]:
+        """
+        List a user's sessions as lightweight metadata, sorted by last update time.
+
+        Events and state are never loaded: the event count and the optional title
+        (a snippet of the first user message) are computed by correlated subqueries
+        over the events index.
+
+        Args:
+            app_name (str): Name of the application.
+            user_id (str): Unique identifier of the user.
+            limit (Optional[int]): Maximum number of sessions to return (all if None).
+            offset (int): Number of sessions to skip.
+            order (Literal["asc", "desc"]): Sort order of the last update time.
+            include_title (bool): Whether to include a title snippet per session.
+
+        Returns:
+            dict[str, Any]: ``{"total": int, "sessions": [{"id", "last_update_time",
+                "event_count"[, "title"]}, ...]}``.
+        """
+
+        await self._ensure_ready()
+        scope = and_(
+            StorageSession.app_name == app_name, StorageSession.user_id == user_id
+        )
+        same_session = and_(
+            StorageEvent.app_name == StorageSession.app_name,
+            StorageEvent.user_id == StorageSession.user_id,
+            StorageEvent.session_id == StorageSession.id,
+        )
+
+        columns = [
+            StorageSession.id,
+            StorageSession.update_time,
+            select(func.count())
+            .select_from(StorageEvent)
+            .where(same_session)
+            .scalar_subquery(),
+        ]
+        if include_title:
+            columns.append(
+                select(
+                    func.substr(
+                        func.json_extract(StorageEvent.content, "$.parts[0].text"),
+                        1,
+                        TITLE_SNIPPET_LENGTH,
+                    )
+                )
+                .where(same_session, StorageEvent.author == "user")
+                .order_by(StorageEvent.timestamp)
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        sort_keys = [StorageSession.update_time, StorageSession.id]
+        stmt = (
+            select(*columns)
+            .where(scope)
+            .order_by(*(key.desc() if order == "desc" else key for key in sort_keys))
+            .offset(offset)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        async with self.session_service.database_session_factory() as sql_session:
+            total = (
+                await sql_session.execute(
+                    select(func.count()).select_from(StorageSession).where(scope)
+                )
+            ).scalar_one()
+            rows = (await sql_session.execute(stmt)).all()
+
+        sessions = []
+        for row in rows:
+            summary = {
+                "id": row[0],
+                "last_update_time": self._update_timestamp(row[1]),
+                "event_count": row[2],
+            }
+            if include_title:
+                summary["title"] = row[3]
+            sessions.append(summary)
+        return {"total": total, "sessions": sessions}
+
+    async def delete_user_sessions(self, app_name: str, user_id: str) -> int:
+        """
+        Delete all sessions of a user and their events in a single transaction.
+
+        No events are loaded; both deletes are plain ``DELETE ... WHERE`` statements.
+
+        Args:
+            app_name (str): Name of the application.
+            user_id (str): Unique identifier of the user.
+
+        Returns:
+            int: The number of deleted sessions.
+        """
+
+        await self._ensure_ready()
+        async with self.session_service.database_session_factory() as sql_session:
+            async with sql_session.begin():
+                await sql_session.execute(
+                    delete(StorageEvent).where(
+                        StorageEvent.app_name == app_name,
+                        StorageEvent.user_id == user_id,
+                    )
+                )
+                result = await sql_session.execute(
+                    delete(StorageSession).where(
+                        StorageSession.app_name == app_name,
+                        StorageSession.user_id == user_id,
+                    )
+                )
+        return result.rowcount
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Traced Session Service Module.
+
+ADK's ``DatabaseSessionService`` with a span around every storage call, so the
+SQLite reads and writes of a request show up in its trace.
+"""
+
+import os
+from typing import Any, Optional
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.adk.sessions.base_session_service import (
+    GetSessionConfig,
+    ListSessionsResponse,
+)
+from google.adk.sessions.database_session_service import DatabaseSessionService
+from utils.tracing_utils import tracer
+
+
+class TracedDatabaseSessionService(DatabaseSessionService):
+    """A ``DatabaseSessionService`` tracing its storage calls."""
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        with tracer.start_as_current_span("session_service.create_session"):
+            return await super().create_session(
+                app_name=app_name, user_id=user_id, state=state, session_id=session_id
+            )
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        with tracer.start_as_current_span("session_service.get_session") as span:
+            span.set_attribute("session.id", session_id)
+            session = await super().get_session(
+                app_name=app_name, user_id=user_id, session_id=session_id, config=config
+            )
+            if session is not None:
+                span.set_attribute("session.events", len(session.events))
+            return session
+
+    async def list_sessions(
+        self, *, app_name: str, user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        with tracer.start_as_current_span("session_service.list_sessions"):
+            return await super().list_sessions(app_name=app_name, user_id=user_id)
+
+    async def delete_session(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> None:
+        with tracer.start_as_current_span("session_service.delete_session") as span:
+            span.set_attribute("session.id", session_id)
+            await super().delete_session(
+                app_name=app_name, user_id=user_id, session_id=session_id
+            )
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            # Not persisted: no storage call to trace.
+            return await super().append_event(session, event)
+        with tracer.start_as_current_span("session_service.append_event") as span:
+            span.set_attribute("session.id", session.id)
+            span.set_attribute("event.author", event.author)
+            return await super().append_event(session, event)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from stores.vault.vault_index import VaultIndex, get_vault_index
+from stores.vault.vector_index import VectorIndex, get_vector_index
+from stores.vault.filesystem_vault import FilesystemVault
@@ -0,0 +1,362 @@
+"""
+Filesystem Vault Module.
+
+Native access to a locally mounted Obsidian vault, offering the operations of the
+``mcp/obsidian`` toolset (list, read, search, append, patch and delete) without
+the container, the Local REST API hop and the JSON round trips. Paths are
+sandboxed to the vault root, writes are atomic (temporary file + ``os.replace``)
+and blocking file I/O runs in worker threads.
+"""
+
+import os
+import re
+import asyncio
+import tempfile
+from typing import Any, Literal
+from stores.vault.vault_index import scan_markdown_files
+
+_FRONTMATTER_PATTERN = re.compile(r"\A---\n(.*?)\n---\n?", re.DOTALL)
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+
+
+class FilesystemVault:
+    """
+    Sandboxed async file operations on an Obsidian vault.
+
+    Attributes:
+        vault_path (str): Real path of the vault root.
+    """
+
+    def __init__(self, vault_path: str):
+        """
+        Initialize the FilesystemVault.
+
+        Args:
+            vault_path (str): Absolute path of the vault's root directory.
+
+        Raises:
+            ValueError: If ``vault_path`` is empty or relative (``realpath`` would
+                resolve it against the working directory, i.e. the application).
+            FileNotFoundError: If the vault directory does not exist.
+        """
+
+        if not vault_path or not os.path.isabs(vault_path):
+            raise ValueError(
+                f"The vault path must be an absolute path, got {vault_path!r}."
+            )
+        self.vault_path = os.path.realpath(vault_path)
+        if not os.path.isdir(self.vault_path):
+            raise FileNotFoundError(f"Vault directory not found: {vault_path}")
+        # Serializes read-modify-write operations per file.
+        self._file_locks: dict[str, asyncio.Lock] = {}
+
+    def resolve(self, relative_path: str) -> str:
+        """
+        Map a vault-relative path to an absolute path inside the vault.
+
+        Args:
+            relative_path (str): Path relative to the vault root.
+
+        Returns:
+            str: The absolute, symlink-resolved path.
+
+        Raises:
+            ValueError: If the path is absolute, escapes the vault (``..`` or a
+                symlink) or points into a hidden directory such as ``.obsidian``.
+        """
+
+        cleaned = relative_path.strip().replace("\\", "/").strip("/")
+        if os.path.isabs(relative_path) or any(
+            part == ".." or part.startswith(".") for part in cleaned.split("/") if part
+        ):
+            raise ValueError(f"Path is outside the vault: {relative_path}")
+        resolved = os.path.realpath(os.path.join(self.vault_path, cleaned))
+        if os.path.commonpath([resolved, self.vault_path]) != self.vault_path:
+            raise ValueError(f"Path is outside the vault: {relative_path}")
+        return resolved
+
+    def _lock_for(self, path: str) -> asyncio.Lock:
+        """Return the lock of a file."""
+
+        return self._file_locks.setdefault(path, asyncio.Lock())
+
+    @staticmethod
+    def _read(path: str) -> str:
+        """Read a UTF-8 text file."""
+
+        with open(path, encoding="utf-8") as file:
+            return file.read()
+
+    @staticmethod
+    def _write_atomic(path: str, content: str):
+        """Write a file through a temporary sibling so readers never see partial content."""
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=".tmp-", suffix=".md"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            if os.path.exists(path):
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _list(self, relative_dir: str) -> list[str]:
+        """List the entries of a directory; sub-directories end with ``/``."""
+
+        directory = self.resolve(relative_dir) if relative_dir else self.vault_path
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Directory not found: {relative_dir}")
+        return sorted(
+            f"{entry.name}/" if entry.is_dir() else entry.name
+            for entry in os.scandir(directory)
+            if not entry.name.startswith(".")
+            and os.path.commonpath([os.path.realpath(entry.path), self.vault_path])
+            == self.vault_path
+        )
+
+    async def list_files(self, relative_dir: str = "") -> list[str]:
+        """
+        List the files and directories of a vault directory.
+
+        Args:
+            relative_dir (str): Directory relative to the vault root ("" for the root).
+
+        Returns:
+            list[str]: Entry names; directories end with ``/``.
+        """
+
+        return await asyncio.to_thread(self._list, relative_dir)
+
+    async def read_file(self, relative_path: str) -> str:
+        """Return the content of a vault file."""
+
+        return await asyncio.to_thread(self._read, self.resolve(relative_path))
+
+    async def read_files(self, relative_paths: list[str]) -> dict[str, str]:
+        """Return the content of several vault files, read concurrently."""
+
+        contents = await asyncio.gather(
+            *(self.read_file(path) for path in relative_paths)
+        )
+        return dict(zip(relative_paths, contents))
+
+    def _search(self, query: str, context_length: int) -> list[dict[str, Any]]:
+        """Case-insensitive substring search over the markdown notes."""
+
+        needle = query.lower()
+        results = []
+        for relative_path in sorted(scan_markdown_files(self.vault_path)):
+            try:
+                text = self._read(os.path.join(self.vault_path, relative_path))
+            except (OSError, UnicodeDecodeError):
+                continue
+            lowered = text.lower()
+            matches, start = [], lowered.find(needle)
+            while start != -1 and len(matches) < 10:
+                matches.append(
+                    {
+                        "context": text[
+                            max(0, start - context_length) : start
+                            + len(query)
+                            + context_length
+                        ],
+                        "start": start,
+                    }
+                )
+                start = lowered.find(needle, start + len(needle))
+            if matches:
+                results.append({"filename": relative_path, "matches": matches})
+        return results
+
+    async def search(
+        self, query: str, context_length: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Find the notes containing a text.
+
+        Args:
+            query (str): Text to search for (case-insensitive).
+            context_length (int): Characters of context on each side of a match.
+
+        Returns:
+            list[dict[str, Any]]: ``{"filename", "matches": [{"context", "start"}]}``
+                per matching note.
+        """
+
+        if not query.strip():
+            raise ValueError("query must not be empty.")
+        return await asyncio.to_thread(self._search, query, context_length)
+
+    async def append(self, relative_path: str, content: str):
+        """Append content to a note, creating it if needed."""
+
+        path = self.resolve(relative_path)
+        async with self._lock_for(path):
+            existing = (
+                await asyncio.to_thread(self._read, path)
+                if os.path.exists(path)
+                else ""
+            )
+            separator = "\n" if existing and not existing.endswith("\n") else ""
+            await asyncio.to_thread(
+                self._write_atomic, path, f"{existing}{separator}{content}"
+            )
+
+    async def write(self, relative_path: str, content: str):
+        """Create or overwrite a note."""
+
+        path = self.resolve(relative_path)
+        async with self._lock_for(path):
+            await asyncio.to_thread(self._write_atomic, path, content)
+
+    async def patch(
+        self,
+        relative_path: str,
+        operation: Literal["append", "prepend", "replace"],
+        target_type: Literal["heading", "block", "frontmatter"],
+        target: str,
+        content: str,
+    ):
+        """
+        Insert content relative to a heading, a block reference or a frontmatter field.
+
+        Args:
+            relative_path (str): Note path relative to the vault root.
+            operation (str): ``append``, ``prepend`` or ``replace``.
+            target_type (str): ``heading``, ``block`` or ``frontmatter``.
+            target (str): Heading path (``Heading::Sub-heading``), block id
+                (``^id`` or ``id``) or frontmatter field name.
+            content (str): The content to insert.
+
+        Raises:
+            ValueError: If the operation, target type or target is invalid.
+            FileNotFoundError: If the note does not exist.
+        """
+
+        if operation not in ("append", "prepend", "replace"):
+            raise ValueError(f"Unknown operation: {operation}")
+        path = self.resolve(relative_path)
+        async with self._lock_for(path):
+            text = await asyncio.to_thread(self._read, path)
+            if target_type == "heading":
+                patched = _patch_heading(text, operation, target, content)
+            elif target_type == "block":
+                patched = _patch_block(text, operation, target, content)
+            elif target_type == "frontmatter":
+                patched = _patch_frontmatter(text, operation, target, content)
+            else:
+                raise ValueError(f"Unknown target type: {target_type}")
+            await asyncio.to_thread(self._write_atomic, path, patched)
+
+    async def delete(self, relative_path: str):
+        """Delete a note, or an empty directory."""
+
+        path = self.resolve(relative_path)
+        if path == self.vault_path:
+            raise ValueError("Refusing to delete the vault root.")
+        async with self._lock_for(path):
+            if os.path.isdir(path):
+                await asyncio.to_thread(os.rmdir, path)
+            else:
+                await asyncio.to_thread(os.remove, path)
+        self._file_locks.pop(path, None)
+
+
+def _patch_heading(text: str, operation: str, target: str, content: str) -> str:
+    """Patch the section under a (nested) heading."""
+
+    lines = text.split("\n")
+    wanted = [part.strip() for part in target.split("::")]
+    stack: list[tuple[int, str]] = []
+    start = None
+    for index, line in enumerate(lines):
+        match = _HEADING_PATTERN.match(line)
+        if not match:
+            continue
+        level = len(match.group(1))
+        if start is not None and level <= start[1]:
+            end = index
+            break
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, match.group(2)))
+        if start is None and [title for _, title in stack][-len(wanted) :] == wanted:
+            start = (index, level)
+    else:
+        end = len(lines)
+    if start is None:
+        raise ValueError(f"Heading not found: {target}")
+
+    body_start = start[0] + 1
+    body = lines[body_start:end]
+    while body and not body[-1].strip():
+        body.pop()
+    trailing = lines[body_start + len(body) : end]
+    inserted = content.split("\n")
+    if operation == "append":
+        body = body + inserted
+    elif operation == "prepend":
+        body = inserted + body
+    else:
+        body = inserted
+    return "\n".join(lines[:body_start] + body + trailing + lines[end:])
+
+
+def _patch_block(text: str, operation: str, target: str, content: str) -> str:
+    """Patch the line carrying a ``^block-id`` reference."""
+
+    block_id = target.lstrip("^")
+    lines = text.split("\n")
+    for index, line in enumerate(lines):
+        if line.rstrip().endswith(f"^{block_id}"):
+            if operation == "append":
+                lines.insert(index + 1, content)
+            elif operation == "prepend":
+                lines.insert(index, content)
+            else:
+                lines[index] = f"{content} ^{block_id}"
+            return "\n".join(lines)
+    raise ValueError(f"Block not found: {target}")
+
+
+def _patch_frontmatter(text: str, operation: str, target: str, content: str) -> str:
+    """Patch a top-level field of the YAML frontmatter, creating it if needed."""
+
+    match = _FRONTMATTER_PATTERN.match(text)
+    fields = match.group(1).split("\n") if match else []
+    body = text[match.end() :] if match else text
+    prefix = f"{target}:"
+    for index, line in enumerate(fields):
+        if line.startswith(prefix):
+            current = line[len(prefix) :].strip()
+            if operation == "append":
+                value = f"{current} {content}".strip()
+            elif operation == "prepend":
+                value = f"{content} {current}".strip()
+            else:
+                value = content
+            fields[index] = f"{prefix} {value}"
+            break
+    else:
+        fields.append(f"{prefix} {content}")
+    return "---\n" + "\n".join(fields) + "\n---\n" + body
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
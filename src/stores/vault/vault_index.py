@@ -0,0 +1,339 @@
+"""
+Vault Full-Text Index Module.
+
+A local BM25 inverted index over the markdown notes of an Obsidian vault. The
+index is refreshed incrementally: a note is only re-read when its mtime or size
+changed, and only re-tokenized when its content hash changed. The index is
+persisted under ``PATH_DATA_ROOT`` so restarts do not rebuild it from scratch.
+"""
+
+import os
+import re
+import math
+import heapq
+import pickle
+import hashlib
+import threading
+from collections import Counter
+from typing import Any, Optional
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_INDEX_VERSION = 1
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase a text and split it into word tokens, dropping single characters."""
+
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1]
+
+
+def scan_markdown_files(vault_path: str) -> dict[str, os.stat_result]:
+    """
+    Return the stat of every markdown file of a vault, by ``/``-separated relative path.
+
+    Hidden files and directories (``.obsidian``, ``.trash``...) are skipped.
+    """
+
+    found: dict[str, os.stat_result] = {}
+    stack = [vault_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                relative = os.path.relpath(entry.path, vault_path).replace(os.sep, "/")
+                found[relative] = entry.stat()
+    return found
+
+
+class VaultIndex:
+    """
+    Incremental BM25 index over the ``.md`` files of a vault.
+
+    Attributes:
+        vault_path (str): Root directory of the vault.
+        index_path (Optional[str]): Pickle file the index is persisted to.
+        k1 (float): BM25 term-frequency saturation.
+        b (float): BM25 length normalization.
+    """
+
+    def __init__(
+        self,
+        vault_path: str,
+        index_path: Optional[str] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Initialize the index and load its persisted state, if any.
+
+        Args:
+            vault_path (str): Root directory of the vault.
+            index_path (Optional[str]): Pickle file the index is persisted to.
+            k1 (float): BM25 term-frequency saturation.
+            b (float): BM25 length normalization.
+        """
+
+        self.vault_path = os.path.abspath(vault_path)
+        self.index_path = index_path
+        self.k1 = k1
+        self.b = b
+        # Guards the in-memory structures; held briefly by writers and by searches.
+        self._lock = threading.Lock()
+        # Serializes refreshes; held while persisting so searches are not blocked.
+        self._refresh_lock = threading.Lock()
+
+        # path -> {"mtime", "size", "hash", "length", "terms"}, where "terms" is the
+        # space-separated "term frequency" pairs of the note (compact to persist).
+        self._docs: dict[str, dict[str, Any]] = {}
+        # term -> {path: term frequency}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        self._load()
+
+    def _load(self):
+        """Load the persisted index if it matches this vault and version."""
+
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "rb") as file:
+                state = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError) as exc:
+            logger.warning(
+                "Ignoring unreadable vault index %s: %s", self.index_path, exc
+            )
+            return
+        if (
+            state.get("version") != _INDEX_VERSION
+            or state.get("vault_path") != self.vault_path
+        ):
+            return
+        self._docs = state["docs"]
+        self._postings = state["postings"]
+        self._total_length = sum(doc["length"] for doc in self._docs.values())
+        logger.info("Loaded vault index with %s notes.", len(self._docs))
+
+    def _save(self):
+        """Persist the index atomically."""
+
+        if not self.index_path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(
+                {
+                    "version": _INDEX_VERSION,
+                    "vault_path": self.vault_path,
+                    "docs": self._docs,
+                    "postings": self._postings,
+                },
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, self.index_path)
+
+    def _remove(self, path: str):
+        """Drop a note from the postings."""
+
+        doc = self._docs.pop(path)
+        self._total_length -= doc["length"]
+        for term in doc["terms"].split(" ")[::2]:
+            postings = self._postings[term]
+            postings.pop(path, None)
+            if not postings:
+                del self._postings[term]
+
+    def _add(self, path: str, stat: os.stat_result, content_hash: str, text: str):
+        """Tokenize a note and add it to the postings. The title counts twice."""
+
+        title = os.path.splitext(os.path.basename(path))[0]
+        terms = Counter(tokenize(text))
+        terms.update(tokenize(title) * 2)
+        length = sum(terms.values())
+        self._docs[path] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": content_hash,
+            "length": length,
+            "terms": " ".join(
+                f"{term} {frequency}" for term, frequency in terms.items()
+            ),
+        }
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[path] = frequency
+
+    def refresh(self) -> dict[str, int]:
+        """
+        Bring the index up to date with the vault.
+
+        Returns:
+            dict[str, int]: Counts of ``added``, ``updated``, ``removed`` and
+                ``unchanged`` notes.
+        """
+
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self._refresh_lock:
+            found = scan_markdown_files(self.vault_path)
+            with self._lock:
+                for path in [path for path in self._docs if path not in found]:
+                    self._remove(path)
+                    counts["removed"] += 1
+
+            for path, stat in found.items():
+                doc = self._docs.get(path)
+                if (
+                    doc
+                    and doc["mtime"] == stat.st_mtime_ns
+                    and doc["size"] == stat.st_size
+                ):
+                    counts["unchanged"] += 1
+                    continue
+                try:
+                    with open(os.path.join(self.vault_path, path), "rb") as file:
+                        raw = file.read()
+                except OSError:
+                    continue
+                content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                if doc and doc["hash"] == content_hash:
+                    doc["mtime"], doc["size"] = stat.st_mtime_ns, stat.st_size
+                    counts["unchanged"] += 1
+                    continue
+                text = raw.decode("utf-8", errors="replace")
+                with self._lock:
+                    if doc:
+                        self._remove(path)
+                        counts["updated"] += 1
+                    else:
+                        counts["added"] += 1
+                    self._add(path, stat, content_hash, text)
+
+            if counts["added"] or counts["updated"] or counts["removed"]:
+                # Only refreshes mutate the index, so it is consistent while pickling.
+                self._save()
+                logger.info("Vault index refreshed: %s", counts)
+        return counts
+
+    def _snippet(self, path: str, terms: set[str], width: int = 160) -> str:
+        """Return the text around the first query term found in a note."""
+
+        try:
+            with open(
+                os.path.join(self.vault_path, path), encoding="utf-8", errors="replace"
+            ) as file:
+                text = file.read()
+        except OSError:
+            return ""
+        for match in _TOKEN_PATTERN.finditer(text):
+            if match.group().lower() in terms:
+                start = max(0, match.start() - width // 2)
+                return " ".join(text[start : start + width].split())
+        return " ".join(text[:width].split())
+
+    def search(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """
+        Rank the notes against a query with BM25.
+
+        Args:
+            query (str): Free-text query.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list[dict[str, Any]]: Results with ``path``, ``score`` and ``snippet``,
+                best first.
+        """
+
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._docs)
+            if not terms or not count:
+                return []
+            average_length = self._total_length / count
+            scores: dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(
+                    1 + (count - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                for path, frequency in postings.items():
+                    norm = self.k1 * (
+                        1
+                        - self.b
+                        + self.b * self._docs[path]["length"] / average_length
+                    )
+                    scores[path] = scores.get(path, 0.0) + idf * frequency * (
+                        self.k1 + 1
+                    ) / (frequency + norm)
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+        return [
+            {
+                "path": path,
+                "score": round(score, 4),
+                "snippet": self._snippet(path, terms),
+            }
+            for path, score in best
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of indexed notes and distinct terms."""
+
+        with self._lock:
+            return {"notes": len(self._docs), "terms": len(self._postings)}
+
+
+_vault_index: Optional[VaultIndex] = None
+_vault_index_lock = threading.Lock()
+
+
+def get_vault_index() -> Optional[VaultIndex]:
+    """
+    Return the process-wide vault index, or None if ``VAULT_PATH`` is not set.
+
+    Returns:
+        Optional[VaultIndex]: The shared index instance.
+    """
+
+    global _vault_index  # pylint: disable=[W0603]
+    settings = get_settings()
+    if not settings.VAULT_PATH:
+        return None
+    if _vault_index is None:
+        with _vault_index_lock:
+            if _vault_index is None:
+                _vault_index = VaultIndex(
+                    vault_path=settings.VAULT_PATH,
+                    index_path=os.path.join(settings.PATH_DATA_ROOT, "vault_index.pkl"),
+                )
+    return _vault_index
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
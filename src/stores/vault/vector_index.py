@@ -0,0 +1,533 @@
+"""
+Vault Vector Index Module.
+
+Chunks the markdown notes of an Obsidian vault by heading and paragraph, embeds
+the chunks with the local hashing embedder and stores the vectors in a
+memory-mapped ``float32`` file, so the index is not loaded in RAM. Large indexes
+are searched through an inverted-file (IVF) structure: vectors are clustered with
+spherical k-means and a query only scans the clusters of its nearest centroids,
+plus the rows appended since the last training, which are scanned exhaustively
+until the next training so fresh edits are always found.
+Notes are re-chunked incrementally by mtime, size and content hash.
+"""
+
+import os
+import re
+import math
+import pickle
+import hashlib
+import threading
+from typing import Any, Optional
+import numpy as np
+from stores.llm.embeddings import HashingEmbedder
+from stores.vault.vault_index import scan_markdown_files
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.*)$")
+_INDEX_VERSION = 1
+
+
+def chunk_markdown(text: str, max_tokens: int = 256) -> list[dict[str, str]]:
+    """
+    Split a markdown note into passages of at most ``max_tokens`` (estimated at
+    four characters per token).
+
+    Sections are split on headings, then paragraphs are packed into passages;
+    paragraphs longer than the budget are split on words.
+
+    Args:
+        text (str): The markdown text.
+        max_tokens (int): Token budget of a passage.
+
+    Returns:
+        list[dict[str, str]]: Passages with their ``heading`` and ``text``.
+    """
+
+    sections: list[tuple[str, list[str]]] = [("", [])]
+    for line in text.splitlines():
+        match = _HEADING_PATTERN.match(line)
+        if match:
+            sections.append((match.group(1).strip(), []))
+        else:
+            sections[-1][1].append(line)
+
+    max_chars = max_tokens * 4
+    chunks: list[dict[str, str]] = []
+    for heading, lines in sections:
+        paragraphs = [p.strip() for p in "\n".join(lines).split("\n\n") if p.strip()]
+        pieces: list[str] = []
+        for paragraph in paragraphs:
+            if len(paragraph) <= max_chars:
+                pieces.append(paragraph)
+                continue
+            words, current = paragraph.split(), []
+            for word in words:
+                if current and len(" ".join(current)) + len(word) + 1 > max_chars:
+                    pieces.append(" ".join(current))
+                    current = []
+                current.append(word)
+            if current:
+                pieces.append(" ".join(current))
+
+        buffer = ""
+        for piece in pieces:
+            if buffer and len(buffer) + len(piece) + 2 > max_chars:
+                chunks.append({"heading": heading, "text": buffer})
+                buffer = ""
+            buffer = f"{buffer}\n\n{piece}" if buffer else piece
+        if buffer:
+            chunks.append({"heading": heading, "text": buffer})
+    return chunks
+
+
+class VectorIndex:
+    """
+    Memory-mapped vector index over the chunks of a vault's notes.
+
+    Rows of deleted or changed notes are tombstoned and reclaimed by compaction.
+
+    Attributes:
+        vault_path (str): Root directory of the vault.
+        index_dir (str): Directory holding ``vectors.f32`` and ``meta.pkl``.
+        embedder (HashingEmbedder): Embeds the passages and the queries.
+        chunk_tokens (int): Token budget of a passage.
+        ann_min_rows (int): Below this many live rows, search is exhaustive.
+        probes (int): Number of IVF clusters scanned per query.
+    """
+
+    def __init__(
+        self,
+        vault_path: str,
+        index_dir: str,
+        embedder: Optional[HashingEmbedder] = None,
+        chunk_tokens: int = 256,
+        ann_min_rows: int = 4096,
+        probes: int = 8,
+    ):
+        """
+        Initialize the index and load its persisted state, if any.
+
+        Args:
+            vault_path (str): Root directory of the vault.
+            index_dir (str): Directory holding the index files.
+            embedder (Optional[HashingEmbedder]): Embeds the passages and queries.
+            chunk_tokens (int): Token budget of a passage.
+            ann_min_rows (int): Below this many live rows, search is exhaustive.
+            probes (int): Number of IVF clusters scanned per query.
+        """
+
+        self.vault_path = os.path.abspath(vault_path)
+        self.index_dir = index_dir
+        self.embedder = embedder or HashingEmbedder(dim=512)
+        self.chunk_tokens = chunk_tokens
+        self.ann_min_rows = ann_min_rows
+        self.probes = probes
+        self._vectors_path = os.path.join(index_dir, "vectors.f32")
+        self._meta_path = os.path.join(index_dir, "meta.pkl")
+        # Same locking scheme as VaultIndex: short mutations vs. whole refreshes.
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        # path -> {"mtime", "size", "hash", "rows": [row, ...]}
+        self._docs: dict[str, dict[str, Any]] = {}
+        # row -> {"path", "heading", "text"}, or None once tombstoned.
+        self._chunks: list[Optional[dict[str, str]]] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._vectors: Optional[np.memmap] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._lists: list[np.ndarray] = []
+        self._trained_rows = 0
+
+        os.makedirs(index_dir, exist_ok=True)
+        self._load()
+
+    @property
+    def live_rows(self) -> int:
+        """Number of non-tombstoned rows."""
+
+        return int(self._alive.sum())
+
+    def _open_vectors(self):
+        """(Re)open the memory map over the vectors file."""
+
+        rows = len(self._chunks)
+        self._vectors = (
+            np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(rows, self.embedder.dim),
+            )
+            if rows
+            else None
+        )
+
+    def _load(self):
+        """Load the persisted index if it matches this vault, dimension and version."""
+
+        if not os.path.exists(self._meta_path) or not os.path.exists(
+            self._vectors_path
+        ):
+            open(self._vectors_path, "wb").close()
+            return
+        try:
+            with open(self._meta_path, "rb") as file:
+                state = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError) as exc:
+            logger.warning(
+                "Ignoring unreadable vector index %s: %s", self._meta_path, exc
+            )
+            open(self._vectors_path, "wb").close()
+            return
+        expected_size = len(state["chunks"]) * self.embedder.dim * 4
+        if (
+            state.get("version") != _INDEX_VERSION
+            or state.get("vault_path") != self.vault_path
+            or state.get("dim") != self.embedder.dim
+            or os.path.getsize(self._vectors_path) != expected_size
+        ):
+            open(self._vectors_path, "wb").close()
+            return
+        self._docs = state["docs"]
+        self._chunks = state["chunks"]
+        self._alive = np.array(
+            [chunk is not None for chunk in self._chunks], dtype=bool
+        )
+        self._centroids = state["centroids"]
+        self._assignments = state["assignments"]
+        self._trained_rows = state["trained_rows"]
+        self._open_vectors()
+        self._build_lists()
+        logger.info("Loaded vector index with %s passages.", self.live_rows)
+
+    def _save(self):
+        """Persist the metadata atomically (vectors are already on disk)."""
+
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(
+                {
+                    "version": _INDEX_VERSION,
+                    "vault_path": self.vault_path,
+                    "dim": self.embedder.dim,
+                    "docs": self._docs,
+                    "chunks": self._chunks,
+                    "centroids": self._centroids,
+                    "assignments": self._assignments,
+                    "trained_rows": self._trained_rows,
+                },
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, self._meta_path)
+
+    def _build_lists(self):
+        """Group the rows by IVF cluster."""
+
+        if self._centroids is None:
+            self._lists = []
+            return
+        order = np.argsort(self._assignments, kind="stable")
+        bounds = np.searchsorted(
+            self._assignments[order], np.arange(len(self._centroids) + 1)
+        )
+        self._lists = [
+            order[bounds[i] : bounds[i + 1]] for i in range(len(self._centroids))
+        ]
+
+    @staticmethod
+    def _assign(
+        centroids: np.ndarray, vectors: np.ndarray, batch: int = 8192
+    ) -> np.ndarray:
+        """Return the nearest centroid of each vector."""
+
+        if not len(vectors):
+            return np.zeros(0, dtype=np.int32)
+        return np.concatenate(
+            [
+                np.argmax(vectors[i : i + batch] @ centroids.T, axis=1)
+                for i in range(0, len(vectors), batch)
+            ]
+        ).astype(np.int32)
+
+    def _train(
+        self, iterations: int = 10, sample_size: int = 20000
+    ) -> tuple[np.ndarray, np.ndarray, int]:
+        """
+        Cluster the live rows with spherical k-means.
+
+        Only reads the vectors, so it runs without holding the search lock.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, int]: The centroids, the cluster of every
+                row and the number of live rows trained on.
+        """
+
+        assert self._vectors is not None
+        vectors = self._vectors
+        live = np.flatnonzero(self._alive)
+        rng = np.random.default_rng(0)
+        sample = np.asarray(
+            vectors[
+                np.sort(rng.choice(live, min(sample_size, len(live)), replace=False))
+            ]
+        )
+        n_lists = max(1, int(math.sqrt(len(live))))
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            clusters, starts = np.unique(labels[order], return_index=True)
+            centroids[clusters] = np.add.reduceat(sample[order], starts, axis=0)
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids /= np.where(norms > 0, norms, 1.0)
+        logger.info("Trained vector index with %s clusters.", n_lists)
+        return centroids, self._assign(centroids, vectors), len(live)
+
+    def _compact(self):
+        """Rewrite the vectors file without the tombstoned rows."""
+
+        live = np.flatnonzero(self._alive).tolist()
+        remap = {old: new for new, old in enumerate(live)}
+        tmp_path = f"{self._vectors_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            if self._vectors is not None:
+                for start in range(0, len(live), 8192):
+                    file.write(
+                        np.ascontiguousarray(
+                            self._vectors[live[start : start + 8192]]
+                        ).tobytes()
+                    )
+        self._vectors = None
+        os.replace(tmp_path, self._vectors_path)
+        self._chunks = [self._chunks[row] for row in live]
+        self._alive = np.ones(len(live), dtype=bool)
+        for doc in self._docs.values():
+            doc["rows"] = [remap[row] for row in doc["rows"]]
+        # Row ids changed: drop the IVF structure, the caller retrains it.
+        self._centroids, self._lists = None, []
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._open_vectors()
+
+    def _tombstone(self, path: str):
+        """Drop the rows of a note."""
+
+        rows = self._docs.pop(path)["rows"]
+        for row in rows:
+            self._chunks[row] = None
+        self._alive[rows] = False
+
+    def _append(
+        self,
+        path: str,
+        doc: dict[str, Any],
+        passages: list[dict[str, str]],
+        vectors: np.ndarray,
+    ):
+        """Append the embedded passages of a note to the vectors file."""
+
+        start = len(self._chunks)
+        with open(self._vectors_path, "ab") as file:
+            file.write(vectors.astype(np.float32).tobytes())
+        self._chunks.extend({"path": path, **passage} for passage in passages)
+        self._alive = np.concatenate([self._alive, np.ones(len(passages), dtype=bool)])
+        doc["rows"] = list(range(start, len(self._chunks)))
+        self._docs[path] = doc
+
+    def refresh(self) -> dict[str, int]:
+        """
+        Bring the index up to date with the vault, compacting and (re)training the
+        IVF structure when needed.
+
+        Returns:
+            dict[str, int]: Counts of ``added``, ``updated``, ``removed`` and
+                ``unchanged`` notes.
+        """
+
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self._refresh_lock:
+            found = scan_markdown_files(self.vault_path)
+            changed: list[
+                tuple[str, dict[str, Any], list[dict[str, str]], np.ndarray]
+            ] = []
+            for path, stat in found.items():
+                doc = self._docs.get(path)
+                if (
+                    doc
+                    and doc["mtime"] == stat.st_mtime_ns
+                    and doc["size"] == stat.st_size
+                ):
+                    counts["unchanged"] += 1
+                    continue
+                try:
+                    with open(os.path.join(self.vault_path, path), "rb") as file:
+                        raw = file.read()
+                except OSError:
+                    continue
+                content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                if doc and doc["hash"] == content_hash:
+                    doc["mtime"], doc["size"] = stat.st_mtime_ns, stat.st_size
+                    counts["unchanged"] += 1
+                    continue
+                counts["updated" if doc else "added"] += 1
+                passages = chunk_markdown(
+                    raw.decode("utf-8", errors="replace"), self.chunk_tokens
+                )
+                changed.append(
+                    (
+                        path,
+                        {
+                            "mtime": stat.st_mtime_ns,
+                            "size": stat.st_size,
+                            "hash": content_hash,
+                        },
+                        passages,
+                        self.embedder.embed_many(
+                            [
+                                f"{passage['heading']}\n{passage['text']}"
+                                for passage in passages
+                            ]
+                        ),
+                    )
+                )
+
+            removed = [path for path in self._docs if path not in found]
+            counts["removed"] = len(removed)
+            if not changed and not removed:
+                return counts
+
+            with self._lock:
+                for path in removed:
+                    self._tombstone(path)
+                for path, *_ in changed:
+                    if path in self._docs:
+                        self._tombstone(path)
+                for path, doc, passages, vectors in changed:
+                    self._append(path, doc, passages, vectors)
+
+                live = self.live_rows
+                if len(self._chunks) - live > max(1024, live // 3):
+                    self._compact()
+                else:
+                    self._open_vectors()
+                fresh_rows = len(self._chunks) - len(self._assignments)
+                retrain = live >= self.ann_min_rows and (
+                    self._centroids is None or fresh_rows > self._trained_rows // 2
+                )
+                if live < self.ann_min_rows and self._centroids is not None:
+                    self._centroids, self._lists = None, []
+                    self._assignments = np.zeros(0, dtype=np.int32)
+
+            if retrain:
+                centroids, assignments, trained_rows = self._train()
+                with self._lock:
+                    self._centroids, self._assignments = centroids, assignments
+                    self._trained_rows = trained_rows
+                    self._build_lists()
+
+            self._save()
+            logger.info("Vector index refreshed: %s", counts)
+        return counts
+
+    def search(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
+        """
+        Return the passages most similar to a query.
+
+        Args:
+            query (str): Free-text query.
+            top_k (int): Maximum number of passages.
+
+        Returns:
+            list[dict[str, Any]]: Passages with ``path``, ``heading``, ``text`` and
+                ``score``, best first.
+        """
+
+        vector = self.embedder.embed(query)
+        with self._lock:
+            if self._vectors is None or not vector.any():
+                return []
+            if self._centroids is None:
+                candidates = np.arange(len(self._chunks))
+            else:
+                nearest = np.argsort(self._centroids @ vector)[::-1][: self.probes]
+                fresh = np.arange(len(self._assignments), len(self._chunks))
+                candidates = np.sort(
+                    np.concatenate([*(self._lists[i] for i in nearest), fresh])
+                )
+            if not len(candidates):
+                return []
+            scores = np.asarray(self._vectors[candidates] @ vector)
+            alive = self._alive[candidates]
+            scores[~alive] = -np.inf
+            k = min(top_k, int(alive.sum()))
+            if k <= 0:
+                return []
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+            return [
+                {**self._chunks[candidates[i]], "score": round(float(scores[i]), 4)}  # type: ignore
+                for i in best
+                if scores[i] > 0
+            ]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of notes, live passages, rows on disk and IVF clusters."""
+
+        with self._lock:
+            return {
+                "notes": len(self._docs),
+                "passages": self.live_rows,
+                "rows": len(self._chunks),
+                "clusters": 0 if self._centroids is None else len(self._centroids),
+            }
+
+
+_vector_index: Optional[VectorIndex] = None
+_vector_index_lock = threading.Lock()
+
+
+def get_vector_index() -> Optional[VectorIndex]:
+    """
+    Return the process-wide vector index, or None unless ``VECTOR_INDEX_ENABLED`` is
+    true and ``VAULT_PATH`` is set.
+
+    Returns:
+        Optional[VectorIndex]: The shared index instance.
+    """
+
+    global _vector_index  # pylint: disable=[W0603]
+    settings = get_settings()
+    if not settings.VECTOR_INDEX_ENABLED or not settings.VAULT_PATH:
+        return None
+    if _vector_index is None:
+        with _vector_index_lock:
+            if _vector_index is None:
+                _vector_index = VectorIndex(
+                    vault_path=settings.VAULT_PATH,
+                    index_dir=os.path.join(settings.PATH_DATA_ROOT, "vector_index"),
+                    embedder=HashingEmbedder(dim=settings.VECTOR_INDEX_DIM),
+                    chunk_tokens=settings.VECTOR_CHUNK_TOKENS,
+                    ann_min_rows=settings.VECTOR_ANN_MIN_ROWS,
+                    probes=settings.VECTOR_ANN_PROBES,
+                )
+    return _vector_index
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+from stores.youtube.transcript_cache import (
+    TranscriptCache,
+    canonical_video_id,
+    find_video_ids,
+    get_transcript_cache,
+)
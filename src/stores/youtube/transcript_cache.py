@@ -0,0 +1,367 @@
+"""
+Transcript Cache Module.
+
+On-disk cache of YouTube transcripts keyed by canonical video ID and language, so
+a video mentioned again (in the same session or a later one) does not go through
+``mcp/youtube-transcript`` a second time.
+
+Transcripts are stored gzip-compressed and content-addressed: the blob file is
+named by the SHA-256 of the transcript, so identical transcripts (the same video
+under two language codes falling back to the same captions) share one blob. A JSON
+index maps ``video_id:lang`` to its blob, size and last access time; once the
+blobs exceed ``max_bytes`` the least recently used entries are evicted.
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+_VIDEO_ID_PATTERN = re.compile(r"^[\w-]{11}$")
+_YOUTUBE_HOSTS = {
+    "youtube.com",
+    "m.youtube.com",
+    "music.youtube.com",
+    "youtube-nocookie.com",
+}
+
+
+def canonical_video_id(url_or_id: str) -> Optional[str]:
+    """
+    Extract the 11-character video ID of a YouTube URL (or a bare ID).
+
+    Handles ``watch?v=``, ``youtu.be/``, ``shorts/``, ``live/``, ``embed/`` and
+    ``v/`` links, with or without scheme, ``www.`` and extra query parameters.
+
+    Args:
+        url_or_id (str): A YouTube URL or video ID.
+
+    Returns:
+        Optional[str]: The video ID, or None if none was found.
+    """
+
+    text = url_or_id.strip()
+    if _VIDEO_ID_PATTERN.match(text):
+        return text
+    parsed = urlparse(text if "://" in text else f"https://{text}")
+    host = (parsed.hostname or "").removeprefix("www.")
+    candidate = None
+    if host == "youtu.be":
+        candidate = parsed.path.strip("/").split("/")[0]
+    elif host in _YOUTUBE_HOSTS:
+        parts = [part for part in parsed.path.split("/") if part]
+        if parts[:1] == ["watch"]:
+            candidate = parse_qs(parsed.query).get("v", [""])[0]
+        elif len(parts) >= 2 and parts[0] in ("shorts", "live", "embed", "v"):
+            candidate = parts[1]
+    if candidate and _VIDEO_ID_PATTERN.match(candidate):
+        return candidate
+    return None
+
+
+def find_video_ids(text: str) -> list[str]:
+    """
+    Return the IDs of the YouTube videos linked in a text, in order and without duplicates.
+
+    Args:
+        text (str): Free text, such as a user message.
+
+    Returns:
+        list[str]: The canonical video IDs.
+    """
+
+    video_ids: list[str] = []
+    for token in text.split():
+        if "youtu" not in token:
+            continue
+        video_id = canonical_video_id(token.strip("<>()[]{}\"'.,;!?"))
+        if video_id is not None and video_id not in video_ids:
+            video_ids.append(video_id)
+    return video_ids
+
+
+def _normalize_lang(lang: str) -> str:
+    """Normalize a language code (``EN_us`` -> ``en-us``)."""
+
+    return (lang or "en").strip().lower().replace("_", "-")
+
+
+class TranscriptCache:
+    """
+    Size-bounded, content-addressed LRU cache of transcripts.
+
+    Attributes:
+        root_dir (str): Directory holding the index file and the blobs.
+        max_bytes (int): Maximum compressed size of the blobs (0 disables eviction).
+        hits (int): Number of cache hits since start-up.
+        misses (int): Number of cache misses since start-up.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, root_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache and load its index.
+
+        Args:
+            root_dir (str): Directory holding the index file and the blobs.
+            max_bytes (int): Maximum compressed size of the blobs.
+        """
+
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # "video_id:lang" -> {"video_id", "lang", "blob", "size", "created", "accessed"}
+        self._entries: dict[str, dict[str, Any]] = {}
+        os.makedirs(os.path.join(self.root_dir, "blobs"), exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(video_id: str, lang: str = "en") -> str:
+        """Return the index key of a video and language."""
+
+        return f"{video_id}:{_normalize_lang(lang)}"
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root_dir, self.INDEX_FILE)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root_dir, "blobs", digest[:2], f"{digest}.txt.gz")
+
+    def _load_index(self):
+        """Load the index, dropping entries whose blob disappeared."""
+
+        try:
+            with open(self._index_path(), encoding="utf-8") as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable transcript cache index: %s", exc)
+            return
+        self._entries = {
+            key: entry
+            for key, entry in entries.items()
+            if os.path.exists(self._blob_path(entry["blob"]))
+        }
+
+    def _save_index(self):
+        """Atomically rewrite the index file (caller holds the lock)."""
+
+        descriptor, tmp_path = tempfile.mkstemp(
+            dir=self.root_dir, prefix=".index-", suffix=".json"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(self._entries, file)
+            os.replace(tmp_path, self._index_path())
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _total_bytes(self) -> int:
+        """Compressed size of the distinct blobs (caller holds the lock)."""
+
+        return sum(
+            {entry["blob"]: entry["size"] for entry in self._entries.values()}.values()
+        )
+
+    def _drop(self, key: str) -> int:
+        """
+        Remove an entry, and its blob if no other entry shares it (caller holds the lock).
+
+        Returns:
+            int: Number of freed bytes.
+        """
+
+        entry = self._entries.pop(key, None)
+        if entry is None or any(
+            other["blob"] == entry["blob"] for other in self._entries.values()
+        ):
+            return 0
+        try:
+            os.remove(self._blob_path(entry["blob"]))
+        except FileNotFoundError:
+            pass
+        return entry["size"]
+
+    def _evict(self):
+        """Evict least recently used entries until the blobs fit (caller holds the lock)."""
+
+        if self.max_bytes <= 0:
+            return
+        total = self._total_bytes()
+        for key in sorted(
+            self._entries, key=lambda key: self._entries[key]["accessed"]
+        ):
+            if total <= self.max_bytes:
+                break
+            total -= self._drop(key)
+            logger.info("Evicted transcript %s from the cache", key)
+
+    def get(self, video_id: str, lang: str = "en") -> Optional[str]:
+        """
+        Return a cached transcript.
+
+        Args:
+            video_id (str): Canonical video ID.
+            lang (str): Language code.
+
+        Returns:
+            Optional[str]: The transcript, or None on a miss.
+        """
+
+        key = self.key(video_id, lang)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            try:
+                with gzip.open(
+                    self._blob_path(entry["blob"]), "rt", encoding="utf-8"
+                ) as file:
+                    transcript = file.read()
+            except (OSError, EOFError) as exc:
+                logger.warning("Dropping unreadable cached transcript %s: %s", key, exc)
+                self._drop(key)
+                self._save_index()
+                self.misses += 1
+                return None
+            entry["accessed"] = time.time()
+            self.hits += 1
+            return transcript
+
+    def put(self, video_id: str, transcript: str, lang: str = "en"):
+        """
+        Store a transcript, then evict the least recently used entries if needed.
+
+        Args:
+            video_id (str): Canonical video ID.
+            transcript (str): The transcript text.
+            lang (str): Language code.
+        """
+
+        data = transcript.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+        key = self.key(video_id, lang)
+        with self._lock:
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(blob_path))
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(gzip.compress(data))
+                os.replace(tmp_path, blob_path)
+            now = time.time()
+            previous = self._entries.get(key)
+            if previous is not None and previous["blob"] != digest:
+                self._drop(key)
+            self._entries[key] = {
+                "video_id": video_id,
+                "lang": _normalize_lang(lang),
+                "blob": digest,
+                "size": os.path.getsize(blob_path),
+                "created": now,
+                "accessed": now,
+            }
+            self._evict()
+            self._save_index()
+
+    def invalidate(self, video_id: str, lang: Optional[str] = None) -> int:
+        """
+        Remove the cached transcripts of a video.
+
+        Args:
+            video_id (str): Canonical video ID.
+            lang (Optional[str]): Only this language; None removes every language.
+
+        Returns:
+            int: Number of removed entries.
+        """
+
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if entry["video_id"] == video_id
+                and (lang is None or entry["lang"] == _normalize_lang(lang))
+            ]
+            for key in keys:
+                self._drop(key)
+            if keys:
+                self._save_index()
+            return len(keys)
+
+    def flush(self):
+        """Persist the index, including the access times of recent hits."""
+
+        with self._lock:
+            self._save_index()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the entry count, the compressed size and the hit/miss counters."""
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes(),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_transcript_cache: Optional[TranscriptCache] = None
+_transcript_cache_lock = threading.Lock()
+
+
+def get_transcript_cache() -> Optional[TranscriptCache]:
+    """
+    Return the process-wide transcript cache, or None if ``TRANSCRIPT_CACHE_ENABLED`` is false.
+
+    Returns:
+        Optional[TranscriptCache]: The shared cache instance.
+    """
+
+    global _transcript_cache  # pylint: disable=[W0603]
+    settings = get_settings()
+    if not settings.TRANSCRIPT_CACHE_ENABLED:
+        return None
+    if _transcript_cache is None:
+        with _transcript_cache_lock:
+            if _transcript_cache is None:
+                _transcript_cache = TranscriptCache(
+                    root_dir=os.path.join(settings.PATH_DATA_ROOT, "transcripts"),
+                    max_bytes=settings.TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024,
+                )
+    return _transcript_cache
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
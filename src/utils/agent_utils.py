@@ -1,6 +1,18 @@
 import os
+import asyncio
+from typing import Optional
 from google.adk.agents.callback_context import CallbackContext
-from google.genai.types import Content
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai.types import Content, Part
+from stores.llm.response_cache import get_llm_response_cache, make_cache_key
+from stores.llm.semantic_cache import get_semantic_cache
+
+# Cache keys of in-flight model calls, by (invocation id, agent name).
+_pending_cache_keys: dict[tuple[str, str], str] = {}
+# Tools whose results depend on the user's vault: answers built on them are not
+# cached, since the notes may change under them.
+_UNCACHEABLE_TOOLS = frozenset({"retrieve_notes"})
 
 
 def suppress_output_callback(callback_context: CallbackContext) -> Content:
@@ -8,6 +20,128 @@ def suppress_output_callback(callback_context: CallbackContext) -> Content:
     return Content()
 
 
+async def llm_cache_before_model_callback(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """Return the cached response of an identical request, skipping the model call.
+
+    A no-op when ``LLM_CACHE_ENABLED`` is false.
+    """
+
+    cache = get_llm_response_cache()
+    if cache is None:
+        return None
+
+    key = make_cache_key(llm_request)
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached is None:
+        _pending_cache_keys[
+            (callback_context.invocation_id, callback_context.agent_name)
+        ] = key
+    return cached
+
+
+async def llm_cache_after_model_callback(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """Store the complete response of a cache miss. Partial chunks and errors are skipped."""
+
+    cache = get_llm_response_cache()
+    if cache is None or llm_response.partial:
+        return None
+
+    key = _pending_cache_keys.pop(
+        (callback_context.invocation_id, callback_context.agent_name), None
+    )
+    if key is not None and llm_response.error_code is None and llm_response.content:
+        await asyncio.to_thread(
+            cache.set, key, llm_response.model_version, llm_response
+        )
+    return None
+
+
+def llm_cache_on_model_error_callback(
+    callback_context: CallbackContext, llm_request: LlmRequest, error: Exception
+) -> Optional[LlmResponse]:
+    """Forget the cache key of a model call that raised: nothing will be stored for it."""
+
+    _pending_cache_keys.pop(
+        (callback_context.invocation_id, callback_context.agent_name), None
+    )
+    return None
+
+
+def _user_text(callback_context: CallbackContext) -> str:
+    """Return the text of the user message that started the invocation."""
+
+    content = callback_context.user_content
+    if content is None or not content.parts:
+        return ""
+    return "".join(part.text for part in content.parts if part.text).strip()
+
+
+def _used_uncacheable_tool(callback_context: CallbackContext) -> bool:
+    """Return whether the current invocation called a tool listed in ``_UNCACHEABLE_TOOLS``."""
+
+    return any(
+        call.name in _UNCACHEABLE_TOOLS
+        for event in callback_context.session.events
+        if event.invocation_id == callback_context.invocation_id
+        for call in event.get_function_calls()
+    )
+
+
+async def semantic_cache_before_agent_callback(
+    callback_context: CallbackContext,
+) -> Optional[Content]:
+    """Answer a question similar to a previously answered one from the semantic cache.
+
+    Returning the cached Content skips the agent run (tool calls and model calls).
+    Only the answers given to the same user are searched. A no-op when ``SEMANTIC_CACHE_ENABLED`` is false.
+    """
+
+    cache = get_semantic_cache()
+    question = _user_text(callback_context)
+    if cache is None or not question:
+        return None
+
+    hit = await asyncio.to_thread(cache.lookup, question, callback_context.user_id)
+    if hit is None:
+        return None
+    return Content(role="model", parts=[Part(text=hit["answer"])])
+
+
+async def semantic_cache_after_model_callback(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """Store the final text answer of the agent for its question in the semantic cache.
+
+    Partial chunks, errors, responses requesting a tool call and answers built on
+    the user's notes (``retrieve_notes``) are skipped.
+    """
+
+    cache = get_semantic_cache()
+    if (
+        cache is None
+        or llm_response.partial
+        or llm_response.error_code is not None
+        or not llm_response.content
+        or not llm_response.content.parts
+    ):
+        return None
+
+    parts = llm_response.content.parts
+    if any(part.function_call for part in parts):
+        return None
+    answer = "".join(part.text for part in parts if part.text and not part.thought)
+    question = _user_text(callback_context)
+    if question and answer.strip() and not _used_uncacheable_tool(callback_context):
+        await asyncio.to_thread(
+            cache.put, question, answer, scope=callback_context.user_id
+        )
+    return None
+
+
 def main():
     """Entry Point for the Program."""
     print(
@@ -5,7 +5,8 @@ Utilities for loading and handling configuration files.
 """
 
 import os
-from typing import Optional
+import threading
+from typing import Any, Callable, Literal, Optional
 from pathlib import Path
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict, YamlConfigSettingsSource
@@ -17,6 +18,9 @@ logger = setup_logger(
     file_mode="a",
 )
 
+CONFIG_FILE_PATH = Path("config/config.yaml")
+ENV_FILE_PATH = Path(".env")
+
 
 class Settings(BaseSettings):
     """
@@ -50,6 +54,69 @@ class Settings(BaseSettings):
 
     SQLITE_DB_PATH: str = Field(...)
 
+    MCP_POOL_ENABLED: bool = Field(default=True)
+    MCP_POOL_SIZE: int = Field(default=1)
+    MCP_HEALTH_CHECK_INTERVAL: float = Field(default=30.0)
+    MCP_TIMEOUT: float = Field(default=30.0)
+    MCP_USE_STUB_SERVER: bool = Field(default=False)
+    MCP_STUB_LATENCY: float = Field(default=0.0)
+
+    SUMMARY_CHUNK_TOKENS: int = Field(default=6000)
+    SUMMARY_MAX_CONCURRENCY: int = Field(default=4)
+    SUMMARY_MAX_RETRIES: int = Field(default=2)
+
+    LLM_CACHE_ENABLED: bool = Field(default=False)
+    LLM_CACHE_TTL: float = Field(default=86400.0)
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=10000)
+
+    SEMANTIC_CACHE_ENABLED: bool = Field(default=False)
+    SEMANTIC_CACHE_THRESHOLD: float = Field(default=0.85)
+    SEMANTIC_CACHE_TTL: float = Field(default=86400.0)
+    SEMANTIC_CACHE_MAX_ENTRIES: int = Field(default=5000)
+    SEMANTIC_CACHE_DIM: int = Field(default=1024)
+
+    VAULT_PATH: str = Field(default="")
+    VAULT_INDEX_REFRESH_INTERVAL: float = Field(default=60.0)
+    OBSIDIAN_BACKEND: Literal["mcp", "filesystem"] = Field(default="mcp")
+
+    WRITE_COALESCE_MODE: Literal["off", "window", "invocation"] = Field(
+        default="invocation"
+    )
+    WRITE_COALESCE_WINDOW: float = Field(default=0.25)
+    WRITE_COALESCE_MAX_AGE: float = Field(default=300.0)
+
+    ROUTER_ENABLED: bool = Field(default=False)
+    ROUTER_MIN_CONFIDENCE: float = Field(default=0.9)
+    ROUTER_CLASSIFIER_ENABLED: bool = Field(default=False)
+    ROUTER_CLASSIFIER_MIN_CONFIDENCE: float = Field(default=0.75)
+
+    CONTEXT_COMPACTION_ENABLED: bool = Field(default=False)
+    CONTEXT_COMPACTION: dict[str, dict[str, Any]] = Field(default_factory=dict)
+
+    MEMORY_BACKEND: Literal["sqlite", "in_memory"] = Field(default="sqlite")
+    MEMORY_DB_PATH: str = Field(default="")
+    MEMORY_SEARCH_LIMIT: int = Field(default=10)
+
+    TRANSCRIPT_CACHE_ENABLED: bool = Field(default=True)
+    TRANSCRIPT_CACHE_MAX_MB: int = Field(default=256)
+    TRANSCRIPT_AGENT_MODE: Literal["direct", "llm"] = Field(default="direct")
+    TRANSCRIPT_LANG: str = Field(default="en")
+
+    ORCHESTRATION_MODE: Literal["sequential", "parallel"] = Field(default="sequential")
+    PARALLEL_MAX_CONCURRENCY: int = Field(default=4)
+
+    TRACING_ENABLED: bool = Field(default=False)
+    TRACING_EXPORT_PATH: str = Field(default="")
+    TRACING_CAPTURE_CONTENT: bool = Field(default=False)
+
+    VECTOR_INDEX_ENABLED: bool = Field(default=False)
+    VECTOR_INDEX_DIM: int = Field(default=512)
+    VECTOR_CHUNK_TOKENS: int = Field(default=256)
+    VECTOR_ANN_MIN_ROWS: int = Field(default=4096)
+    VECTOR_ANN_PROBES: int = Field(default=8)
+    RETRIEVAL_TOP_K: int = Field(default=5)
+    RETRIEVAL_TOKEN_BUDGET: int = Field(default=1500)
+
     DEFAULT_MODEL_NAME: str = Field(...)
     CHAT_MODEL_NAME: str = Field(default="")
     FILTER_MODEL_NAME: str = Field(default="")
@@ -60,7 +127,12 @@ class Settings(BaseSettings):
     EXTRACT_MODEL_NAME: str = Field(default="")
     YT_TRANSCRIPT_MODEL_NAME: str = Field(default="")
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    SETTINGS_HOT_RELOAD: bool = Field(default=False)
+    SETTINGS_RELOAD_INTERVAL: float = Field(default=2.0)
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE_PATH, env_file_encoding="utf-8", frozen=True
+    )
 
     @classmethod
     def settings_customise_sources(
@@ -77,7 +149,7 @@ class Settings(BaseSettings):
             dotenv_settings,  # .env file
             YamlConfigSettingsSource(
                 settings_cls,
-                yaml_file=Path("config/config.yaml"),
+                yaml_file=CONFIG_FILE_PATH,
                 yaml_file_encoding="utf-8",
             ),  # YAML file
             file_secret_settings,
@@ -85,36 +157,158 @@ class Settings(BaseSettings):
 
     def model_post_init(self, __context):  # pylint: disable=[W0221]
         """
-        After loading all settings, fill any missing model names using DEFAULT_MODEL_NAME
+        After loading all settings, fill any missing model names using DEFAULT_MODEL_NAME.
+
+        The model is frozen, so the defaults are written with ``object.__setattr__``
+        before the instance is handed out.
         """
-        if not self.CHAT_MODEL_NAME:
-            self.CHAT_MODEL_NAME = self.DEFAULT_MODEL_NAME
-        if not self.FILTER_MODEL_NAME:
-            self.FILTER_MODEL_NAME = self.DEFAULT_MODEL_NAME
-        if not self.SUMMARIZE_MODEL_NAME:
-            self.SUMMARIZE_MODEL_NAME = self.DEFAULT_MODEL_NAME
-        if not self.MARKDOWN_MODEL_NAME:
-            self.MARKDOWN_MODEL_NAME = self.DEFAULT_MODEL_NAME
-        if not self.DIAGRAM_MODEL_NAME:
-            self.DIAGRAM_MODEL_NAME = self.DEFAULT_MODEL_NAME
-        if not self.WRITE_MODEL_NAME:
-            self.WRITE_MODEL_NAME = self.DEFAULT_MODEL_NAME
-        if not self.EXTRACT_MODEL_NAME:
-            self.EXTRACT_MODEL_NAME = self.DEFAULT_MODEL_NAME
+        for field_name in (
+            "CHAT_MODEL_NAME",
+            "FILTER_MODEL_NAME",
+            "SUMMARIZE_MODEL_NAME",
+            "MARKDOWN_MODEL_NAME",
+            "DIAGRAM_MODEL_NAME",
+            "WRITE_MODEL_NAME",
+            "EXTRACT_MODEL_NAME",
+        ):
+            if not getattr(self, field_name):
+                object.__setattr__(self, field_name, self.DEFAULT_MODEL_NAME)
 
 
-def get_settings() -> Settings:
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def load_settings() -> Settings:
     """
-    Constructs and returns a validated Settings object that centralizes configuration
-    for the application.
+    Constructs a new validated Settings object by parsing env, .env and YAML sources.
+
+    Prefer ``get_settings()``; this is the uncached path it uses under the hood.
+
     Returns:
-        Settings: A validated Settings instance containing application configuration.
+        Settings: A freshly parsed, immutable Settings instance.
     """
 
     logger.info("Loading application settings.")
     return Settings()  # type: ignore
 
 
+def get_settings() -> Settings:
+    """
+    Returns the process-wide Settings snapshot, parsing the sources on first use only.
+
+    Returns:
+        Settings: A validated, immutable Settings instance containing application
+            configuration.
+    """
+
+    global _settings  # pylint: disable=[W0603]
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = load_settings()
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """
+    Re-parses the settings sources and atomically swaps the cached snapshot.
+
+    If the new configuration cannot be parsed or is invalid, the previous snapshot
+    is kept.
+
+    Returns:
+        Settings: The snapshot that is active after the reload attempt.
+    """
+
+    global _settings  # pylint: disable=[W0603]
+    with _settings_lock:
+        try:
+            _settings = load_settings()
+        except Exception as e:  # pylint: disable=[W0718]
+            # Validation errors, but also YAML syntax errors of a half-saved file.
+            logger.error("Reloading settings failed, keeping the previous ones: %s", e)
+            if _settings is None:
+                raise
+    return _settings
+
+
+class SettingsWatcher:
+    """
+    Background thread that reloads the settings when ``config.yaml`` or ``.env`` change.
+
+    Attributes:
+        interval (float): Polling interval in seconds.
+        on_reload (Optional[Callable[[Settings], None]]): Callback invoked with the
+            new snapshot after each successful reload.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        on_reload: Optional[Callable[[Settings], None]] = None,
+    ):
+        """
+        Initialize the SettingsWatcher.
+
+        Args:
+            interval (float): Polling interval in seconds.
+            on_reload (Optional[Callable[[Settings], None]]): Callback invoked with
+                the new snapshot after each reload.
+        """
+
+        self.interval = interval
+        self.on_reload = on_reload
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._mtimes = self._read_mtimes()
+
+    @staticmethod
+    def _read_mtimes() -> tuple[float, float]:
+        """Return the modification times of the watched files (0 when missing)."""
+
+        return tuple(  # type: ignore
+            path.stat().st_mtime if path.exists() else 0.0
+            for path in (CONFIG_FILE_PATH, ENV_FILE_PATH)
+        )
+
+    def _run(self):
+        """Poll the watched files until stopped."""
+
+        while not self._stop_event.wait(self.interval):
+            mtimes = self._read_mtimes()
+            if mtimes == self._mtimes:
+                continue
+            self._mtimes = mtimes
+            logger.info("Configuration files changed. Reloading settings.")
+            try:
+                previous = _settings
+                settings = reload_settings()
+                if settings is not previous and self.on_reload is not None:
+                    self.on_reload(settings)
+            except Exception:  # pylint: disable=[W0718]
+                # Keep polling: a dead watcher would silently disable hot reload.
+                logger.exception("Applying the reloaded settings failed.")
+
+    def start(self):
+        """Start watching in a daemon thread."""
+
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="settings-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and wait for the thread to exit."""
+
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
 def main():
     """Entry Point for the Program."""
     print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module.\n")
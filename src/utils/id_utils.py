@@ -0,0 +1,58 @@
+"""ID Generation Utility Module."""
+
+import os
+import time
+import secrets
+import threading
+
+# Crockford's base32 alphabet (lowercase): no i, l, o or u, and sorts like the values.
+_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+_RANDOM_BITS = 80
+_lock = threading.Lock()
+_last_timestamp_ms = -1
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    """Encode an integer as a fixed-length base32 string."""
+
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, 32)
+        chars.append(_ALPHABET[index])
+    return "".join(reversed(chars))
+
+
+def generate_ulid() -> str:
+    """Generate a 26-character, time-sortable, collision-resistant identifier.
+
+    The ID follows the ULID layout: a 48-bit millisecond timestamp (10 chars)
+    followed by 80 random bits (16 chars). IDs generated within the same
+    millisecond in this process increment the random part, so they are strictly
+    monotonic, and lexicographic order matches creation order.
+
+    Returns:
+        str: A lowercase ULID string.
+    """
+
+    global _last_timestamp_ms, _last_random  # pylint: disable=[W0603]
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms <= _last_timestamp_ms:
+            timestamp_ms = _last_timestamp_ms
+            random_part = (_last_random + 1) % (1 << _RANDOM_BITS)
+        else:
+            random_part = secrets.randbits(_RANDOM_BITS)
+        _last_timestamp_ms, _last_random = timestamp_ms, random_part
+
+    return _encode(timestamp_ms, 10) + _encode(random_part, 16)
+
+
+def main():
+    """Entry Point for the Program."""
+    print(f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module.")
+    print(generate_ulid())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Instrumentation Utility Module.
+
+Agent, model and tool callbacks that time every agent run, model call and tool
+call, record the model's input/output token counts, and aggregate them into the
+histograms of ``metrics_registry`` (served on ``/metrics``).
+
+Attach the ``before_*`` callbacks last and the ``after_*`` callbacks first in an
+agent's callback lists: a callback returning a value earlier in a list
+short-circuits the rest of it, and the call then is not measured. Calls raising
+an exception skip the ``after_*`` callbacks; the ``on_*_error`` callbacks record
+them instead.
+"""
+
+import os
+import time
+import threading
+from typing import Any, Optional
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+from utils.config_utils import get_settings
+from utils.logging_utils import setup_logger
+from utils.metrics_utils import TOKEN_BUCKETS, metrics_registry
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+AGENT_DURATION = metrics_registry.histogram(
+    "obsidianmate_agent_duration_seconds",
+    "Wall time of agent runs.",
+    ("agent",),
+)
+MODEL_DURATION = metrics_registry.histogram(
+    "obsidianmate_model_duration_seconds",
+    "Wall time of model calls.",
+    ("agent", "model"),
+)
+MODEL_INPUT_TOKENS = metrics_registry.histogram(
+    "obsidianmate_model_input_tokens",
+    "Prompt tokens of model calls.",
+    ("agent", "model"),
+    TOKEN_BUCKETS,
+)
+MODEL_OUTPUT_TOKENS = metrics_registry.histogram(
+    "obsidianmate_model_output_tokens",
+    "Completion tokens of model calls.",
+    ("agent", "model"),
+    TOKEN_BUCKETS,
+)
+MODEL_ERRORS = metrics_registry.counter(
+    "obsidianmate_model_errors",
+    "Model calls that returned or raised an error.",
+    ("agent", "model"),
+)
+TOOL_DURATION = metrics_registry.histogram(
+    "obsidianmate_tool_duration_seconds",
+    "Wall time of tool calls.",
+    ("agent", "tool", "status"),
+)
+
+_lock = threading.Lock()
+# (invocation id, agent name) -> start time
+_agent_starts: dict[tuple[str, str], float] = {}
+# (invocation id, agent name) -> (start time, model name)
+_model_starts: dict[tuple[str, str], tuple[float, str]] = {}
+# function call id -> ((invocation id, agent name), start time)
+_tool_starts: dict[str, tuple[tuple[str, str], float]] = {}
+
+
+def _is_error(result: Any) -> bool:
+    """Whether a tool result reports a failure."""
+
+    return isinstance(result, dict) and (
+        bool(result.get("isError"))
+        or result.get("status") == "error"
+        or bool(result.get("error"))
+    )
+
+
+def instrument_before_agent_callback(callback_context: CallbackContext) -> None:
+    """Start timing an agent run."""
+
+    with _lock:
+        _agent_starts[(callback_context.invocation_id, callback_context.agent_name)] = (
+            time.perf_counter()
+        )
+
+
+def instrument_after_agent_callback(callback_context: CallbackContext) -> None:
+    """Record the wall time of an agent run and drop its unfinished spans."""
+
+    key = (callback_context.invocation_id, callback_context.agent_name)
+    with _lock:
+        started = _agent_starts.pop(key, None)
+        _model_starts.pop(key, None)
+        for call_id in [
+            call_id for call_id, (owner, _) in _tool_starts.items() if owner == key
+        ]:
+            del _tool_starts[call_id]
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    AGENT_DURATION.observe(elapsed, callback_context.agent_name)
+    logger.info("%s finished in %.3fs", callback_context.agent_name, elapsed)
+
+
+def instrument_before_model_callback(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> None:
+    """Start timing a model call."""
+
+    with _lock:
+        _model_starts[(callback_context.invocation_id, callback_context.agent_name)] = (
+            time.perf_counter(),
+            llm_request.model or "unknown",
+        )
+
+
+def instrument_after_model_callback(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> None:
+    """Record the wall time and token counts of a complete model response."""
+
+    if llm_response.partial:
+        return
+    with _lock:
+        entry = _model_starts.pop(
+            (callback_context.invocation_id, callback_context.agent_name), None
+        )
+    if entry is None:
+        return
+    started, model = entry
+    agent = callback_context.agent_name
+    MODEL_DURATION.observe(time.perf_counter() - started, agent, model)
+    if llm_response.error_code is not None:
+        MODEL_ERRORS.inc(agent, model)
+    usage = llm_response.usage_metadata
+    if usage is not None:
+        if usage.prompt_token_count is not None:
+            MODEL_INPUT_TOKENS.observe(usage.prompt_token_count, agent, model)
+        if usage.candidates_token_count is not None:
+            MODEL_OUTPUT_TOKENS.observe(usage.candidates_token_count, agent, model)
+
+
+def instrument_on_model_error_callback(
+    callback_context: CallbackContext, llm_request: LlmRequest, error: Exception
+) -> None:
+    """Record the wall time of a model call that raised, and count the error."""
+
+    with _lock:
+        entry = _model_starts.pop(
+            (callback_context.invocation_id, callback_context.agent_name), None
+        )
+    agent = callback_context.agent_name
+    model = entry[1] if entry is not None else llm_request.model or "unknown"
+    if entry is not None:
+        MODEL_DURATION.observe(time.perf_counter() - entry[0], agent, model)
+    MODEL_ERRORS.inc(agent, model)
+
+
+def instrument_before_tool_callback(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext
+) -> Optional[dict]:
+    """Start timing a tool call."""
+
+    if tool_context.function_call_id:
+        with _lock:
+            _tool_starts[tool_context.function_call_id] = (
+                (tool_context.invocation_id, tool_context.agent_name),
+                time.perf_counter(),
+            )
+    return None
+
+
+def instrument_after_tool_callback(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, tool_response: Any
+) -> Optional[dict]:
+    """Record the wall time and outcome of a tool call."""
+
+    with _lock:
+        entry = _tool_starts.pop(tool_context.function_call_id or "", None)
+    if entry is not None:
+        TOOL_DURATION.observe(
+            time.perf_counter() - entry[1],
+            tool_context.agent_name,
+            tool.name,
+            "error" if _is_error(tool_response) else "success",
+        )
+    return None
+
+
+def instrument_on_tool_error_callback(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, error: Exception
+) -> Optional[dict]:
+    """Record the wall time of a tool call that raised, as an error."""
+
+    with _lock:
+        entry = _tool_starts.pop(tool_context.function_call_id or "", None)
+    TOOL_DURATION.observe(
+        time.perf_counter() - entry[1] if entry is not None else 0.0,
+        tool_context.agent_name,
+        tool.name,
+        "error",
+    )
+    return None
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
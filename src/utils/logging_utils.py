@@ -2,9 +2,97 @@
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Literal, Optional
 
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s][%(filename)s:%(lineno)d][%(levelname)s]: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+_registry_lock = threading.Lock()
+_loggers: dict[str, logging.Logger] = {}
+_file_handlers: dict[str, logging.Handler] = {}
+_console_handler: Optional[logging.Handler] = None
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+
+class _RoutingHandler(logging.Handler):
+    """Dispatch queued records to the sink handlers registered for their logger name.
+
+    Runs on the ``QueueListener`` thread, so all file and console I/O happens off the
+    caller's thread (and off the event loop).
+    """
+
+    def __init__(self):
+        """Initialize the handler with an empty route table."""
+
+        super().__init__(level=logging.DEBUG)
+        self.routes: dict[str, list[logging.Handler]] = {}
+
+    def emit(self, record: logging.LogRecord):
+        """Forward the record to each sink handler of its logger."""
+
+        for handler in self.routes.get(record.name, []):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+_router = _RoutingHandler()
+
+
+def _get_file_handler(path: str, file_mode: Literal["a", "w"]) -> logging.Handler:
+    """Return the shared file handler for ``path``, opening the file only once."""
+
+    path = os.path.abspath(path)
+    if path not in _file_handlers:
+        handler = logging.FileHandler(path, mode=file_mode, encoding="utf-8")
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(_FORMATTER)
+        _file_handlers[path] = handler
+    return _file_handlers[path]
+
+
+def _get_console_handler() -> logging.Handler:
+    """Return the shared stdout handler."""
+
+    global _console_handler  # pylint: disable=[W0603]
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setLevel(logging.DEBUG)
+        _console_handler.setFormatter(_FORMATTER)
+    return _console_handler
+
+
+def _ensure_listener():
+    """Start the background writer thread on first use."""
+
+    global _listener  # pylint: disable=[W0603]
+    if _listener is None:
+        _listener = QueueListener(_log_queue, _router, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Drain the log queue, stop the background writer and close all log files."""
+
+    global _listener  # pylint: disable=[W0603]
+    with _registry_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handler in _file_handlers.values():
+            handler.close()
+        _file_handlers.clear()
+        _router.routes.clear()
+        _loggers.clear()
+
 
 def setup_logger(
     log_file: Optional[str] = None,
@@ -12,17 +100,23 @@ def setup_logger(
     log_to_console: bool = True,
     file_mode: Literal["a", "w"] = "a",
 ) -> logging.Logger:
-    """Set up a logger with an optional per-file handler and an always-on all_logs handler.
+    """Get a logger with an optional per-file handler and an always-on all_logs handler.
 
     If log_file is None or empty, only the logs/all_logs.log handler will be used.
 
+    Each named logger is configured once and cached in a registry; later calls with
+    the same name return the same logger without touching its handlers. The logger
+    itself only has a ``QueueHandler``, and a single ``QueueListener`` thread writes
+    the records to the files and console, so callers never block on log I/O.
+
     Args:
         log_file (Optional[str]): The name or path for the per-file log (optional).
         log_dir (str, optional): Directory where log files will be created. Defaults to "logs".
         log_to_console (bool, optional): Whether to also log messages to the console (stdout).
             Defaults to True.
         file_mode (str, optional): File open mode for the per-file log:
-            "a" to append (default) or "w" to overwrite.
+            "a" to append (default) or "w" to overwrite. Only applied the first time
+            the file is opened.
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -30,44 +124,39 @@ def setup_logger(
     if file_mode not in {"a", "w"}:
         raise ValueError("file_mode must be 'a' (append) or 'w' (write).")
 
-    # Ensure log directory exists
-    os.makedirs(log_dir, exist_ok=True)
-
     # Name logger so separate setups don't conflict; prefer the per-file name when present
     logger_name = (
         os.path.splitext(os.path.basename(log_file))[0] if log_file else "all_logs"
     )
-    logger = logging.getLogger(logger_name)
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
 
-    formatter = logging.Formatter(
-        "[%(asctime)s][%(filename)s:%(lineno)d][%(levelname)s]: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    with _registry_lock:
+        if logger_name in _loggers:
+            return _loggers[logger_name]
+
+        # Ensure log directory exists
+        os.makedirs(log_dir, exist_ok=True)
+
+        sinks: list[logging.Handler] = []
+
+        # Per-file handler (optional)
+        if log_file:
+            per_file_path = os.path.join(log_dir, f"{logger_name}.log")
+            sinks.append(_get_file_handler(per_file_path, file_mode))
+
+        # Always-on aggregate log
+        sinks.append(_get_file_handler(os.path.join(log_dir, "all_logs.log"), "a"))
+
+        if log_to_console:
+            sinks.append(_get_console_handler())
+
+        _router.routes[logger_name] = sinks
+        _ensure_listener()
 
-    # Per-file handler (optional)
-    if log_file:
-        per_file_path = os.path.join(
-            log_dir, f"{os.path.splitext(os.path.basename(log_file))[0]}.log"
-        )
-        file_handler = logging.FileHandler(per_file_path, mode=file_mode)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-    # Always-on aggregate log
-    all_logs_path = os.path.join(log_dir, "all_logs.log")
-    file_handler_all_logs = logging.FileHandler(all_logs_path, mode="a")
-    file_handler_all_logs.setLevel(logging.DEBUG)
-    file_handler_all_logs.setFormatter(formatter)
-    logger.addHandler(file_handler_all_logs)
-
-    if log_to_console:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.DEBUG)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(logging.DEBUG)
+        logger.handlers.clear()
+        logger.addHandler(QueueHandler(_log_queue))
+        _loggers[logger_name] = logger
 
     return logger
 
@@ -0,0 +1,209 @@
+"""
+Metrics Utility Module.
+
+Minimal in-process counters and histograms rendered in the Prometheus text
+exposition format (version 0.0.4), so ``/metrics`` can be scraped without an
+extra client library.
+"""
+
+import os
+import bisect
+import threading
+from typing import Optional
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+TOKEN_BUCKETS = (16, 64, 256, 1024, 2048, 4096, 8192, 16384, 32768, 65536, 131072)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    """Render ``{name="value",...}``, or an empty string without labels."""
+
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    """Render a sample value (integers without a trailing ``.0``)."""
+
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """
+    A monotonically increasing counter, per label values.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): Help text.
+        label_names (tuple[str, ...]): Label names.
+    """
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        """Increase the counter of some label values."""
+
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of the samples."""
+
+        with self._lock:
+            return [
+                f"{self.name}_total{_format_labels(self.label_names, values)} {_format_number(value)}"
+                for values, value in sorted(self._values.items())
+            ]
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram, per label values.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): Help text.
+        label_names (tuple[str, ...]): Label names.
+        buckets (tuple[float, ...]): Upper bounds of the buckets (``+Inf`` is implied).
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # label values -> (per-bucket counts incl. +Inf, sum, count)
+        self._series: dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *label_values: str):
+        """Record an observation for some label values."""
+
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [
+                    [0] * (len(self.buckets) + 1),
+                    0.0,
+                    0,
+                ]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of the buckets, sums and counts."""
+
+        lines = []
+        with self._lock:
+            for values, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else _format_number(bound)
+                    labels = _format_labels(self.label_names, values, f'le="{le}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.label_names, values)
+                lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """A set of metrics rendered together."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def _register(self, metric: Counter | Histogram) -> Counter | Histogram:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(
+        self, name: str, documentation: str, label_names: tuple[str, ...] = ()
+    ) -> Counter:
+        """Return the counter of a name, creating it if needed."""
+
+        return self._register(Counter(name, documentation, label_names))  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: Optional[tuple[float, ...]] = None,
+    ) -> Histogram:
+        """Return the histogram of a name, creating it if needed."""
+
+        return self._register(  # type: ignore
+            Histogram(name, documentation, label_names, buckets or DURATION_BUCKETS)
+        )
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Trace Waterfall Module.
+
+Command line viewer of the spans exported by ``utils.tracing_utils``: renders
+the trace of an invocation as an indented waterfall, one span per line with its
+duration and a bar placed on the trace's timeline.
+
+Usage (from ``src``, or anywhere once the project is installed):
+    python -m utils.trace_waterfall                  # list the latest invocations
+    python -m utils.trace_waterfall <invocation_id>  # render its trace
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import Any, Iterable, Optional
+from utils.config_utils import get_settings
+from utils.tracing_utils import default_trace_path
+
+INVOCATION_ATTRIBUTE = "gcp.vertex.agent.invocation_id"
+NAME_WIDTH = 48
+
+
+def load_spans(path: str) -> list[dict[str, Any]]:
+    """Read the spans of a JSONL export, skipping unreadable lines."""
+
+    spans = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def invocation_trace_id(
+    spans: Iterable[dict[str, Any]], invocation_id: str
+) -> Optional[str]:
+    """Return the ID of the trace an invocation belongs to."""
+
+    for span in spans:
+        if span["attributes"].get(INVOCATION_ATTRIBUTE) == invocation_id:
+            return span["trace_id"]
+    return None
+
+
+def latest_invocations(
+    spans: list[dict[str, Any]], limit: int
+) -> list[tuple[str, str, float]]:
+    """
+    Return the most recent invocations, newest first.
+
+    Returns:
+        list[tuple[str, str, float]]: ``(invocation_id, trace_id, first_span_start)``
+            per invocation.
+    """
+
+    first_seen: dict[str, tuple[str, float]] = {}
+    for span in spans:
+        invocation_id = span["attributes"].get(INVOCATION_ATTRIBUTE)
+        if invocation_id and (
+            invocation_id not in first_seen
+            or span["start"] < first_seen[invocation_id][1]
+        ):
+            first_seen[invocation_id] = (span["trace_id"], span["start"])
+    ordered = sorted(first_seen.items(), key=lambda item: item[1][1], reverse=True)
+    return [
+        (invocation_id, trace_id, start)
+        for invocation_id, (trace_id, start) in ordered[:limit]
+    ]
+
+
+def _label(span: dict[str, Any]) -> str:
+    """Return the span name, with the detail that tells spans of a kind apart."""
+
+    attributes = span["attributes"]
+    if span["name"] == "call_llm" and attributes.get("gen_ai.request.model"):
+        return f"call_llm {attributes['gen_ai.request.model']}"
+    return span["name"]
+
+
+def render_waterfall(spans: list[dict[str, Any]], width: int = 60) -> list[str]:
+    """
+    Render the spans of one trace as a waterfall, children under their parent.
+
+    Args:
+        spans (list[dict[str, Any]]): The spans of the trace.
+        width (int): Width of the timeline, in characters.
+
+    Returns:
+        list[str]: The lines of the waterfall.
+    """
+
+    if not spans:
+        return []
+    ids = {span["span_id"] for span in spans}
+    children: dict[Optional[str], list[dict[str, Any]]] = {}
+    for span in spans:
+        parent = span["parent_id"] if span["parent_id"] in ids else None
+        children.setdefault(parent, []).append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span["start"])
+
+    origin = min(span["start"] for span in spans)
+    total = max(max(span["end"] for span in spans) - origin, 1)
+    lines = []
+
+    def visit(span: dict[str, Any], depth: int):
+        offset = int((span["start"] - origin) / total * width)
+        length = max(1, round((span["end"] - span["start"]) / total * width))
+        bar = " " * offset + "█" * min(length, width - offset)
+        name = ("  " * depth + _label(span))[:NAME_WIDTH]
+        marker = "!" if span["status"] == "ERROR" else " "
+        duration = (span["end"] - span["start"]) / 1e6
+        lines.append(
+            f"{name:<{NAME_WIDTH}} {duration:>10.1f} ms{marker}|{bar:<{width}}|"
+        )
+        for child in children.get(span["span_id"], []):
+            visit(child, depth + 1)
+
+    for root in children.get(None, []):
+        visit(root, 0)
+    return lines
+
+
+def main():
+    """Entry Point for the Program."""
+
+    parser = argparse.ArgumentParser(
+        description="Render the trace waterfall of an invocation."
+    )
+    parser.add_argument(
+        "invocation_id",
+        nargs="?",
+        help="Invocation ID (lists the latest ones if omitted).",
+    )
+    parser.add_argument(
+        "--file", default=None, help="Span export (defaults to the configured one)."
+    )
+    parser.add_argument("--width", type=int, default=60, help="Width of the timeline.")
+    parser.add_argument(
+        "--limit", type=int, default=20, help="Number of invocations to list."
+    )
+    args = parser.parse_args()
+
+    path = args.file or default_trace_path(get_settings())
+    if not os.path.exists(path):
+        sys.exit(f"No span export at {path}.")
+    spans = load_spans(path)
+
+    if args.invocation_id is None:
+        for invocation_id, trace_id, _ in latest_invocations(spans, args.limit):
+            print(f"{invocation_id}  trace {trace_id}")
+        return
+
+    trace_id = invocation_trace_id(spans, args.invocation_id)
+    if trace_id is None:
+        sys.exit(f"No spans of invocation {args.invocation_id} in {path}.")
+    trace_spans = [span for span in spans if span["trace_id"] == trace_id]
+    duration = (
+        max(s["end"] for s in trace_spans) - min(s["start"] for s in trace_spans)
+    ) / 1e6
+    print(
+        f"Trace {trace_id} (invocation {args.invocation_id}): {len(trace_spans)} spans, {duration:.1f} ms"
+    )
+    print("\n".join(render_waterfall(trace_spans, args.width)))
+
+
+if __name__ == "__main__":
+    main()
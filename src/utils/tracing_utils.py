@@ -0,0 +1,203 @@
+"""
+Tracing Utility Module.
+
+OpenTelemetry tracing of a request from end to end. ADK already opens spans for
+the invocation, every agent run, model call and tool call (an ``AgentTool`` runs
+its sub-agent inside its tool span); this module adds the HTTP request span above
+them, exports every finished span as one JSON line, and provides the ``tracer``
+used for the application's own spans (session and memory storage, transcripts).
+
+Render the waterfall of an invocation with ``python -m utils.trace_waterfall``.
+"""
+
+import os
+import json
+import threading
+from typing import Any, Optional, Sequence
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.trace import SpanKind, StatusCode
+from utils.config_utils import Settings, get_settings
+from utils.logging_utils import setup_logger
+
+logger = setup_logger(
+    log_file=__file__,
+    log_dir=get_settings().PATH_LOGS,
+    log_to_console=True,
+    file_mode="a",
+)
+
+# ADK reads this environment variable to decide whether to copy prompts and
+# responses into its span attributes.
+_ADK_CAPTURE_CONTENT_ENV = "ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS"
+
+tracer = trace.get_tracer("obsidianmate")
+
+
+def default_trace_path(settings: Settings) -> str:
+    """Return the JSONL file the spans are exported to."""
+
+    return settings.TRACING_EXPORT_PATH or os.path.join(
+        settings.PATH_LOGS, "traces.jsonl"
+    )
+
+
+def _attribute_value(value: Any) -> Any:
+    """Make an attribute value JSON serializable."""
+
+    return list(value) if isinstance(value, (tuple, list)) else value
+
+
+def span_to_dict(span: ReadableSpan) -> dict[str, Any]:
+    """
+    Flatten a finished span into a JSON-serializable record.
+
+    Args:
+        span (ReadableSpan): The finished span.
+
+    Returns:
+        dict: ``trace_id``, ``span_id``, ``parent_id``, ``name``, ``kind``,
+            ``start``/``end`` (epoch nanoseconds), ``status``, ``attributes``
+            and ``service``.
+    """
+
+    context = span.get_span_context()
+    return {
+        "trace_id": format(context.trace_id, "032x"),  # type: ignore
+        "span_id": format(context.span_id, "016x"),  # type: ignore
+        "parent_id": format(span.parent.span_id, "016x") if span.parent else None,
+        "name": span.name,
+        "kind": span.kind.name,
+        "start": span.start_time,
+        "end": span.end_time,
+        "status": span.status.status_code.name,
+        "attributes": {
+            key: _attribute_value(value)
+            for key, value in (span.attributes or {}).items()
+        },
+        "service": span.resource.attributes.get("service.name"),
+    }
+
+
+class JsonlSpanExporter(SpanExporter):
+    """
+    Appends finished spans to a file, one JSON object per line.
+
+    Attributes:
+        path (str): The JSONL file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the JsonlSpanExporter.
+
+        Args:
+            path (str): The JSONL file; its directory is created if needed.
+        """
+
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Append a batch of spans to the file."""
+
+        lines = "".join(
+            json.dumps(span_to_dict(span), ensure_ascii=False, default=str) + "\n"
+            for span in spans
+        )
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as file:
+                file.write(lines)
+        except OSError as exc:
+            logger.error(
+                "Could not export %d spans to %s: %s", len(spans), self.path, exc
+            )
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self):
+        """Nothing to release: the file is opened per batch."""
+
+
+def setup_tracing(settings: Settings) -> Optional[TracerProvider]:
+    """
+    Install the global tracer provider exporting to the JSONL file, if enabled.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        Optional[TracerProvider]: The provider (to shut down on exit), or None when
+            tracing is disabled.
+    """
+
+    if not settings.TRACING_ENABLED:
+        return None
+    os.environ[_ADK_CAPTURE_CONTENT_ENV] = str(settings.TRACING_CAPTURE_CONTENT).lower()
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": settings.APP_NAME, "service.version": settings.APP_VERSION}
+        )
+    )
+    path = default_trace_path(settings)
+    provider.add_span_processor(BatchSpanProcessor(JsonlSpanExporter(path)))
+    trace.set_tracer_provider(provider)
+    logger.info("Exporting traces to %s", path)
+    return provider
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span around each HTTP request.
+
+    Unlike a ``BaseHTTPMiddleware``, the span stays open until the response body
+    is fully sent, so streamed responses are timed whole.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}", kind=SpanKind.SERVER
+        ) as span:
+            span.set_attribute("http.request.method", method)
+            span.set_attribute("url.path", scope["path"])
+
+            async def traced_send(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(StatusCode.ERROR)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, traced_send)
+            finally:
+                route = scope.get("route")
+                if route is not None and hasattr(route, "path"):
+                    span.set_attribute("http.route", route.path)
+                    span.update_name(f"{method} {route.path}")
+
+
+def main():
+    """Entry Point for the Program."""
+    print(
+        f"Welcome from `{os.path.basename(__file__).split('.')[0]}` Module. Nothing to do ^_____^!"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+Shared test setup.
+
+The settings are read from ``config/config.yaml`` relative to the working
+directory and require a few credentials; the tests never use them, so they get
+placeholders before any application module is imported.
+"""
+
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT_DIR)
+
+for _name in (
+    "GH_PAT",
+    "WSL_PASS",
+    "GOOGLE_API_KEY",
+    "OBSIDIAN_API_KEY",
+    "OBSIDIAN_HOST",
+):
+    os.environ.setdefault(_name, "test")
+os.environ.setdefault("SQLITE_DB_PATH", os.path.join(ROOT_DIR, "data", "test.db"))
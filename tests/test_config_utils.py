@@ -0,0 +1,59 @@
+"""Tests of the settings reload."""
+
+import time
+import shutil
+import threading
+import pytest
+from utils import config_utils
+from utils.config_utils import SettingsWatcher, get_settings, reload_settings
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """A private copy of the configuration, watched instead of the real one."""
+
+    path = tmp_path / "config.yaml"
+    shutil.copy(config_utils.CONFIG_FILE_PATH, path)
+    monkeypatch.setattr(config_utils, "CONFIG_FILE_PATH", path)
+    monkeypatch.setattr(config_utils, "ENV_FILE_PATH", tmp_path / ".env")
+    previous = get_settings()
+    yield path
+    monkeypatch.setattr(config_utils, "_settings", previous)
+
+
+def _wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_reload_keeps_the_previous_settings_on_a_yaml_syntax_error(config_file):
+    previous = get_settings()
+    with open(config_file, "a", encoding="utf-8") as file:
+        file.write("\nbad: [unclosed\n")
+
+    assert reload_settings() is previous
+
+
+def test_watcher_survives_a_failing_reload_callback(config_file):
+    reloaded = []
+    first_call = threading.Event()
+
+    def on_reload(settings):
+        reloaded.append(settings)
+        if not first_call.is_set():
+            first_call.set()
+            raise RuntimeError("callback failed")
+
+    watcher = SettingsWatcher(interval=0.01, on_reload=on_reload)
+    watcher.start()
+    try:
+        for index in range(2):
+            time.sleep(0.05)
+            with open(config_file, "a", encoding="utf-8") as file:
+                file.write(f"\n# change {index}\n")
+            assert _wait_for(lambda: len(reloaded) == index + 1)
+        assert watcher._thread.is_alive()  # pylint: disable=[W0212]
+    finally:
+        watcher.stop()
@@ -0,0 +1,141 @@
+"""Tests of the context compaction plugin."""
+
+import asyncio
+from types import SimpleNamespace
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from core.summarization.context_compaction import (
+    STATE_KEY_PREFIX,
+    SUMMARY_PREFIX,
+    ContextCompactionPlugin,
+    split_turns,
+)
+
+CONFIG = {"default": {"keep_turns": 2, "token_threshold": 10}}
+
+
+class _Summarizer:
+    """Summarizes by counting messages, or fails like an unavailable model."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    async def summarize(self, messages):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return {"summary": f"{len(messages)} messages"}
+
+
+def _history(turns: int) -> list[types.Content]:
+    contents = []
+    for index in range(turns):
+        contents.append(
+            types.Content(role="user", parts=[types.Part(text=f"question {index}")])
+        )
+        contents.append(
+            types.Content(role="model", parts=[types.Part(text=f"answer {index}")])
+        )
+    return contents
+
+
+def _compact(
+    plugin: ContextCompactionPlugin, context: SimpleNamespace, turns: int
+) -> LlmRequest:
+    request = LlmRequest(contents=_history(turns))
+    result = asyncio.run(
+        plugin.before_model_callback(callback_context=context, llm_request=request)  # type: ignore
+    )
+    assert result is None
+    return request
+
+
+def _plugin(summarizer: _Summarizer) -> ContextCompactionPlugin:
+    return ContextCompactionPlugin(
+        summarizer, CONFIG, token_counter=lambda text: len(text.split())  # type: ignore
+    )
+
+
+def test_old_turns_are_replaced_by_the_summary():
+    context = SimpleNamespace(agent_name="agent", state={})
+
+    request = _compact(_plugin(_Summarizer()), context, turns=5)
+
+    assert request.contents[0].parts[0].text == f"{SUMMARY_PREFIX}6 messages"
+    assert len(request.contents) == 1 + 2 * 2
+    assert context.state[f"{STATE_KEY_PREFIX}agent"]["turns"] == 3
+
+
+def test_a_failing_summarizer_leaves_the_history_uncompacted():
+    context = SimpleNamespace(agent_name="agent", state={})
+    summarizer = _Summarizer(fail=True)
+
+    request = _compact(_plugin(summarizer), context, turns=5)
+
+    assert summarizer.calls == 1
+    assert request.contents == _history(5)
+    assert f"{STATE_KEY_PREFIX}agent" not in context.state
+
+
+def test_a_failing_summarizer_keeps_the_previous_summary():
+    context = SimpleNamespace(agent_name="agent", state={})
+    _compact(_plugin(_Summarizer()), context, turns=5)
+    stored = dict(context.state[f"{STATE_KEY_PREFIX}agent"])
+
+    request = _compact(_plugin(_Summarizer(fail=True)), context, turns=8)
+
+    assert context.state[f"{STATE_KEY_PREFIX}agent"] == stored
+    assert request.contents[0].parts[0].text == f"{SUMMARY_PREFIX}6 messages"
+    # Everything after the stored summary is sent, not only the kept turns.
+    assert request.contents[1:] == _history(8)[2 * 3 :]
+
+
+def test_split_turns_starts_a_turn_at_each_user_text():
+    call = types.Content(
+        role="model",
+        parts=[types.Part(function_call=types.FunctionCall(name="search", args={}))],
+    )
+    result = types.Content(
+        role="user",
+        parts=[
+            types.Part(
+                function_response=types.FunctionResponse(name="search", response={})
+            )
+        ],
+    )
+    greeting = types.Content(role="model", parts=[types.Part(text="hello")])
+    question, answer = _history(1)
+
+    turns = split_turns([greeting, question, call, result, answer, *_history(1)])
+
+    assert turns == [[greeting], [question, call, result, answer], _history(1)]
+
+
+def test_summary_grows_incrementally_on_the_same_history():
+    context = SimpleNamespace(agent_name="agent", state={})
+    _compact(_plugin(_Summarizer()), context, turns=5)
+
+    request = _compact(_plugin(_Summarizer()), context, turns=6)
+
+    # The stored summary plus the one newly folded turn.
+    assert request.contents[0].parts[0].text == f"{SUMMARY_PREFIX}3 messages"
+    assert context.state[f"{STATE_KEY_PREFIX}agent"]["turns"] == 4
+
+
+def test_rewound_history_restarts_the_summary():
+    context = SimpleNamespace(agent_name="agent", state={})
+    _compact(_plugin(_Summarizer()), context, turns=5)
+
+    # The last summarized turn was edited: the stored summary no longer matches.
+    history = _history(6)
+    history[2 * 2] = types.Content(
+        role="user", parts=[types.Part(text="edited question")]
+    )
+    request = LlmRequest(contents=history)
+    asyncio.run(
+        _plugin(_Summarizer()).before_model_callback(callback_context=context, llm_request=request)  # type: ignore
+    )
+
+    assert request.contents[0].parts[0].text == f"{SUMMARY_PREFIX}8 messages"
+    assert context.state[f"{STATE_KEY_PREFIX}agent"]["turns"] == 4
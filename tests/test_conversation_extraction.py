@@ -0,0 +1,116 @@
+"""Tests of the conversation extraction tool."""
+
+import asyncio
+from types import SimpleNamespace
+from google.adk.events import Event
+from google.genai import types
+from core.tools.conversation_extraction_tool import (
+    ROOT_SESSION_ID_STATE_KEY,
+    _extract_conversation,
+    record_root_session_callback,
+)
+
+
+def _event(event_id: str, author: str, text: str = "") -> Event:
+    part = (
+        types.Part(text=text)
+        if text
+        else types.Part(function_call=types.FunctionCall(name="google_search", args={}))
+    )
+    return Event(
+        id=event_id,
+        invocation_id="inv",
+        author=author,
+        content=types.Content(parts=[part]),
+    )
+
+
+EVENTS = [
+    _event("e0", "user", "What is RAG?"),
+    _event("e1", "chat_agent"),
+    _event("e2", "chat_agent", "Retrieval-augmented generation."),
+    _event("e3", "user", "Save it as a note."),
+    _event("e4", "obsidian_mate_agent", "Saved."),
+    _event("e5", "user", "Thanks!"),
+    _event("e6", "obsidian_mate_agent", "You're welcome."),
+]
+
+
+def _extract(**kwargs) -> dict:
+    context = SimpleNamespace(session=SimpleNamespace(id="s", events=EVENTS), state={})
+    return asyncio.run(_extract_conversation(context, **kwargs))  # type: ignore
+
+
+def test_events_are_grouped_by_turn_without_tool_calls():
+    conversation = _extract()["conversation"]
+    assert [list(turn) for turn in conversation] == [["turn-0"], ["turn-1"], ["turn-2"]]
+    assert conversation[0]["turn-0"] == [
+        {"author": "user", "text": "What is RAG?"},
+        {"author": "chat_agent", "text": "Retrieval-augmented generation."},
+    ]
+
+
+def test_last_n_turns_counts_turns_and_keeps_absolute_indices():
+    conversation = _extract(last_n_turns=2)["conversation"]
+    assert [list(turn) for turn in conversation] == [["turn-1"], ["turn-2"]]
+    assert len(conversation[0]["turn-1"]) == 2
+
+
+def test_since_event_id_returns_the_later_messages():
+    conversation = _extract(since_event_id="e3")["conversation"]
+    assert conversation == [
+        {"turn-1": [{"author": "obsidian_mate_agent", "text": "Saved."}]},
+        {
+            "turn-2": [
+                {"author": "user", "text": "Thanks!"},
+                {"author": "obsidian_mate_agent", "text": "You're welcome."},
+            ]
+        },
+    ]
+
+
+def test_unknown_since_event_id_is_an_error():
+    result = _extract(since_event_id="missing")
+    assert result["status"] == "error"
+    assert "missing" in result["error_message"]
+
+
+class _SessionService:
+    """Returns the stored sessions by id."""
+
+    def __init__(self, sessions: dict):
+        self.sessions = sessions
+        self.requested: list[str] = []
+
+    async def get_session(self, app_name, user_id, session_id):
+        self.requested.append(session_id)
+        return self.sessions.get(session_id)
+
+
+def test_under_an_agent_tool_the_top_level_session_is_loaded():
+    service = _SessionService({"root": SimpleNamespace(events=EVENTS)})
+    # The AgentTool child session only holds the request sent to the sub-agent.
+    context = SimpleNamespace(
+        user_id="user",
+        session=SimpleNamespace(
+            id="child", events=[_event("c0", "user", "Make a note.")]
+        ),
+        state={ROOT_SESSION_ID_STATE_KEY: "root"},
+    )
+
+    result = asyncio.run(_extract_conversation(context, session_service=service))  # type: ignore
+
+    assert service.requested == ["root"]
+    assert [list(turn) for turn in result["conversation"]] == [
+        ["turn-0"],
+        ["turn-1"],
+        ["turn-2"],
+    ]
+
+
+def test_the_root_session_is_recorded_once():
+    state: dict = {}
+    record_root_session_callback(SimpleNamespace(state=state, session=SimpleNamespace(id="root")))  # type: ignore
+    record_root_session_callback(SimpleNamespace(state=state, session=SimpleNamespace(id="child")))  # type: ignore
+
+    assert state == {ROOT_SESSION_ID_STATE_KEY: "root"}
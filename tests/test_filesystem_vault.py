@@ -0,0 +1,131 @@
+"""Tests of the sandboxed filesystem vault."""
+
+import os
+import asyncio
+import pytest
+from stores.vault.filesystem_vault import FilesystemVault
+
+
+@pytest.fixture()
+def vault(tmp_path):
+    root = tmp_path / "vault"
+    (root / "notes").mkdir(parents=True)
+    (root / ".obsidian").mkdir()
+    (root / "notes" / "todo.md").write_text("# Todo\n- milk\n", encoding="utf-8")
+    (tmp_path / "secret.env").write_text("TOKEN=1", encoding="utf-8")
+    return FilesystemVault(str(root))
+
+
+@pytest.mark.parametrize("vault_path", ["", ".", "vault", "./src"])
+def test_empty_or_relative_vault_path_is_rejected(vault_path):
+    with pytest.raises(ValueError, match="absolute"):
+        FilesystemVault(vault_path)
+
+
+def test_missing_vault_directory_is_rejected(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FilesystemVault(str(tmp_path / "missing"))
+
+
+def test_resolve_maps_inside_the_vault(vault):
+    assert vault.resolve("notes/todo.md") == os.path.join(
+        vault.vault_path, "notes", "todo.md"
+    )
+    assert vault.resolve("notes/todo.md/") == vault.resolve("notes\\todo.md")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "../secret.env",
+        "notes/../../secret.env",
+        "notes/..",
+        ".obsidian/workspace.json",
+        "notes/.hidden.md",
+    ],
+)
+def test_resolve_rejects_escapes_and_dot_paths(vault, path):
+    with pytest.raises(ValueError, match="outside the vault"):
+        vault.resolve(path)
+
+
+def test_resolve_rejects_absolute_paths(vault, tmp_path):
+    with pytest.raises(ValueError):
+        vault.resolve(str(tmp_path / "secret.env"))
+
+
+def test_resolve_rejects_symlinks_leaving_the_vault(vault, tmp_path):
+    os.symlink(tmp_path / "secret.env", os.path.join(vault.vault_path, "link.md"))
+    os.symlink(tmp_path, os.path.join(vault.vault_path, "outside"))
+    with pytest.raises(ValueError):
+        vault.resolve("link.md")
+    with pytest.raises(ValueError):
+        vault.resolve("outside/secret.env")
+    assert "link.md" not in asyncio.run(vault.list_files())
+
+
+def test_append_adds_a_line_and_creates_notes(vault):
+    asyncio.run(vault.append("notes/todo.md", "- eggs"))
+    asyncio.run(vault.append("notes/new.md", "first"))
+    asyncio.run(vault.append("notes/new.md", "second"))
+
+    assert asyncio.run(vault.read_file("notes/todo.md")) == "# Todo\n- milk\n- eggs"
+    assert asyncio.run(vault.read_file("notes/new.md")) == "first\nsecond"
+
+
+NOTE = "---\ntags: a\n---\n# Plan\nintro\n## Week\n- mon\n\n## Later\nsomeday ^later\n"
+
+
+@pytest.mark.parametrize(
+    "operation, target_type, target, content, expected",
+    [
+        (
+            "append",
+            "heading",
+            "Plan::Week",
+            "- tue",
+            "---\ntags: a\n---\n# Plan\nintro\n## Week\n- mon\n- tue\n\n## Later\nsomeday ^later\n",
+        ),
+        (
+            "replace",
+            "heading",
+            "Later",
+            "soon",
+            "---\ntags: a\n---\n# Plan\nintro\n## Week\n- mon\n\n## Later\nsoon\n",
+        ),
+        (
+            "prepend",
+            "block",
+            "^later",
+            "first",
+            "---\ntags: a\n---\n# Plan\nintro\n## Week\n- mon\n\n## Later\nfirst\nsomeday ^later\n",
+        ),
+        (
+            "append",
+            "frontmatter",
+            "tags",
+            "b",
+            "---\ntags: a b\n---\n# Plan\nintro\n## Week\n- mon\n\n## Later\nsomeday ^later\n",
+        ),
+        (
+            "replace",
+            "frontmatter",
+            "status",
+            "done",
+            "---\ntags: a\nstatus: done\n---\n# Plan\nintro\n## Week\n- mon\n\n## Later\nsomeday ^later\n",
+        ),
+    ],
+)
+def test_patch(vault, operation, target_type, target, content, expected):
+    asyncio.run(vault.write("plan.md", NOTE))
+    asyncio.run(vault.patch("plan.md", operation, target_type, target, content))
+    assert asyncio.run(vault.read_file("plan.md")) == expected
+
+
+@pytest.mark.parametrize(
+    "target_type, target", [("heading", "Missing"), ("block", "^nope")]
+)
+def test_patch_unknown_target_is_an_error(vault, target_type, target):
+    asyncio.run(vault.write("plan.md", NOTE))
+    with pytest.raises(ValueError, match="not found"):
+        asyncio.run(vault.patch("plan.md", "append", target_type, target, "x"))
@@ -0,0 +1,45 @@
+"""Tests of the ULID generator."""
+
+import re
+from utils import id_utils
+from utils.id_utils import generate_ulid
+
+ULID_PATTERN = re.compile(r"^[0-9a-hjkmnp-tv-z]{26}$")
+_TO_BASE32 = str.maketrans(id_utils._ALPHABET, "0123456789abcdefghijklmnopqrstuv")
+
+
+def _decode(value: str) -> int:
+    return int(value.translate(_TO_BASE32), 32)
+
+
+def test_ulids_are_26_crockford_base32_characters():
+    assert ULID_PATTERN.match(generate_ulid())
+
+
+def test_ulids_are_unique_and_sort_in_creation_order():
+    ids = [generate_ulid() for _ in range(5000)]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_timestamp_prefix_encodes_milliseconds(monkeypatch):
+    monkeypatch.setattr(id_utils.time, "time_ns", lambda: 1_700_000_000_123 * 1_000_000)
+    monkeypatch.setattr(id_utils, "_last_timestamp_ms", -1)
+    assert _decode(generate_ulid()[:10]) == 1_700_000_000_123
+
+
+def test_same_millisecond_increments_the_random_part(monkeypatch):
+    monkeypatch.setattr(id_utils.time, "time_ns", lambda: 1_700_000_000_000 * 1_000_000)
+    monkeypatch.setattr(id_utils, "_last_timestamp_ms", -1)
+    first, second = generate_ulid(), generate_ulid()
+    assert first[:10] == second[:10]
+    assert _decode(second[10:]) == _decode(first[10:]) + 1
+
+
+def test_clock_going_back_keeps_ids_monotonic(monkeypatch):
+    now = [1_700_000_000_500]
+    monkeypatch.setattr(id_utils.time, "time_ns", lambda: now[0] * 1_000_000)
+    monkeypatch.setattr(id_utils, "_last_timestamp_ms", -1)
+    first = generate_ulid()
+    now[0] -= 100
+    assert generate_ulid() > first
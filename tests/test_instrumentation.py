@@ -0,0 +1,61 @@
+"""Tests of the agent instrumentation callbacks."""
+
+from types import SimpleNamespace
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from utils import instrumentation_utils as instrumentation
+
+
+def _context(agent_name: str) -> SimpleNamespace:
+    return SimpleNamespace(invocation_id="inv-1", agent_name=agent_name)
+
+
+@pytest.mark.parametrize(
+    "result, expected",
+    [
+        ({"status": "success", "error": None}, False),
+        ({"status": "success", "error": ""}, False),
+        ({"error": "not found"}, True),
+        ({"status": "error", "error_message": "boom"}, True),
+        ({"isError": True}, True),
+        ("plain text", False),
+    ],
+)
+def test_is_error(result, expected):
+    assert instrumentation._is_error(result) is expected
+
+
+def test_raised_model_call_is_timed_and_counted():
+    context = _context("model_error_agent")
+    request = LlmRequest(model="test-model")
+    instrumentation.instrument_before_model_callback(context, request)  # type: ignore
+    instrumentation.instrument_on_model_error_callback(
+        context, request, RuntimeError("rate limited")  # type: ignore
+    )
+
+    assert ("inv-1", "model_error_agent") not in instrumentation._model_starts
+    assert (
+        'obsidianmate_model_errors_total{agent="model_error_agent",model="test-model"} 1'
+        in (instrumentation.MODEL_ERRORS.render())
+    )
+    assert (
+        'obsidianmate_model_duration_seconds_count{agent="model_error_agent",model="test-model"} 1'
+        in (instrumentation.MODEL_DURATION.render())
+    )
+
+
+def test_raised_tool_call_is_recorded_as_error():
+    tool = SimpleNamespace(name="broken_tool")
+    tool_context = SimpleNamespace(
+        invocation_id="inv-1", agent_name="tool_error_agent", function_call_id="call-1"
+    )
+    instrumentation.instrument_before_tool_callback(tool, {}, tool_context)  # type: ignore
+    instrumentation.instrument_on_tool_error_callback(
+        tool, {}, tool_context, RuntimeError("timeout")  # type: ignore
+    )
+
+    assert "call-1" not in instrumentation._tool_starts
+    assert (
+        'obsidianmate_tool_duration_seconds_count{agent="tool_error_agent",tool="broken_tool",status="error"} 1'
+        in instrumentation.TOOL_DURATION.render()
+    )
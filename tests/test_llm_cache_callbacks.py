@@ -0,0 +1,29 @@
+"""Tests of the model response cache callbacks."""
+
+import asyncio
+from types import SimpleNamespace
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+from utils import agent_utils
+
+
+class _EmptyCache:
+    def get(self, key):
+        return None
+
+
+def test_failed_model_call_releases_its_cache_key(monkeypatch):
+    monkeypatch.setattr(agent_utils, "get_llm_response_cache", _EmptyCache)
+    context = SimpleNamespace(invocation_id="inv-1", agent_name="chat_agent")
+    request = LlmRequest(
+        model="test-model",
+        contents=[types.Content(role="user", parts=[types.Part(text="hello")])],
+    )
+
+    asyncio.run(agent_utils.llm_cache_before_model_callback(context, request))  # type: ignore
+    assert ("inv-1", "chat_agent") in agent_utils._pending_cache_keys
+
+    agent_utils.llm_cache_on_model_error_callback(
+        context, request, RuntimeError("rate limited")  # type: ignore
+    )
+    assert ("inv-1", "chat_agent") not in agent_utils._pending_cache_keys
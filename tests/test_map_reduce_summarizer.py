@@ -0,0 +1,50 @@
+"""Tests of the map-reduce summarizer."""
+
+import asyncio
+import pytest
+from core.summarization import MapReduceSummarizer, SummarizationError
+
+
+class _FlakySummarizer(MapReduceSummarizer):
+    """Answers with the chunk's last word, failing the first calls of some chunks."""
+
+    def __init__(self, failures: dict[str, int], **kwargs):
+        super().__init__(
+            model=None,  # type: ignore
+            chunk_token_budget=2,
+            retry_delay=0,
+            token_counter=lambda text: len(text.split()),
+            **kwargs,
+        )
+        self.failures = dict(failures)
+        self.calls = 0
+
+    async def _generate(self, instruction: str, text: str) -> str:
+        self.calls += 1
+        word = text.split()[-1]
+        if self.failures.get(word, 0) > 0:
+            self.failures[word] -= 1
+            raise RuntimeError(f"rate limited on {word}")
+        return word
+
+
+MESSAGES = [{"author": "user", "text": text} for text in ("a", "b", "c")]
+
+
+def test_failed_chunk_is_retried():
+    summarizer = _FlakySummarizer({"a": 1}, max_retries=1)
+    result = asyncio.run(summarizer.summarize(MESSAGES[:1]))
+    assert result["summary"] == "a"
+    assert summarizer.calls == 2
+
+
+def test_chunk_failing_after_retries_raises():
+    summarizer = _FlakySummarizer({"b": 5}, max_retries=2)
+    with pytest.raises(SummarizationError, match="1 of 3 chunks of the map stage"):
+        asyncio.run(summarizer.summarize(MESSAGES))
+    assert summarizer.calls == 2 + 3
+
+
+def test_negative_retries_are_rejected():
+    with pytest.raises(ValueError):
+        _FlakySummarizer({}, max_retries=-1)
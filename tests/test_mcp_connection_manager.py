@@ -0,0 +1,41 @@
+"""Tests of the MCP session pool against the private ADK internals it relies on.
+
+``MCPSessionPool`` swaps itself into ``McpToolset`` through private attributes of
+google-adk (pinned in ``requirements.txt``); these tests fail loudly if an ADK
+upgrade renames them.
+"""
+
+import asyncio
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+from stores.mcp.mcp_connection_manager import MCPSessionPool
+from stores.mcp.stub_server import stub_toolset
+
+
+def test_adk_internals_used_by_the_pool_exist():
+    toolset = stub_toolset()
+    for attribute in ("_connection_params", "_errlog", "_mcp_session_manager"):
+        assert hasattr(toolset, attribute), f"McpToolset.{attribute} is gone"
+    for method in ("_create_client", "_is_session_disconnected"):
+        assert callable(
+            getattr(MCPSessionManager, method, None)
+        ), f"MCPSessionManager.{method} is gone"
+
+
+def test_pool_serves_the_toolset_and_survives_its_close():
+    async def scenario():
+        toolset = stub_toolset()
+        pool = MCPSessionPool("stub", toolset, pool_size=1)
+        assert toolset._mcp_session_manager is pool  # pylint: disable=[W0212]
+        await pool.start()
+        try:
+            tools = {tool.name: tool for tool in await toolset.get_tools()}
+            first = await tools["get_pid"].run_async(args={}, tool_context=None)
+            await toolset.close()
+            second = await tools["get_pid"].run_async(args={}, tool_context=None)
+            return first, second, pool.stats()
+        finally:
+            await pool.shutdown()
+
+    first, second, stats = asyncio.run(scenario())
+    assert first == second
+    assert stats == {"pool_size": 1, "healthy": 1, "recycled": 0}
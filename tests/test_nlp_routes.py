@@ -0,0 +1,141 @@
+"""Tests of the chat routes: stream framing, summary requests and memory ingestion."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from fastapi.responses import JSONResponse
+from core.summarization import SummarizationError
+from routes import nlp
+from stores.memory import SqliteMemoryService
+
+SESSION = SimpleNamespace(app_name="app", user_id="user", id="session")
+
+
+class _FakeNLPController:
+    """Streams canned frames and summarizes to a fixed (or failing) outcome."""
+
+    summary: object = {"summary": "talked about notes"}
+
+    def __init__(self, runner):
+        self.runner = runner
+        self.template_parser = SimpleNamespace(
+            get=lambda group, key, values: f"save {values}"
+        )
+
+    async def stream_query(self, session, query):
+        yield {"type": "token", "author": "root", "text": query[:2]}
+        yield {"type": "done", "answer": query}
+
+    async def summarize_conversation(self, session, summarizer):
+        if isinstance(self.summary, Exception):
+            raise self.summary
+        return self.summary
+
+
+class _FakeSessionController:
+    def __init__(self, session_service):
+        self.session_service = session_service
+
+    async def get_session(self, app_name, user_id, session_id):
+        return SESSION
+
+
+def _request() -> SimpleNamespace:
+    state = SimpleNamespace(
+        settings=SimpleNamespace(APP_NAME="app"),
+        session_service=None,
+        runner=None,
+        summarizer=None,
+    )
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+def _stream(monkeypatch, query: str, stream_format: str = "ndjson"):
+    remembered = []
+
+    async def fake_remember(app_state, session):
+        remembered.append(session)
+
+    monkeypatch.setattr(nlp, "NLPController", _FakeNLPController)
+    monkeypatch.setattr(nlp, "SessionController", _FakeSessionController)
+    monkeypatch.setattr(nlp, "_remember", fake_remember)
+
+    async def scenario():
+        response = await nlp.stream_answer_question(
+            _request(), "session", "user", query=query, stream_format=stream_format
+        )
+        if isinstance(response, JSONResponse):
+            return response, []
+        return response, [chunk async for chunk in response.body_iterator]
+
+    response, chunks = asyncio.run(scenario())
+    return response, chunks, remembered
+
+
+def test_encode_frame_as_sse_and_ndjson():
+    frame = {"type": "token", "text": "héllo\n"}
+
+    assert nlp._encode_frame(frame, "sse") == (
+        'event: token\ndata: {"type": "token", "text": "héllo\\n"}\n\n'
+    )
+    assert (
+        nlp._encode_frame(frame, "ndjson") == '{"type": "token", "text": "héllo\\n"}\n'
+    )
+
+
+def test_stream_ends_with_the_done_frame_and_remembers_the_answer(monkeypatch):
+    _, chunks, remembered = _stream(monkeypatch, "hello")
+
+    frames = [json.loads(chunk) for chunk in chunks]
+    assert [frame["type"] for frame in frames] == ["token", "done"]
+    assert frames[-1]["answer"] == "hello"
+    assert remembered == [SESSION]
+
+
+def test_stream_does_not_remember_an_empty_answer(monkeypatch):
+    _, chunks, remembered = _stream(monkeypatch, "")
+
+    assert json.loads(chunks[-1]) == {"type": "done", "answer": ""}
+    assert remembered == []
+
+
+def test_stream_summary_rewrites_the_query(monkeypatch):
+    _, chunks, _ = _stream(monkeypatch, "Summary")
+
+    assert json.loads(chunks[-1])["answer"] == "save {'summary': 'talked about notes'}"
+
+
+def test_stream_summary_errors(monkeypatch):
+    monkeypatch.setattr(_FakeNLPController, "summary", None)
+    response, _, remembered = _stream(monkeypatch, "summary")
+    assert response.status_code == 404
+    assert remembered == []
+
+    monkeypatch.setattr(_FakeNLPController, "summary", SummarizationError("model down"))
+    response, _, _ = _stream(monkeypatch, "summary")
+    assert response.status_code == 502
+    assert json.loads(response.body) == {"signal": "summary_failed"}
+
+
+def test_remember_syncs_the_sqlite_memory_from_the_session_service():
+    calls = []
+
+    class _Memory(SqliteMemoryService):
+        def __init__(self):  # pylint: disable=[W0231]
+            pass
+
+        async def sync_session(self, session_service, app_name, user_id, session_id):
+            calls.append(("sync", session_service, app_name, user_id, session_id))
+
+    class _OtherMemory:
+        async def add_session_to_memory(self, session):
+            calls.append(("add", session))
+
+    asyncio.run(
+        nlp._remember(
+            SimpleNamespace(memory_service=_Memory(), session_service="svc"), SESSION
+        )
+    )
+    asyncio.run(nlp._remember(SimpleNamespace(memory_service=_OtherMemory()), SESSION))
+
+    assert calls == [("sync", "svc", "app", "user", "session"), ("add", SESSION)]
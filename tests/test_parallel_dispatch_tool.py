@@ -0,0 +1,56 @@
+"""Tests of the parallel dispatch tool."""
+
+import asyncio
+from google.adk.agents import Agent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.sessions import InMemorySessionService, Session
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+from core.tools.parallel_dispatch_tool import ParallelDispatchTool
+
+
+class _TranscriptTool(BaseTool):
+    """Writes its request to ``video_transcript``, like the transcript agent."""
+
+    def __init__(self):
+        super().__init__(
+            name="YouTubeTranscriptAgent", description="Fake transcript agent."
+        )
+
+    async def run_async(self, *, args, tool_context):
+        await asyncio.sleep(0.01 if args["request"] == "first" else 0)
+        tool_context.state["video_transcript"] = args["request"]
+        return args["request"]
+
+
+def _tool_context() -> ToolContext:
+    session = Session(id="session", app_name="app", user_id="user")
+    invocation_context = InvocationContext(
+        session_service=InMemorySessionService(),
+        invocation_id="inv",
+        agent=Agent(name="root"),
+        session=session,
+    )
+    return ToolContext(invocation_context, function_call_id="call")
+
+
+def test_tasks_writing_the_same_key_do_not_overwrite_each_other():
+    tool_context = _tool_context()
+    tool = ParallelDispatchTool([_TranscriptTool()])  # type: ignore
+    response = asyncio.run(
+        tool.run_async(
+            args={
+                "tasks": [
+                    {"agent": "YouTubeTranscriptAgent", "request": "first"},
+                    {"agent": "YouTubeTranscriptAgent", "request": "second"},
+                ]
+            },
+            tool_context=tool_context,
+        )
+    )
+
+    assert [result["result"] for result in response["results"]] == ["first", "second"]
+    assert tool_context.actions.state_delta == {
+        "video_transcript:0": "first",
+        "video_transcript:1": "second",
+    }
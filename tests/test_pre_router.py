@@ -0,0 +1,94 @@
+"""Tests of the pre-router."""
+
+import asyncio
+from typing import AsyncGenerator
+import litellm
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.lite_llm import LiteLlm, LiteLLMClient
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
+from core.routing import PreRouter
+from core.routing.pre_router import ROUTED_CALL_PREFIX, youtube_url_rule
+from models.enums import AgentNameEnum
+
+OPENAI_MAX_TOOL_CALL_ID = 40
+
+
+class _EchoLlm(BaseLlm):
+    """Answers with a fixed text."""
+
+    async def generate_content_async(
+        self, llm_request, stream=False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text="transcript")])
+        )
+
+
+class _RecordingClient(LiteLLMClient):
+    """Records the messages LiteLlm would send, and answers with a text."""
+
+    def __init__(self):
+        self.calls: list[list] = []
+
+    async def acompletion(self, model, messages, tools, **kwargs):
+        self.calls.append(messages)
+        return litellm.ModelResponse(
+            choices=[{"message": {"role": "assistant", "content": "you are welcome"}}]
+        )
+
+
+def _tool_call_ids(messages: list) -> list[str]:
+    ids = []
+    for message in messages:
+        for call in (
+            message.get("tool_calls") if isinstance(message, dict) else None
+        ) or []:
+            ids.append(call["id"])
+    return ids
+
+
+def test_routed_call_ids_are_accepted_by_openai_on_the_next_turn():
+    client = _RecordingClient()
+    transcript_agent = LlmAgent(
+        name=AgentNameEnum.YOUTUBE_TRANSCRIPT_AGENT, model=_EchoLlm(model="echo")
+    )
+    root = LlmAgent(
+        name="root",
+        model=LiteLlm(model="openai/gpt-4o-mini", llm_client=client),
+        tools=[AgentTool(transcript_agent)],
+        before_model_callback=PreRouter(rules=[youtube_url_rule]).before_model_callback,
+    )
+    service = InMemorySessionService()
+    runner = Runner(agent=root, app_name="test", session_service=service)
+
+    async def turn(session_id: str, text: str) -> str:
+        answer = ""
+        async for event in runner.run_async(
+            user_id="u",
+            session_id=session_id,
+            new_message=types.Content(role="user", parts=[types.Part(text=text)]),
+        ):
+            if event.content and event.content.parts and event.content.parts[0].text:
+                answer = event.content.parts[0].text
+        return answer
+
+    async def scenario():
+        session = await service.create_session(app_name="test", user_id="u")
+        routed = await turn(session.id, "https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        follow_up = await turn(session.id, "thanks")
+        return routed, follow_up
+
+    routed, follow_up = asyncio.run(scenario())
+
+    assert routed == "transcript"
+    assert follow_up == "you are welcome"
+    # The routed turn never reached the model; the follow-up carries its call.
+    assert len(client.calls) == 1
+    ids = _tool_call_ids(client.calls[0])
+    assert ids and all(call_id.startswith(ROUTED_CALL_PREFIX) for call_id in ids)
+    assert all(len(call_id) <= OPENAI_MAX_TOOL_CALL_ID for call_id in ids)
@@ -0,0 +1,106 @@
+"""Tests of the semantic answer cache."""
+
+import asyncio
+from types import SimpleNamespace
+import pytest
+from google.adk.events import Event
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from stores.llm.semantic_cache import SemanticAnswerCache
+from utils import agent_utils
+
+ANSWERED = [
+    ("How do I delete a note in Obsidian?", "Right-click it and choose Delete."),
+    ("What are Python decorators?", "Functions wrapping other functions."),
+    ("Is 17 a prime number?", "Yes."),
+    ("What's the capital of France?", "Paris."),
+    ("Explain how transformers work", "Self-attention over tokens."),
+]
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    cache = SemanticAnswerCache(str(tmp_path / "semantic.db"))
+    for question, answer in ANSWERED:
+        cache.put(question, answer, scope="alice")
+    return cache
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "How do I create a note in Obsidian?",
+        "What are Python generators?",
+        "Is 18 a prime number?",
+        "What's the capital of Germany?",
+    ],
+)
+def test_different_questions_miss(cache, question):
+    assert cache.lookup(question, "alice") is None
+
+
+@pytest.mark.parametrize(
+    "question, answer",
+    [
+        ("How can I delete a note in Obsidian?", "Right-click it and choose Delete."),
+        ("Can you explain how transformers work?", "Self-attention over tokens."),
+        ("what is the capital of France", "Paris."),
+    ],
+)
+def test_paraphrases_hit(cache, question, answer):
+    hit = cache.lookup(question, "alice")
+    assert hit is not None
+    assert hit["answer"] == answer
+
+
+def test_answers_are_not_shared_across_users(cache):
+    assert cache.lookup("How do I delete a note in Obsidian?", "bob") is None
+    assert cache.lookup("How do I delete a note in Obsidian?", "alice") is not None
+
+
+def test_scope_survives_reload(cache, tmp_path):
+    reloaded = SemanticAnswerCache(str(tmp_path / "semantic.db"))
+    assert reloaded.lookup("Is 17 a prime number?", "alice")["answer"] == "Yes."
+    assert reloaded.lookup("Is 17 a prime number?", "bob") is None
+
+
+def test_invalidate_by_question_within_scope(cache):
+    cache.put("Is 17 a prime number?", "Yes, it is.", scope="bob")
+    assert cache.invalidate(question="Is 17 a prime number?", scope="bob") == 1
+    assert cache.lookup("Is 17 a prime number?", "alice") is not None
+    assert cache.lookup("Is 17 a prime number?", "bob") is None
+
+
+def _answer_turn(cache, monkeypatch, tool_name):
+    monkeypatch.setattr(agent_utils, "get_semantic_cache", lambda: cache)
+    call = Event(
+        invocation_id="inv-1",
+        author="chat_agent",
+        content=types.Content(
+            role="model",
+            parts=[
+                types.Part(function_call=types.FunctionCall(name=tool_name, args={}))
+            ],
+        ),
+    )
+    context = SimpleNamespace(
+        user_id="alice",
+        invocation_id="inv-1",
+        user_content=types.Content(
+            role="user", parts=[types.Part(text="What did I plan for Monday?")]
+        ),
+        session=SimpleNamespace(events=[call]),
+    )
+    response = LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text="Gym.")])
+    )
+    asyncio.run(agent_utils.semantic_cache_after_model_callback(context, response))  # type: ignore
+    return cache.lookup("What did I plan for Monday?", "alice")
+
+
+def test_answers_from_the_vault_are_not_cached(cache, monkeypatch):
+    assert _answer_turn(cache, monkeypatch, "retrieve_notes") is None
+
+
+def test_answers_from_other_tools_are_cached(cache, monkeypatch):
+    assert _answer_turn(cache, monkeypatch, "google_search")["answer"] == "Gym."
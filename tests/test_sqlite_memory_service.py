@@ -0,0 +1,129 @@
+"""Tests of the SQLite memory service."""
+
+import asyncio
+from google.adk.events import Event, EventActions
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import types
+from stores.memory import SqliteMemoryService
+
+
+def _event(event_id: str, text: str, timestamp: float, author: str = "user") -> Event:
+    return Event(
+        id=event_id,
+        invocation_id="inv",
+        author=author,
+        timestamp=timestamp,
+        content=types.Content(
+            role="user" if author == "user" else "model", parts=[types.Part(text=text)]
+        ),
+    )
+
+
+def _session(user_id: str, events: list[Event], session_id: str = "s1") -> Session:
+    return Session(id=session_id, app_name="app", user_id=user_id, events=events)
+
+
+def _count(memory: SqliteMemoryService) -> tuple[int, int]:
+    events = memory._conn.execute("SELECT COUNT(*) FROM memory_events").fetchone()[0]
+    fts = memory._conn.execute("SELECT COUNT(*) FROM memory_fts").fetchone()[0]
+    return events, fts
+
+
+def _ids(response) -> list[str]:
+    return [memory.id for memory in response.memories]
+
+
+def test_adding_a_session_again_does_not_duplicate_rows(tmp_path):
+    memory = SqliteMemoryService(str(tmp_path / "memory.db"))
+    events = [
+        _event("e1", "obsidian vault", 1.0),
+        _event("e2", "daily notes", 2.0, "agent"),
+    ]
+    # A state-only event carries no text and is not stored.
+    events.append(
+        Event(
+            id="e3",
+            invocation_id="inv",
+            author="agent",
+            timestamp=3.0,
+            actions=EventActions(state_delta={"k": 1}),
+        )
+    )
+
+    asyncio.run(memory.add_session_to_memory(_session("u1", events)))
+    asyncio.run(memory.add_session_to_memory(_session("u1", events)))
+
+    assert _count(memory) == (2, 2)
+    assert memory._high_water_mark("app", "u1", "s1") == 3.0
+
+
+def test_an_event_with_the_timestamp_of_the_mark_is_ingested_once(tmp_path):
+    memory = SqliteMemoryService(str(tmp_path / "memory.db"))
+    first = _event("e1", "first note", 5.0)
+    asyncio.run(memory.add_session_to_memory(_session("u1", [first])))
+
+    # Appended later but stamped with the same time as the high-water mark.
+    same_time = _event("e2", "second note", 5.0, "agent")
+    asyncio.run(memory.add_session_to_memory(_session("u1", [first, same_time])))
+
+    assert _count(memory) == (2, 2)
+    found = asyncio.run(
+        memory.search_memory(app_name="app", user_id="u1", query="note")
+    )
+    assert sorted(_ids(found)) == ["e1", "e2"]
+
+
+def test_sync_session_fetches_only_new_events_without_duplicates(tmp_path):
+    memory = SqliteMemoryService(str(tmp_path / "memory.db"))
+    service = InMemorySessionService()
+
+    async def scenario():
+        session = await service.create_session(
+            app_name="app", user_id="u1", session_id="s1"
+        )
+        await service.append_event(session, _event("e1", "kanban board", 1.0))
+        first = await memory.sync_session(service, "app", "u1", "s1")
+        again = await memory.sync_session(service, "app", "u1", "s1")
+        await service.append_event(session, _event("e2", "kanban answer", 2.0, "agent"))
+        later = await memory.sync_session(service, "app", "u1", "s1")
+        return first, again, later
+
+    assert asyncio.run(scenario()) == (1, 0, 1)
+    assert _count(memory) == (2, 2)
+
+
+def test_search_is_ranked_by_bm25_within_the_user(tmp_path):
+    memory = SqliteMemoryService(str(tmp_path / "memory.db"))
+    asyncio.run(
+        memory.add_session_to_memory(
+            _session(
+                "u1",
+                [
+                    _event(
+                        "weak",
+                        "a long note about many topics, once mentioning graphs",
+                        1.0,
+                    ),
+                    _event("strong", "graphs graphs graphs", 2.0),
+                    _event("other", "nothing relevant here", 3.0),
+                ],
+            )
+        )
+    )
+    asyncio.run(
+        memory.add_session_to_memory(
+            _session("u2", [_event("u2-only", "graphs graphs", 1.0)], "s2")
+        )
+    )
+
+    first_user = asyncio.run(
+        memory.search_memory(app_name="app", user_id="u1", query="graphs")
+    )
+    second_user = asyncio.run(
+        memory.search_memory(app_name="app", user_id="u2", query="graphs")
+    )
+
+    assert _ids(first_user) == ["strong", "weak"]
+    assert first_user.memories[0].custom_metadata == {"session_id": "s1"}
+    assert _ids(second_user) == ["u2-only"]
+    memory.close()
@@ -0,0 +1,119 @@
+"""Tests of the span export and the trace waterfall."""
+
+import json
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExportResult
+from opentelemetry.trace import Status, StatusCode
+from utils.trace_waterfall import NAME_WIDTH, load_spans, render_waterfall
+from utils.tracing_utils import JsonlSpanExporter, span_to_dict
+
+
+def _tracer(exporter):
+    provider = TracerProvider(resource=Resource.create({"service.name": "test"}))
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test")
+
+
+class _ListExporter(JsonlSpanExporter):
+    """Keeps the finished spans instead of writing them."""
+
+    def __init__(self):  # pylint: disable=[W0231]
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+
+def test_span_to_dict_flattens_a_finished_span():
+    exporter = _ListExporter()
+    tracer = _tracer(exporter)
+    with tracer.start_as_current_span("parent") as parent:
+        with tracer.start_as_current_span("child") as child:
+            child.set_attribute("tags", ("a", "b"))
+            child.set_status(Status(StatusCode.ERROR))
+
+    child_record, parent_record = (span_to_dict(span) for span in exporter.spans)
+
+    assert parent_record["parent_id"] is None
+    assert (
+        child_record["parent_id"]
+        == parent_record["span_id"]
+        == format(parent.get_span_context().span_id, "016x")
+    )
+    assert child_record["trace_id"] == parent_record["trace_id"]
+    assert len(child_record["trace_id"]) == 32
+    assert child_record["attributes"] == {"tags": ["a", "b"]}
+    assert child_record["status"] == "ERROR"
+    assert child_record["kind"] == "INTERNAL"
+    assert child_record["service"] == "test"
+    assert (
+        parent_record["start"]
+        <= child_record["start"]
+        <= child_record["end"]
+        <= parent_record["end"]
+    )
+    json.dumps(child_record)
+
+
+def test_jsonl_exporter_appends_one_line_per_span(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    tracer = _tracer(JsonlSpanExporter(str(path)))
+    for name in ("first", "second"):
+        with tracer.start_as_current_span(name):
+            pass
+
+    assert [span["name"] for span in load_spans(str(path))] == ["first", "second"]
+
+
+def test_jsonl_exporter_reports_a_write_failure(tmp_path):
+    exporter = JsonlSpanExporter(
+        str(tmp_path)
+    )  # a directory: cannot be opened for writing
+    recorder = _ListExporter()
+    with _tracer(recorder).start_as_current_span("span"):
+        pass
+
+    assert exporter.export(recorder.spans) == SpanExportResult.FAILURE
+
+
+def _span(span_id, parent_id, start, end, name=None, status="UNSET"):
+    return {
+        "trace_id": "t",
+        "span_id": span_id,
+        "parent_id": parent_id,
+        "name": name or span_id,
+        "start": start,
+        "end": end,
+        "status": status,
+        "attributes": {},
+    }
+
+
+def test_render_waterfall_nests_children_in_start_order():
+    spans = [
+        _span("late-child", "root", 60, 100),
+        _span("grandchild", "early-child", 20, 30, status="ERROR"),
+        _span("root", None, 0, 100),
+        _span("early-child", "root", 10, 50),
+        # Its parent was not exported: rendered as a root of its own.
+        _span("orphan", "missing", 5, 6),
+    ]
+
+    lines = render_waterfall(spans, width=10)
+
+    assert [line[:NAME_WIDTH].strip() for line in lines] == [
+        "root",
+        "early-child",
+        "grandchild",
+        "late-child",
+        "orphan",
+    ]
+    assert lines[0].startswith("root ")
+    assert lines[1].startswith("  early-child ")
+    assert lines[2].startswith("    grandchild ")
+    assert "ms!|" in lines[2] and "ms |" in lines[1]
+    assert lines[0].endswith("|██████████|")
+    assert lines[3].endswith("|      ████|")
+    assert render_waterfall([]) == []
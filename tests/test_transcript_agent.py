@@ -0,0 +1,86 @@
+"""Tests of the direct transcript agent and the transcript fetcher."""
+
+import asyncio
+import pytest
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from core.obsidian_mate.sub_agents import transcript_agent
+from core.obsidian_mate.sub_agents.transcript_agent import DirectTranscriptAgent
+from core.tools import youtube_transcript_tool
+
+FIRST, SECOND = "aaaaaaaaaaa", "bbbbbbbbbbb"
+
+
+async def _fake_fetch(video_id: str, lang: str = "en") -> dict:
+    if video_id == SECOND:
+        return {"status": "error", "error_message": "TimeoutError: no answer"}
+    return {
+        "status": "success",
+        "video_id": video_id,
+        "transcript": f"words of {video_id}",
+    }
+
+
+def _run(request: str) -> tuple[str, dict]:
+    agent = DirectTranscriptAgent(name="transcript_agent")
+    runner = InMemoryRunner(agent=agent, app_name="test")
+
+    async def scenario():
+        session = await runner.session_service.create_session(
+            app_name="test", user_id="user"
+        )
+        texts = []
+        async for event in runner.run_async(
+            user_id="user",
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text=request)]),
+        ):
+            texts.append(event.content.parts[0].text)
+        session = await runner.session_service.get_session(
+            app_name="test", user_id="user", session_id=session.id
+        )
+        return "\n".join(texts), session.state
+
+    return asyncio.run(scenario())
+
+
+@pytest.fixture(autouse=True)
+def fake_fetch(monkeypatch):
+    monkeypatch.setattr(transcript_agent, "fetch_transcript", _fake_fetch)
+
+
+def test_no_links():
+    text, state = _run("Summarize my notes")
+    assert text == "No YouTube video link was found in the request."
+    assert "video_transcript" not in state
+
+
+def test_several_links_with_one_failed_fetch():
+    text, state = _run(
+        f"Compare https://youtu.be/{FIRST} and https://www.youtube.com/watch?v={SECOND}"
+    )
+    assert text == (
+        f"## {FIRST}\n\nwords of {FIRST}\n\n"
+        f"## {SECOND}\n\nTranscript unavailable: TimeoutError: no answer"
+    )
+    assert state["video_transcript"] == text
+
+
+def test_single_failed_fetch_writes_no_state():
+    text, state = _run(f"Transcript of https://youtu.be/{SECOND}")
+    assert text.startswith("Transcript unavailable")
+    assert "video_transcript" not in state
+
+
+def test_server_start_failure_is_reported_as_an_error(monkeypatch):
+    async def failing_get_tools(*args, **kwargs):
+        raise FileNotFoundError("docker")
+
+    monkeypatch.setattr(youtube_transcript_tool, "get_transcript_cache", lambda: None)
+    monkeypatch.setattr(
+        youtube_transcript_tool.transcript_tool, "get_tools", failing_get_tools
+    )
+    result = asyncio.run(
+        youtube_transcript_tool.fetch_transcript(f"https://youtu.be/{FIRST}")
+    )
+    assert result == {"status": "error", "error_message": "FileNotFoundError: docker"}
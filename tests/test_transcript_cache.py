@@ -0,0 +1,101 @@
+"""Tests of the YouTube transcript cache and video ID parsing."""
+
+import random
+import pytest
+from stores.youtube import transcript_cache
+from stores.youtube.transcript_cache import (
+    TranscriptCache,
+    canonical_video_id,
+    find_video_ids,
+)
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        VIDEO_ID,
+        f"https://www.youtube.com/watch?v={VIDEO_ID}",
+        f"https://youtube.com/watch?feature=share&v={VIDEO_ID}&t=42s",
+        f"youtube.com/watch?v={VIDEO_ID}",
+        f"https://m.youtube.com/watch?v={VIDEO_ID}",
+        f"https://youtu.be/{VIDEO_ID}?si=abc",
+        f"https://www.youtube.com/shorts/{VIDEO_ID}",
+        f"https://www.youtube.com/live/{VIDEO_ID}?feature=share",
+        f"https://www.youtube-nocookie.com/embed/{VIDEO_ID}",
+    ],
+)
+def test_canonical_video_id(url):
+    assert canonical_video_id(url) == VIDEO_ID
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=short",
+        "https://www.youtube.com/channel/UC123",
+        "not a url",
+    ],
+)
+def test_canonical_video_id_rejects_other_links(url):
+    assert canonical_video_id(url) is None
+
+
+def test_find_video_ids_deduplicates_in_order():
+    text = f"Compare (https://youtu.be/{VIDEO_ID}) with youtube.com/shorts/abcdefghijk and https://www.youtube.com/watch?v={VIDEO_ID}."
+    assert find_video_ids(text) == [VIDEO_ID, "abcdefghijk"]
+
+
+def _transcript(seed: int) -> str:
+    # Random words compress poorly, so every blob has a similar, known size.
+    rng = random.Random(seed)
+    return " ".join(f"{rng.getrandbits(32):08x}" for _ in range(500))
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(transcript_cache.time, "time", tick)
+
+
+def test_least_recently_used_transcript_is_evicted(tmp_path, clock):
+    probe = TranscriptCache(str(tmp_path / "probe"))
+    probe.put("aaaaaaaaaaa", _transcript(0))
+    blob_size = probe.stats()["bytes"]
+
+    cache = TranscriptCache(str(tmp_path / "cache"), max_bytes=int(blob_size * 2.5))
+    cache.put("aaaaaaaaaaa", _transcript(1))
+    cache.put("bbbbbbbbbbb", _transcript(2))
+    assert cache.get("aaaaaaaaaaa") == _transcript(
+        1
+    )  # "b" is now the least recently used
+    cache.put("ccccccccccc", _transcript(3))
+
+    assert cache.get("bbbbbbbbbbb") is None
+    assert cache.get("aaaaaaaaaaa") == _transcript(1)
+    assert cache.get("ccccccccccc") == _transcript(3)
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_identical_transcripts_share_one_blob(tmp_path, clock):
+    cache = TranscriptCache(str(tmp_path))
+    cache.put("aaaaaaaaaaa", _transcript(1), lang="en")
+    cache.put("aaaaaaaaaaa", _transcript(1), lang="EN_us")
+    single = cache.stats()["bytes"]
+    assert cache.stats()["entries"] == 2
+
+    assert cache.invalidate("aaaaaaaaaaa", lang="en-US") == 1
+    assert cache.stats()["bytes"] == single
+    assert cache.get("aaaaaaaaaaa", lang="en") == _transcript(1)
+
+
+def test_index_is_reloaded(tmp_path, clock):
+    TranscriptCache(str(tmp_path)).put("aaaaaaaaaaa", _transcript(1))
+    assert TranscriptCache(str(tmp_path)).get("aaaaaaaaaaa") == _transcript(1)
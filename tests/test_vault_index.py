@@ -0,0 +1,55 @@
+"""Tests of the vault full-text index and its search tool."""
+
+import asyncio
+import pytest
+from core.tools import vault_search_tool
+from stores.vault.vault_index import VaultIndex
+
+NOTES = {
+    "python/decorators.md": "# Decorators\nPython decorators wrap functions. Decorators are functions.",
+    "python/generators.md": "# Generators\nPython generators yield values lazily.",
+    "cooking/pasta.md": "# Pasta\nBoil water, add salt, cook the pasta.",
+    ".obsidian/workspace.md": "decorators decorators decorators",
+}
+
+
+@pytest.fixture()
+def index(tmp_path):
+    for path, text in NOTES.items():
+        note = tmp_path / "vault" / path
+        note.parent.mkdir(parents=True, exist_ok=True)
+        note.write_text(text, encoding="utf-8")
+    index = VaultIndex(str(tmp_path / "vault"), index_path=str(tmp_path / "index.pkl"))
+    index.refresh()
+    return index
+
+
+def test_bm25_ranks_the_most_relevant_note_first(index):
+    results = index.search("python decorators")
+    assert [result["path"] for result in results] == [
+        "python/decorators.md",
+        "python/generators.md",
+    ]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_hidden_folders_are_not_indexed(index):
+    assert index.stats()["notes"] == 3
+
+
+def test_unknown_terms_match_nothing(index):
+    assert index.search("kubernetes") == []
+
+
+def test_persisted_index_is_reloaded(index, tmp_path):
+    reloaded = VaultIndex(
+        str(tmp_path / "vault"), index_path=str(tmp_path / "index.pkl")
+    )
+    assert reloaded.search("pasta")[0]["path"] == "cooking/pasta.md"
+
+
+def test_search_tool_returns_ranked_notes(index, monkeypatch):
+    monkeypatch.setattr(vault_search_tool, "get_vault_index", lambda: index)
+    result = asyncio.run(vault_search_tool.search_vault("pasta", limit=5))
+    assert result["status"] == "success"
+    assert result["results"][0]["path"] == "cooking/pasta.md"
@@ -0,0 +1,186 @@
+"""Tests of the write-coalescing Obsidian toolset."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from google.adk.tools.base_tool import BaseTool
+from core.tools.write_coalescing_toolset import (
+    APPEND_TOOL_NAME,
+    PATCH_TOOL_NAME,
+    WriteBuffer,
+    _FlushingTool,
+    _WriteOp,
+    coalesce,
+)
+
+
+class _RecordingTool(BaseTool):
+    """Records its calls; reads return the content written so far."""
+
+    def __init__(self, name: str, notes: dict[str, str], calls: list):
+        super().__init__(name=name, description=name)
+        self.notes = notes
+        self.calls = calls
+
+    async def run_async(self, *, args: dict[str, Any], tool_context: Any) -> Any:
+        self.calls.append((self.name, dict(args)))
+        if self.name == APPEND_TOOL_NAME:
+            self.notes[args["filepath"]] = (
+                self.notes.get(args["filepath"], "") + args["content"]
+            )
+        return {
+            "status": "success",
+            "content": self.notes.get(args.get("filepath", ""), ""),
+        }
+
+
+def _context(invocation_id: str = "inv-1") -> SimpleNamespace:
+    return SimpleNamespace(invocation_id=invocation_id)
+
+
+def _op(name: str, **args) -> _WriteOp:
+    return _WriteOp(
+        _RecordingTool(name, {}, []), {"filepath": "a.md", **args}, _context()
+    )
+
+
+def test_coalesce_joins_consecutive_appends():
+    merged = coalesce(
+        [_op(APPEND_TOOL_NAME, content="one"), _op(APPEND_TOOL_NAME, content="two")]
+    )
+
+    assert len(merged) == 1
+    assert merged[0].args["content"] == "one\ntwo"
+
+
+def test_coalesce_merges_patches_of_the_same_target_in_application_order():
+    target = {"target_type": "heading", "target": "Notes"}
+    merged = coalesce(
+        [
+            _op(PATCH_TOOL_NAME, operation="append", content="a", **target),
+            _op(PATCH_TOOL_NAME, operation="append", content="b", **target),
+            _op(PATCH_TOOL_NAME, operation="prepend", content="c", **target),
+            _op(PATCH_TOOL_NAME, operation="prepend", content="d", **target),
+            _op(PATCH_TOOL_NAME, operation="replace", content="e", **target),
+            _op(PATCH_TOOL_NAME, operation="replace", content="f", **target),
+        ]
+    )
+
+    assert [(op.args["operation"], op.args["content"]) for op in merged] == [
+        ("append", "a\nb"),
+        ("prepend", "d\nc"),
+        ("replace", "f"),
+    ]
+
+
+def test_coalesce_keeps_writes_that_cannot_merge_in_order():
+    merged = coalesce(
+        [
+            _op(APPEND_TOOL_NAME, content="one"),
+            _op(
+                PATCH_TOOL_NAME,
+                operation="append",
+                target_type="heading",
+                target="A",
+                content="x",
+            ),
+            _op(
+                PATCH_TOOL_NAME,
+                operation="append",
+                target_type="heading",
+                target="B",
+                content="y",
+            ),
+            _op(APPEND_TOOL_NAME, content="two"),
+        ]
+    )
+
+    assert [op.tool.name for op in merged] == [
+        APPEND_TOOL_NAME,
+        PATCH_TOOL_NAME,
+        PATCH_TOOL_NAME,
+        APPEND_TOOL_NAME,
+    ]
+
+
+def test_invocation_mode_merges_writes_of_separate_turns_and_flushes_on_read():
+    notes: dict[str, str] = {}
+    calls: list = []
+    append = _RecordingTool(APPEND_TOOL_NAME, notes, calls)
+    buffer = WriteBuffer(mode="invocation")
+    read = _FlushingTool(
+        _RecordingTool("obsidian_get_file_contents", notes, calls), buffer
+    )
+
+    async def scenario():
+        first = await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "one\n"}, _context())
+        )
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "two\n"}, _context())
+        )
+        # Another invocation's pending write is left alone.
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "x"}, _context("inv-2"))
+        )
+        seen = await read.run_async(args={"filepath": "a.md"}, tool_context=_context())
+        return first, seen
+
+    first, seen = asyncio.run(scenario())
+
+    assert first["status"] == "queued"
+    assert [name for name, _ in calls].count(APPEND_TOOL_NAME) == 1
+    assert seen["content"] == "one\n\ntwo\n"
+    assert buffer.stats()["pending_batches"] == 1
+
+
+def test_invocation_mode_drops_the_writes_of_a_failed_invocation():
+    notes: dict[str, str] = {}
+    calls: list = []
+    append = _RecordingTool(APPEND_TOOL_NAME, notes, calls)
+    buffer = WriteBuffer(mode="invocation")
+
+    async def scenario():
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "one"}, _context())
+        )
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "b.md", "content": "two"}, _context())
+        )
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "x"}, _context("inv-2"))
+        )
+        buffer.on_tool_error_callback(
+            tool=append, args={}, tool_context=_context(), error=RuntimeError("boom")
+        )
+        return await buffer.flush_all()
+
+    errors = asyncio.run(scenario())
+
+    assert errors == []
+    # Only the other invocation's write was applied.
+    assert calls == [(APPEND_TOOL_NAME, {"filepath": "a.md", "content": "x"})]
+    assert buffer.stats()["writes_dropped"] == 2
+    assert buffer.stats()["pending_batches"] == 0
+
+
+def test_invocation_mode_drops_batches_older_than_max_age():
+    calls: list = []
+    append = _RecordingTool(APPEND_TOOL_NAME, {}, calls)
+    buffer = WriteBuffer(mode="invocation", max_age=0.0)
+
+    async def scenario():
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "lost"}, _context())
+        )
+        # The first invocation never flushed (e.g. it was cancelled).
+        await buffer.submit(
+            _WriteOp(append, {"filepath": "a.md", "content": "kept"}, _context("inv-2"))
+        )
+        return await buffer.flush_scope("inv-2")
+
+    errors = asyncio.run(scenario())
+
+    assert errors == []
+    assert calls == [(APPEND_TOOL_NAME, {"filepath": "a.md", "content": "kept"})]
+    assert buffer.stats()["pending_batches"] == 0